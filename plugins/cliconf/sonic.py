@@ -28,19 +28,71 @@ short_description: Use sonic cliconf to run command on Dell OS10 platform
 description:
   - This sonic plugin provides low level abstraction apis for
     sending and receiving CLI commands from Dell OS10 network devices.
+options:
+  config_cache:
+    type: bool
+    description:
+      - Keep the configuration returned by C(get_config) on the persistent
+        connection so that later tasks of the play do not fetch it again.
+      - C(edit_config) and any command that is not a C(show) command
+        (e.g. C(write memory)) flush the cached configuration.
+      - "The cache is also flushed by the C(flush_cache) connection method and
+        by C(meta: reset_connection)."
+      - Changes made on the device by other means are not seen until the cache
+        is flushed.
+    default: false
+    vars:
+      - name: ansible_sonic_config_cache
+    version_added: 2.3.0
+  config_batch_size:
+    type: int
+    description:
+      - Number of configuration lines that C(edit_config) writes to the device
+        at once, before reading their output.
+      - With the default of 1, each line is sent after the prompt of the
+        previous line is received.
+      - The output of each block of lines is split at the echo of each line and
+        checked for errors with the C(terminal_stderr_re) of the terminal plugin.
+        The error is reported for the first line that failed, no line is sent
+        again. The lines of the block following the failed line have already
+        been run on the device.
+      - If the echo of a line is not found in the output, e.g. because the
+        terminal wrapped it, the error is reported with the output of the block.
+      - Lines that ask for a confirmation must be given as commands with a
+        prompt and an answer, which are sent on their own. A confirmation
+        prompt in a block is reported as an error.
+      - The end of a block is marked by a C(!) comment line.
+    default: 1
+    vars:
+      - name: ansible_sonic_config_batch_size
+    version_added: 2.3.0
 """
 
 import json
+import re
+from itertools import takewhile
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 from ansible.plugins.cliconf import CliconfBase, enable_mode
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import RunningConfigIndex
+from ansible_collections.dellemc.enterprise_sonic.plugins.terminal.sonic import TerminalModule
+
+NO_MATCH_STDERR_RE = [{'pattern': '(?!)'}]
+CONFIRM_PROMPT_RE = re.compile(r"[\[\(](?:y/n|yes/no|confirm)[\]\)]", re.I)
+CONFIRM_PROMPT_STDOUT_RE = {'pattern': r"[\[\(](?:y/n|yes/no|confirm)[\]\)]\??:? ?$", 'flags': 're.I'}
 
 
 class Cliconf(CliconfBase):
 
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        self._config_cache = {}
+        self._config_indexes = {}
+        self._batch_count = 0
+
     def get_device_info(self):
         device_info = {}
         device_info['network_os'] = 'sonic'
@@ -48,14 +100,24 @@ class Cliconf(CliconfBase):
 
     @enable_mode
     def edit_config(self, command):
+        self.flush_cache()
         response = []
         self.send_command("configure terminal")
-        for cmd in to_list(command):
+        commands = to_list(command)
+        batch_size = self.get_option('config_batch_size') or 1
+        index = 0
+        while index < len(commands):
+            cmd = commands[index]
             if isinstance(cmd, dict):
-                resp = self.get(command=cmd["command"], prompt=cmd["prompt"], answer=cmd["answer"])
-                response.append(resp)
-            else:
+                response.append(self.get(command=cmd["command"], prompt=cmd["prompt"], answer=cmd["answer"]))
+                index += 1
+            elif batch_size <= 1:
                 response.append(self.send_command(to_bytes(cmd)))
+                index += 1
+            else:
+                block = list(takewhile(lambda line: not isinstance(line, dict), commands[index:index + batch_size]))
+                index += len(block)
+                response.append(self._send_config_block(block))
         self.send_command("end")
         return response
 
@@ -74,9 +136,34 @@ class Cliconf(CliconfBase):
 
         cmd += " ".join(to_list(flags))
         cmd = cmd.strip()
-        return self.send_command(cmd)
+        if not self.get_option('config_cache'):
+            return self.send_command(cmd)
+
+        if cmd not in self._config_cache:
+            self._config_cache[cmd] = self.send_command(cmd)
+        return self._config_cache[cmd]
+
+    def get_config_sections(self, keys=None, source="running", flags=None):
+        """Return the sections of the configuration of the top-level lines in
+        keys, the whole configuration if keys is None
+
+        The configuration is indexed by its top-level lines once per connection,
+        and again whenever C(get_config) returns a different configuration, e.g.
+        after C(edit_config) flushed the cached configuration.
+        """
+        config = self.get_config(source=source, flags=flags)
+        if keys is None:
+            return config
+
+        index_key = (source, " ".join(to_list(flags)))
+        if index_key not in self._config_indexes:
+            self._config_indexes[index_key] = RunningConfigIndex()
+        index = self._config_indexes[index_key]
+        index.load(to_text(config, errors="surrogate_then_replace"))
+        return index.get_text(keys)
 
     def get(self, command, prompt=None, answer=None, sendonly=False, newline=True, check_all=False):
+        self._invalidate_cache(command)
         return self.send_command(command=command, prompt=prompt, answer=answer, sendonly=sendonly, newline=newline, check_all=check_all)
 
     def get_capabilities(self):
@@ -96,6 +183,7 @@ class Cliconf(CliconfBase):
             if output:
                 raise ValueError("'output' value %s is not supported for run_commands" % output)
 
+            self._invalidate_cache(cmd.get('command'))
             try:
                 out = self.send_command(**cmd)
             except AnsibleConnectionFailure as e:
@@ -114,3 +202,138 @@ class Cliconf(CliconfBase):
         """
         if self._connection.connected:
             self._update_cli_prompt_context(config_context=')#')
+
+    def flush_cache(self):
+        """Drop the cached configuration
+
+        :returns: the number of configurations dropped
+        """
+        count = len(self._config_cache)
+        self._config_cache = {}
+        return count
+
+    def _send_config_block(self, lines):
+        """Write the lines to the device at once and read their output
+
+        A comment line closes the block. The CLI echoes a line only once the
+        previous lines have run, so the output of the block is complete when
+        the prompt following the echo of the comment is received, that is
+        after a prompt per line. The output is then checked by
+        _check_config_block_output, no line is sent again.
+
+        :returns: the output of the lines
+        """
+        self._batch_count += 1
+        marker = '! end of block %d' % self._batch_count
+        self.send_command(b'\r'.join(to_bytes(line) for line in lines + [marker]), sendonly=True)
+
+        # The errors are searched once the whole block is read, rather than
+        # by the connection on the first prompt following an error, and a
+        # confirmation prompt ends a read instead of waiting for the command
+        # timeout.
+        stderr_option = self._connection.get_option('terminal_stderr_re')
+        stdout_option = self._connection.get_option('terminal_stdout_re')
+        self._connection.set_option('terminal_stderr_re', NO_MATCH_STDERR_RE)
+        self._connection.set_option('terminal_stdout_re', self._get_terminal_stdout_option() + [CONFIRM_PROMPT_STDOUT_RE])
+        try:
+            output = []
+            # Allow as many unsolicited prompts, e.g. after console messages
+            max_reads = 2 * (len(lines) + 1)
+            while not output or marker not in output[-1]:
+                if len(output) == max_reads:
+                    raise AnsibleConnectionFailure("the end of the configuration block was not received after %d prompts:\n%s"
+                                                   % (max_reads, '\n'.join(output)))
+                output.append(to_text(self._connection.receive(strip_prompt=False), errors='surrogate_then_replace'))
+                if CONFIRM_PROMPT_RE.search(output[-1].rsplit('\n', 1)[-1]):
+                    break
+        finally:
+            self._connection.set_option('terminal_stderr_re', stderr_option)
+            self._connection.set_option('terminal_stdout_re', stdout_option)
+
+        # A read ends with a prompt, which the echo of the next line follows
+        output = ' '.join(output)
+        complete = marker in output
+        if complete:
+            output = output[:max(output.rfind('\n', 0, output.rindex(marker)), 0)]
+        self._check_config_block_output(lines, output, complete)
+        return output
+
+    def _check_config_block_output(self, lines, output, complete):
+        """Raise the error of the first line of a block that failed
+
+        The output is split at the echo of each line, see _split_block_output.
+        An output matching an error regex of the terminal raises the error of
+        its line, as network_cli does for a single line, and a confirmation
+        prompt raises an error as the next line, or nothing, answered it.
+        When the output is complete but the echo of a line is not found, the
+        output of the preceding line is not bounded, so the error is raised
+        with the output of the block. When it is not, the read stopped at the
+        confirmation prompt of the last line echoed.
+        """
+        stderr_re = self._get_terminal_stderr_re()
+        segments = self._split_block_output(lines, output)
+        if complete and len(segments) < len(lines):
+            segments = segments[:-1]
+
+        for line, echo, line_output in segments:
+            if CONFIRM_PROMPT_RE.search(line_output):
+                raise AnsibleConnectionFailure("'%s' asked for a confirmation, it must be given with a prompt and an answer:\n%s\n%s"
+                                               % (line, echo, line_output))
+            if any(regex.search(to_bytes(line_output)) for regex in stderr_re):
+                raise AnsibleConnectionFailure('%s\n%s' % (echo, line_output))
+
+        if CONFIRM_PROMPT_RE.search(output):
+            raise AnsibleConnectionFailure("a line of the configuration block asked for a confirmation, it must be given with a prompt and an answer:\n%s"
+                                           % output)
+        if any(regex.search(to_bytes(output)) for regex in stderr_re):
+            raise AnsibleConnectionFailure(output)
+
+    @staticmethod
+    def _split_block_output(lines, output):
+        """Split the output of a block at the echo of its lines
+
+        An echo is an output line ending with the line, after a prompt or at
+        the start of the output, the prompt preceding the first line having
+        been read with the previous command.
+
+        :returns: the (line, echo, output) of the lines whose echo is found,
+                  in order
+        """
+        segments = []
+        for text in output.splitlines():
+            if len(segments) < len(lines):
+                command = lines[len(segments)].strip()
+                echo = text.rstrip()
+                prefix = echo[:len(echo) - len(command)].rstrip()
+                if echo.endswith(command) and (not prefix or prefix.endswith(('#', '>', '$'))):
+                    segments.append((lines[len(segments)], echo, []))
+                    continue
+            if segments:
+                segments[-1][2].append(text)
+        return [(line, echo, '\n'.join(line_output)) for line, echo, line_output in segments]
+
+    def _get_terminal_stderr_re(self):
+        """Return the error regexes of the connection, as network_cli does"""
+        stderr_option = self._connection.get_option('terminal_stderr_re')
+        if not stderr_option:
+            return TerminalModule.terminal_stderr_re
+
+        stderr_re = []
+        for item in stderr_option:
+            flags = item.get('flags', 0)
+            if flags:
+                flags = getattr(re, flags.split('.')[1])
+            stderr_re.append(re.compile(to_bytes(item['pattern']), flags))
+        return stderr_re
+
+    def _get_terminal_stdout_option(self):
+        """Return the prompt regexes of the connection as a terminal_stdout_re option value"""
+        stdout_option = self._connection.get_option('terminal_stdout_re')
+        if stdout_option:
+            return list(stdout_option)
+        return [{'pattern': to_text(regex.pattern)} for regex in TerminalModule.terminal_stdout_re]
+
+    def _invalidate_cache(self, command):
+        """Flush the cache unless the command is a read-only 'show' command"""
+        if self._config_cache and not to_text(command).strip().startswith('show'):
+            self.flush_cache()
@@ -35,60 +35,527 @@ options:
     default: '/restconf'
     vars:
       - name: ansible_httpapi_restconf_root
+  connection_pool:
+    type: bool
+    description:
+      - Send requests over a pool of persistent (keep-alive) HTTP(S) connections
+        instead of opening a new connection for every request.
+      - TLS sessions are resumed when a pooled connection has to be re-established.
+    default: false
+    vars:
+      - name: ansible_httpapi_connection_pool
+    version_added: 2.3.0
+  connection_pool_size:
+    type: int
+    description:
+      - Maximum number of idle connections kept open in the connection pool.
+      - Only used when I(connection_pool=true).
+    default: 4
+    vars:
+      - name: ansible_httpapi_connection_pool_size
+    version_added: 2.3.0
+  connection_pool_idle_timeout:
+    type: int
+    description:
+      - Number of seconds an idle pooled connection is kept before it is closed.
+      - Only used when I(connection_pool=true).
+    default: 30
+    vars:
+      - name: ansible_httpapi_connection_pool_idle_timeout
+    version_added: 2.3.0
+  max_workers:
+    type: int
+    description:
+      - Maximum number of requests sent concurrently by C(edit_config).
+      - Only consecutive GET requests and requests flagged as C(independent)
+        are sent concurrently. Every other request is sent on its own after
+        all preceding requests have completed.
+      - The resource modules that declare the dependencies between their requests
+        (e.g. an ACL before its rules) send each request as soon as the requests
+        it depends on have succeeded. When one fails, only the requests depending
+        on it are not sent; the first failure is reported once the others complete.
+      - Responses are always returned in the order of the requests.
+      - The default of 1 sends all requests one at a time.
+      - Best combined with I(connection_pool=true).
+    default: 1
+    vars:
+      - name: ansible_httpapi_max_workers
+    version_added: 2.3.0
+  coalesce_requests:
+    type: bool
+    description:
+      - Merge consecutive PATCH requests to the same path into a single request
+        before sending them, e.g. the per-VLAN or per-next-hop requests of the
+        resource modules.
+      - The payloads are deep-merged. A request that would change a value set
+        by the preceding requests is not merged, so that it is still sent after them.
+      - The resource modules that support it report the number of requests saved
+        in C(requests_saved).
+    default: false
+    vars:
+      - name: ansible_httpapi_coalesce_requests
+    version_added: 2.3.0
+  use_token_auth:
+    type: bool
+    description:
+      - Authenticate once against the REST server token endpoint and send the
+        returned bearer token (JWT) with every request instead of the basic
+        authentication credentials.
+      - The token is cached on the persistent connection, refreshed before it
+        expires and renewed once when a request is rejected with HTTP 401.
+    default: false
+    vars:
+      - name: ansible_httpapi_use_token_auth
+    version_added: 2.3.0
+  token_refresh_margin:
+    type: int
+    description:
+      - Number of seconds before the token expiry at which a new token is requested.
+      - Only used when I(use_token_auth=true).
+    default: 60
+    vars:
+      - name: ansible_httpapi_token_refresh_margin
+    version_added: 2.3.0
+  response_cache:
+    type: bool
+    description:
+      - Keep the responses of GET requests on the persistent connection so that
+        later tasks of the play reading the same resources do not fetch them again.
+      - Any other request sent through C(edit_config) invalidates the cached
+        responses it may affect, and a request to an C(operations) path
+        (e.g. saving the configuration) invalidates all of them.
+      - Requests flagged with C(bypass_cache) are always sent to the device and
+        refresh the cache. M(dellemc.enterprise_sonic.sonic_api) always bypasses it.
+      - "The cache is flushed by the C(flush_cache) connection method and by
+        C(meta: reset_connection)."
+      - Changes made on the device by other means are not seen until the cached
+        responses expire, see I(response_cache_ttl).
+    default: false
+    vars:
+      - name: ansible_httpapi_response_cache
+    version_added: 2.3.0
+  response_cache_ttl:
+    type: int
+    description:
+      - Number of seconds a cached response is used.
+      - A value of 0 keeps cached responses until they are invalidated.
+      - Only used when I(response_cache=true).
+    default: 300
+    vars:
+      - name: ansible_httpapi_response_cache_ttl
+    version_added: 2.3.0
 """
 
+import base64
+import heapq
 import json
+import socket
+import ssl
+import threading
+import time
+from copy import deepcopy
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from io import BytesIO
 
-from ansible.module_utils._text import to_text
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_bytes, to_native, to_text
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.six.moves.urllib.response import addinfourl
 from ansible.plugins.httpapi import HttpApiBase
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_request_cache_key,
+    invalidate_cached_responses,
+    is_get_request,
+)
 
 CONTENT_TYPE = 'application/yang-data+json'
+TOKEN_PATH = '/authenticate'
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'))
 
 
 class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._pool = None
+        self._token_expiry = None
+        self._token_lock = threading.Lock()
+        self._response_cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     def send_request(self, data, **message_kwargs):
         if data:
             data = json.dumps(data)
 
         path = '/'.join([self.get_option('root_path').rstrip('/'), message_kwargs.get('path', '').lstrip('/')])
+        query = message_kwargs.get('query')
+        if query:
+            path = '%s?%s' % (path, encode_query(query))
 
         headers = {
             'Content-Type': message_kwargs.get('content_type') or CONTENT_TYPE,
             'Accept': message_kwargs.get('accept') or CONTENT_TYPE,
         }
-        response, response_data = self.connection.send(path, data, headers=headers, method=message_kwargs.get('method'))
+        if self.get_option('use_token_auth'):
+            self._refresh_token()
+        if self.get_option('connection_pool'):
+            response, response_data = self._send_pooled(path, data, headers=headers, method=message_kwargs.get('method'))
+        else:
+            response, response_data = self.connection.send(path, data, retries=1, headers=headers, method=message_kwargs.get('method'))
 
         return handle_response(response, response_data, message_kwargs)
 
+    def login(self, username, password):
+        """Get a bearer token from the REST server authentication endpoint"""
+        if not self.get_option('use_token_auth'):
+            return
+
+        data = json.dumps({'username': username, 'password': password})
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        response, response_data = self.connection.send(TOKEN_PATH, data, retries=0, headers=headers, method='POST')
+        code, response_data = handle_response(response, response_data, {'path': TOKEN_PATH, 'method': 'post'})
+        token = response_data.get('access_token') if isinstance(response_data, dict) else None
+        if not token:
+            raise AnsibleConnectionFailure('Token authentication failed: no access token in the response of %s' % TOKEN_PATH)
+
+        token_type = response_data.get('token_type') or 'Bearer'
+        self.connection._auth = {'Authorization': '%s %s' % (token_type, token)}
+        expires_in = response_data.get('expires_in')
+        self._token_expiry = time.time() + int(expires_in) if expires_in else None
+        self.connection.queue_message('vvvv', 'obtained %s token, expires in %s seconds' % (token_type, expires_in))
+
+    def _refresh_token(self):
+        """Renew the cached token if it is about to expire"""
+        if not self.connection.connected:
+            self.connection._connect()
+            return
+        with self._token_lock:
+            expiry = self._token_expiry
+            if self.connection._auth and (expiry is None or time.time() < expiry - self.get_option('token_refresh_margin')):
+                return
+            self.connection.queue_message('vvvv', 'refreshing authentication token')
+            self.connection._auth = None
+            self.login(self.connection.get_option('remote_user'), self.connection.get_option('password'))
+
+    def handle_httperror(self, exc):
+        if exc.code == 401 and self.get_option('use_token_auth') and self.connection._auth:
+            # The token was revoked or expired early, get a new one and resend
+            with self._token_lock:
+                self.connection._auth = None
+                self.login(self.connection.get_option('remote_user'), self.connection.get_option('password'))
+            return True
+        return super(HttpApi, self).handle_httperror(exc)
+
+    def _get_pool(self):
+        if self._pool is None:
+            use_ssl = self.connection.get_option('use_ssl')
+            port = self.connection.get_option('port') or (443 if use_ssl else 80)
+            ssl_context = None
+            if use_ssl:
+                ssl_context = self._get_ssl_context()
+            self._pool = ConnectionPool(self.connection.get_option('host'), port, ssl_context,
+                                        timeout=self.connection.get_option('persistent_command_timeout'),
+                                        maxsize=self.get_option('connection_pool_size'),
+                                        idle_timeout=self.get_option('connection_pool_idle_timeout'))
+        return self._pool
+
+    def _get_ssl_context(self):
+        if self.connection.get_option('validate_certs'):
+            context = ssl.create_default_context(cafile=self.connection.get_option('ca_path'))
+        else:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        client_cert = self.connection.get_option('client_cert')
+        if client_cert:
+            context.load_cert_chain(client_cert, self.connection.get_option('client_key'))
+        ciphers = self.connection.get_option('ciphers')
+        if ciphers:
+            context.set_ciphers(':'.join(to_list(ciphers)))
+        return context
+
+    def _send_pooled(self, path, data, headers, method=None, retries=1):
+        """Send a request over a pooled keep-alive connection
+
+        The returned values mirror those of the httpapi connection 'send'
+        method so that both paths can share the same response handling.
+        """
+        if not self.connection.connected:
+            self.connection._connect()
+
+        req_headers = dict(headers)
+        if self.connection._auth:
+            req_headers.update(self.connection._auth)
+        else:
+            credentials = '%s:%s' % (self.connection.get_option('remote_user'), self.connection.get_option('password'))
+            req_headers['Authorization'] = 'Basic %s' % to_native(base64.b64encode(to_bytes(credentials)))
+        http_agent = self.connection.get_option('http_agent')
+        if http_agent:
+            req_headers['User-Agent'] = http_agent
+        method = (method or ('POST' if data else 'GET')).upper()
+
+        pool = self._get_pool()
+        self.connection._log_messages("send url '%s' with data '%s' over pooled connection" % (path, data))
+        try:
+            status, reason, resp_headers, resp_data = pool.request(method, path, data, req_headers)
+        except (http_client.HTTPException, socket.error) as exc:
+            raise AnsibleConnectionFailure('Could not connect to %s: %s' % (self.connection._url + path, to_text(exc)))
+        self.connection.queue_message('vvvv', 'http connection pool: %s' % self.get_pool_stats())
+        self.connection._log_messages("received response: '%s'" % resp_data)
+
+        url = self.connection._url + path
+        if status >= 400:
+            exc = HTTPError(url, status, reason, resp_headers, BytesIO(resp_data))
+            is_handled = self.handle_httperror(exc)
+            if is_handled is True:
+                if retries:
+                    return self._send_pooled(path, data, headers, method=method, retries=retries - 1)
+                raise exc
+            if is_handled is False:
+                raise exc
+            response = is_handled
+        else:
+            response = addinfourl(BytesIO(resp_data), resp_headers, url, status)
+
+        response_buffer = BytesIO(resp_data)
+        if not isinstance(response, HTTPError):
+            self.connection._auth = self.update_auth(response, response_buffer) or self.connection._auth
+        response_buffer.seek(0)
+
+        return response, response_buffer
+
+    def get_pool_stats(self):
+        """Return the keep-alive connection pool hit and miss counters"""
+        if self._pool is None:
+            return {'hits': 0, 'misses': 0, 'idle': 0}
+        return self._pool.stats()
+
     def get(self, command):
         return self.send_request(path=command, data=None, method='get')
 
     def edit_config(self, requests):
         """Send a list of http requests to remote device and return results
+
+        The 'label' of a request is not sent, it is only returned in the
+        request_data of the error of the request, to identify it.
         """
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        requests = to_list(requests)
+        max_workers = self.get_option('max_workers')
+        if max_workers > 1 and len(requests) > 1:
+            if any(req.get('depends_on') is not None for req in requests):
+                return self._edit_config_plan(requests, max_workers)
+            return self._edit_config_concurrent(requests, max_workers)
+
         responses = list()
-        for req in to_list(requests):
-            try:
-                response = self.send_request(**req)
-            except ConnectionError as exc:
-                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
-            responses.append(response)
+        for req in requests:
+            responses.append(self._send_config_request(req))
+        return responses
+
+    def _edit_config_concurrent(self, requests, max_workers):
+        """Send runs of concurrency-safe requests in parallel
+
+        A request that is not safe to reorder acts as a barrier: it is sent
+        only after the preceding run has completed, and on its own.
+        """
+        if not self.connection.connected:
+            self.connection._connect()
+
+        responses = list()
+        batch = list()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for req in requests:
+                if is_concurrent_safe(req):
+                    batch.append(req)
+                    continue
+                responses.extend(self._send_config_batch(executor, batch))
+                batch = list()
+                responses.append(self._send_config_request(req))
+            responses.extend(self._send_config_batch(executor, batch))
         return responses
 
+    def _edit_config_plan(self, requests, max_workers):
+        """Send each request once the requests it depends on have succeeded
+
+        Among the requests ready to be sent, the first ones in request order
+        are sent first. The requests depending, directly or not, on a failed
+        request are not sent, the independent ones are completed and the
+        first failure in request order is then raised.
+        """
+        if not self.connection.connected:
+            self.connection._connect()
+
+        dependents, pending = get_request_dependencies(requests)
+        ready = [position for position, count in enumerate(pending) if not count]
+        heapq.heapify(ready)
+        responses = [None] * len(requests)
+        errors = {}
+        sent = 0
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while ready or running:
+                while ready and len(running) < max_workers:
+                    position = heapq.heappop(ready)
+                    running[executor.submit(self._send_config_request, requests[position])] = position
+                    sent += 1
+                for future in wait(running, return_when=FIRST_COMPLETED)[0]:
+                    position = running.pop(future)
+                    try:
+                        responses[position] = future.result()
+                    except Exception as exc:
+                        errors[position] = exc
+                        continue
+                    for dependent in dependents[position]:
+                        pending[dependent] -= 1
+                        if not pending[dependent]:
+                            heapq.heappush(ready, dependent)
+
+        if errors:
+            self.connection.queue_message('vvvv', '%d requests failed, %d dependent requests not sent'
+                                          % (len(errors), len(requests) - sent))
+            raise errors[min(errors)]
+        return responses
+
+    def _send_config_batch(self, executor, batch):
+        if len(batch) < 2:
+            return [self._send_config_request(req) for req in batch]
+        futures = [executor.submit(self._send_config_request, req) for req in batch]
+        # result() re-raises the first failure in request order
+        return [future.result() for future in futures]
+
+    def _send_config_request(self, req):
+        req = dict(req)
+        req.pop('independent', None)
+        req.pop('depends_on', None)
+        if req.get('label') is None:
+            req.pop('label', None)
+        bypass_cache = req.pop('bypass_cache', None)
+        if not self.get_option('response_cache'):
+            return self._send_config_request_uncached(req)
+
+        if not is_get_request(req):
+            with self._cache_lock:
+                invalidate_cached_responses(self._response_cache, req.get('path') or '')
+            return self._send_config_request_uncached(req)
+
+        key = get_request_cache_key(req)
+        if not bypass_cache:
+            with self._cache_lock:
+                entry = self._response_cache.get(key)
+                ttl = self.get_option('response_cache_ttl')
+                if entry is not None and (not ttl or time.time() - entry[0] < ttl):
+                    self._cache_hits += 1
+                    return deepcopy(entry[1])
+                self._cache_misses += 1
+
+        response = self._send_config_request_uncached(req)
+        with self._cache_lock:
+            self._response_cache[key] = (time.time(), deepcopy(response))
+        return response
+
+    def _send_config_request_uncached(self, req):
+        try:
+            return self.send_request(**req)
+        except ConnectionError as exc:
+            raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+
+    def flush_cache(self):
+        """Drop every cached response
+
+        :returns: the number of responses dropped
+        """
+        with self._cache_lock:
+            count = len(self._response_cache)
+            self._response_cache = {}
+        self.connection.queue_message('vvvv', 'flushed %d cached responses' % count)
+        return count
+
+    def get_cache_stats(self):
+        """Return the response cache hit and miss counters"""
+        with self._cache_lock:
+            return {'hits': self._cache_hits, 'misses': self._cache_misses, 'entries': len(self._response_cache)}
+
+    def logout(self):
+        with self._token_lock:
+            if self.get_option('use_token_auth'):
+                self.connection._auth = None
+            self._token_expiry = None
+        if self._pool is not None:
+            self.connection.queue_message('vvvv', 'closing http connection pool: %s' % self.get_pool_stats())
+            self._pool.close()
+            self._pool = None
+        if self._response_cache:
+            self.connection.queue_message('vvvv', 'response cache: %s' % self.get_cache_stats())
+            self.flush_cache()
+
     def get_capabilities(self):
         result = {}
         result['rpc'] = []
         result['network_api'] = 'sonic_rest'
+        result['coalesce_requests'] = self.get_option('coalesce_requests')
 
         return json.dumps(result)
 
 
+def encode_query(query):
+    """Encode RESTCONF query parameters (e.g. content, depth, fields)
+
+    List values are joined with ';' as expected by the 'fields' parameter.
+    """
+    params = []
+    for key, value in query.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ';'.join(to_text(item) for item in value)
+        params.append('%s=%s' % (key, quote(to_text(value), safe="/;:,")))
+    return '&'.join(params)
+
+
+def is_concurrent_safe(request):
+    """Whether a request may be sent concurrently with its neighbours"""
+    if request.get('independent'):
+        return True
+    return (request.get('method') or '').lower() == 'get'
+
+
+def get_request_dependencies(requests):
+    """Return the dependency graph of requests, see RequestPlan
+
+    A request without 'depends_on' depends on all the preceding requests.
+
+    :rtype: A tuple
+    :returns: the positions of the requests depending on each request, and
+              the number of requests each request depends on
+    """
+    dependents = [[] for req in requests]
+    pending = []
+    # A request depending on all the preceding requests depends on the last
+    # such request and on the requests following it only.
+    barrier = []
+    for position, req in enumerate(requests):
+        depends_on = req.get('depends_on')
+        if depends_on is None:
+            depends_on = barrier
+            barrier = [position]
+        else:
+            depends_on = set(depends_on)
+            if any(not 0 <= dependency < position for dependency in depends_on):
+                raise ValueError("request %d may only depend on preceding requests" % position)
+            barrier.append(position)
+        for dependency in depends_on:
+            dependents[dependency].append(position)
+        pending.append(len(depends_on))
+    return dependents, pending
+
+
 def handle_response(response, response_data, request_data):
     response_data = response_data.read()
     try:
@@ -111,3 +578,130 @@ def handle_response(response, response_data, request_data):
             raise ConnectionError(error_text, code=response.code)
         raise ConnectionError(to_text(response), code=response.code)
     return response.getcode(), response_data
+
+
+class _SessionReuseHTTPSConnection(http_client.HTTPSConnection):
+    """HTTPS connection that resumes the TLS session saved in its pool"""
+
+    def __init__(self, host, port, pool, **kwargs):
+        http_client.HTTPSConnection.__init__(self, host, port, **kwargs)
+        self._pool = pool
+
+    def connect(self):
+        http_client.HTTPConnection.connect(self)
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=self.host,
+                                              session=self._pool.tls_session)
+        if self.sock.session is not None:
+            self._pool.tls_session = self.sock.session
+
+
+class ConnectionPool(object):
+    """Pool of keep-alive HTTP(S) connections to a single device"""
+
+    def __init__(self, host, port, ssl_context=None, timeout=None, maxsize=4, idle_timeout=30):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.tls_session = None
+        self.hits = 0
+        self.misses = 0
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _new_connection(self):
+        if self.ssl_context is not None:
+            return _SessionReuseHTTPSConnection(self.host, self.port, self, timeout=self.timeout,
+                                                context=self.ssl_context)
+        return http_client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self):
+        """Return an idle connection if one is usable, else a new one
+
+        :returns: a tuple of the connection and whether it was reused
+        """
+        now = time.time()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if conn.sock is not None and now - last_used < self.idle_timeout:
+                    self.hits += 1
+                    return conn, True
+                conn.close()
+            self.misses += 1
+        return self._new_connection(), False
+
+    def release(self, conn):
+        with self._lock:
+            if conn.sock is not None and len(self._idle) < self.maxsize:
+                self._idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def request(self, method, path, body, headers):
+        """Send a request and read the full response
+
+        A reused connection may have been closed by the device while idle,
+        in which case the request is retried once on a new connection if
+        it cannot have reached the device or sending it twice is harmless.
+        """
+        conn, reused = self.acquire()
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            sent = True
+            response, data = self._read(conn)
+        except (http_client.HTTPException, socket.error) as exc:
+            conn.close()
+            if not reused or not self._is_retryable(method, exc, sent):
+                raise
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            conn = self._new_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response, data = self._read(conn)
+            except (http_client.HTTPException, socket.error):
+                conn.close()
+                raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.release(conn)
+        return response.status, response.reason, response.msg, data
+
+    @staticmethod
+    def _read(conn):
+        response = conn.getresponse()
+        return response, response.read()
+
+    @staticmethod
+    def _is_retryable(method, exc, sent):
+        """Tell whether a request that failed on a reused connection can be sent again
+
+        A timeout is never retried, as the device may still be processing
+        the request. Idempotent methods are retried on any other error.
+        Other methods are retried only if the connection was found closed
+        while writing the request, or before any byte of the response.
+        """
+        if isinstance(exc, socket.timeout):
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        if not sent:
+            return isinstance(exc, (BrokenPipeError, ConnectionResetError))
+        return isinstance(exc, http_client.RemoteDisconnected)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'idle': len(self._idle)}
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, dummy in idle:
+            conn.close()
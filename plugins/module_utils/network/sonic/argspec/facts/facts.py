@@ -63,4 +63,6 @@ class FactsArgs(object):  # pylint: disable=R0903
     argument_spec = {
         'gather_subset': dict(default=['!config'], type='list', elements='str'),
         'gather_network_resources': dict(choices=choices, type='list', elements='str'),
+        'max_workers': dict(default=1, type='int'),
+        'strict_facts_validation': dict(default=False, type='bool'),
     }
@@ -73,5 +73,16 @@ class InterfacesArgs(object):  # pylint: disable=R0903
             "choices": ["merged", "replaced", "overridden", "deleted"],
             "default": "merged",
             "type": "str"
+        },
+        "verify_after": {
+            "choices": ["always", "never", "sampled"],
+            "default": "always",
+            "type": "str"
+        },
+        "verify_after_rate": {"default": 0.1, "type": "float"},
+        'facts_scope': {
+            'choices': ['all', 'config'],
+            'default': 'all',
+            'type': 'str'
         }
     }
@@ -219,5 +219,11 @@ class L3_aclsArgs(object):  # pylint: disable=R0903
             'choices': ['merged', 'replaced', 'overridden', 'deleted'],
             'default': 'merged',
             'type': 'str'
-        }
+        },
+        'facts_scope': {
+            'choices': ['all', 'config'],
+            'default': 'all',
+            'type': 'str'
+        },
+        'rules_per_request': {'type': 'int'}
     }  # pylint: disable=C0301
@@ -75,5 +75,6 @@ class Static_routesArgs(object):  # pylint: disable=R0903
             'choices': ['merged', 'deleted', 'overridden', 'replaced'],
             'default': 'merged',
             'type': 'str'
-        }
+        },
+        'prefixes_per_request': {'type': 'int'}
     }  # pylint: disable=C0301
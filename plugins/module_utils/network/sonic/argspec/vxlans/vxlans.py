@@ -68,5 +68,6 @@ class VxlansArgs(object):  # pylint: disable=R0903
             'choices': ['merged', 'deleted', 'replaced', 'overridden'],
             'default': 'merged',
             'type': 'str'
-        }
+        },
+        'maps_per_request': {'type': 'int'}
     }  # pylint: disable=C0301
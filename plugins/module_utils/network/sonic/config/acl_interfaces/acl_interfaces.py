@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     validate_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import (  # noqa: F401
+    Acl_interfacesFacts,
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     update_states,
@@ -27,6 +27,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import (
     Facts,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import (
+    InterfacesFacts,
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -37,7 +40,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     update_states,
-    normalize_interface_name
+    normalize_interface_name,
+    get_new_config,
+    get_verified_after,
+    check_option_range,
 )
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
@@ -79,13 +85,17 @@ class Interfaces(ConfigBase):
     def __init__(self, module):
         super(Interfaces, self).__init__(module)
 
-    def get_interfaces_facts(self):
+    def get_interfaces_facts(self, names=None):
         """ Get the 'facts' (the current configuration)
 
+        :param names: if given, get only the interfaces with these names
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
+        data = None
+        if names is not None:
+            data = InterfacesFacts(self._module).get_interfaces(names)
+        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources, data)
         interfaces_facts = facts['ansible_network_resources'].get('interfaces')
         if not interfaces_facts:
             return []
@@ -101,7 +111,9 @@ class Interfaces(ConfigBase):
         result = {'changed': False}
         warnings = list()
 
-        existing_interfaces_facts = self.get_interfaces_facts()
+        check_option_range(self._module, 'verify_after_rate', 0, 1)
+        names = self.get_facts_scope()
+        existing_interfaces_facts = self.get_interfaces_facts(names)
         commands, requests = self.set_config(existing_interfaces_facts)
         if commands and len(requests) > 0:
             if not self._module.check_mode:
@@ -112,15 +124,56 @@ class Interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_interfaces_facts = self.get_interfaces_facts()
-
         result['before'] = existing_interfaces_facts
         if result['changed']:
-            result['after'] = changed_interfaces_facts
+            result['after'] = get_verified_after(self._module, self.get_new_interfaces_config(commands, existing_interfaces_facts),
+                                                 lambda: self.get_interfaces_facts(names), warnings=warnings)
 
         result['warnings'] = warnings
         return result
 
+    def get_facts_scope(self):
+        """ Select the interfaces to read from the device
+
+        :rtype: A list
+        :returns: the names of the interfaces in the config when
+                  facts_scope is 'config', None to read all the interfaces
+        """
+        want = self._module.params['config']
+        state = self._module.params['state']
+        if self._module.params.get('facts_scope') != 'config' or not want or state == 'overridden':
+            return None
+        normalize_interface_name(want, self._module)
+        return [conf['name'] for conf in want]
+
+    def get_new_interfaces_config(self, commands, have):
+        """ Derive the configuration resulting from the commands
+
+        Only merged commands are derived. Any other state resets attributes
+        to defaults (e.g. the port speed) that only the device knows.
+
+        :rtype: A list
+        :returns: the interfaces configuration after the commands are applied,
+                  None if it cannot be derived
+        """
+        if self._module.params['state'] != 'merged':
+            return None
+
+        new_config = get_new_config(commands, have)
+        for conf in new_config:
+            # Only the name of a loopback interface is reported in the facts
+            if conf['name'].startswith('Loopback'):
+                for key in list(conf):
+                    if key != 'name':
+                        conf.pop(key)
+            else:
+                # The advertised speeds are sent as a single value that
+                # replaces the existing one
+                command = next((cmd for cmd in commands if cmd['name'] == conf['name']), {})
+                if command.get('advertised_speed') is not None:
+                    conf['advertised_speed'] = list(command['advertised_speed'])
+        return new_config
+
     def set_config(self, existing_interfaces_facts):
         """ Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
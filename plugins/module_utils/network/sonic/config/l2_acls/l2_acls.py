@@ -14,6 +14,7 @@ created
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import re
 from ast import literal_eval
 
 from ansible.module_utils._text import to_text
@@ -28,8 +29,12 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     validate_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts  # noqa: F401
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    update_states
+    find_rejected_entry,
+    is_entry_error,
+    update_states,
+    check_option_range
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -122,6 +127,7 @@ class L2_acls(ConfigBase):
         """
         result = {'changed': False}
         warnings = []
+        check_option_range(self._module, 'rules_per_request', 1)
 
         existing_l2_acls_facts = self.get_l2_acls_facts()
         commands, requests = self.set_config(existing_l2_acls_facts)
@@ -130,7 +136,7 @@ class L2_acls(ConfigBase):
                 try:
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
-                    self._handle_failure_response(exc)
+                    self._handle_failure_response(exc, requests)
 
             result['changed'] = True
 
@@ -179,8 +185,12 @@ class L2_acls(ConfigBase):
 
         return commands, requests
 
-    def _handle_failure_response(self, connection_error):
+    def _handle_failure_response(self, connection_error, requests=None):
         log = None
+        response = None
+        sequence_num = None
+        if requests:
+            connection_error, sequence_num = self.get_failed_rule(connection_error, requests)
         try:
             response = literal_eval(connection_error.args[0])
             error_app_tag = response['ietf-restconf:errors']['error'][0].get('error-app-tag')
@@ -192,12 +202,56 @@ class L2_acls(ConfigBase):
             elif error_app_tag == 'update-not-allowed':
                 log = 'Creating ACLs with same name and different type not allowed'
 
+        if sequence_num is not None:
+            rule_log = 'Failed to configure the rule with sequence number {0}'.format(sequence_num)
+            log = '{0}: {1}'.format(rule_log, log) if log else rule_log
+            if not isinstance(response, dict):
+                self._module.fail_json(msg='{0}: {1}'.format(rule_log, connection_error), code=connection_error.code)
+
         if log:
             response.update({u'log': log})
             self._module.fail_json(msg=to_text(response), code=connection_error.code)
         else:
             self._module.fail_json(msg=str(connection_error), code=connection_error.code)
 
+    def get_failed_rule(self, connection_error, requests):
+        """Get the sequence number of the rule whose request failed
+
+        When a bulk request fails on a rule the device rejects, the rules of
+        that request are sent again, in halves, to find that rule.
+
+        :rtype: A tuple
+        :returns: the error to report and the sequence number of the
+                  failed rule, None if it is unknown
+        """
+        try:
+            failed_request = literal_eval(connection_error.args[0])['request_data']
+            path = failed_request['path']
+            method = failed_request['method'].lower()
+        except Exception:
+            return connection_error, None
+
+        if method == DELETE:
+            match = re.search(r'/acl-entries/acl-entry=(\d+)$', path)
+            return connection_error, int(match.group(1)) if match else None
+        if method != PATCH or not failed_request.get('label') or not is_entry_error(connection_error):
+            return connection_error, None
+
+        entries = None
+        for request in requests:
+            if request['path'] == path and request.get('label') == failed_request['label']:
+                entries = request['data']['openconfig-acl:acl-entries']['acl-entry']
+                break
+        if not entries:
+            return connection_error, None
+        if len(entries) == 1:
+            return connection_error, entries[0]['sequence-id']
+
+        entry, exc = find_rejected_entry(self._module, entries, lambda rules: self.get_acl_entries_request(path, rules))
+        if entry is None:
+            return connection_error, None
+        return exc, entry['sequence-id']
+
     def _state_merged_overridden_replaced(self, want, have, state):
         """ The command generator when state is merged/overridden/replaced
 
@@ -244,12 +298,14 @@ class L2_acls(ConfigBase):
 
             have_seq_nums = set(have_acl['rules'].keys())
             want_seq_nums = set(want_acl['rules'].keys())
+            del_seq_nums = []
+            add_rules = []
 
             if state in ('replaced', 'overridden'):
                 # Delete non-modified rules
                 for seq_num in have_seq_nums.difference(want_seq_nums):
                     rule_del_commands.append({'sequence_num': seq_num})
-                    del_requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                    del_seq_nums.append(seq_num)
 
             for seq_num in want_seq_nums.intersection(have_seq_nums):
                 # Replace existing rules
@@ -261,15 +317,18 @@ class L2_acls(ConfigBase):
                         )
 
                     rule_del_commands.append({'sequence_num': seq_num})
-                    del_requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                    del_seq_nums.append(seq_num)
 
                     rule_add_commands.append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                    add_rules.append((seq_num, want_acl['rules'][seq_num]))
 
             # Add new rules
             for seq_num in want_seq_nums.difference(have_seq_nums):
                 rule_add_commands.append(want_acl['rules'][seq_num])
-                add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                add_rules.append((seq_num, want_acl['rules'][seq_num]))
+
+            del_requests.extend(self.get_delete_l2_acl_rules_requests(acl_name, del_seq_nums, have_seq_nums))
+            add_requests.extend(self.get_create_l2_acl_rules_requests(acl_name, add_rules))
 
             if rule_del_commands:
                 acl_del_command['rules'] = rule_del_commands
@@ -295,9 +354,12 @@ class L2_acls(ConfigBase):
             want_seq_nums = set(want_acl['rules'].keys())
             if want_seq_nums:
                 acl_add_command['rules'] = []
+                add_rules = []
                 for seq_num in want_seq_nums:
                     acl_add_command['rules'].append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                    add_rules.append((seq_num, want_acl['rules'][seq_num]))
+
+                add_requests.extend(self.get_create_l2_acl_rules_requests(acl_name, add_rules))
 
             add_commands.append(acl_add_command)
 
@@ -353,9 +415,12 @@ class L2_acls(ConfigBase):
 
                 # Delete existing rules
                 # When state is deleted, options other than sequence_num are not considered
+                del_seq_nums = []
                 for seq_num in want_seq_nums.intersection(have_seq_nums):
                     rule_del_commands.append({'sequence_num': seq_num})
-                    requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                    del_seq_nums.append(seq_num)
+
+                requests.extend(self.get_delete_l2_acl_rules_requests(acl_name, del_seq_nums, have_seq_nums))
 
                 if rule_del_commands:
                     acl_del_command['rules'] = rule_del_commands
@@ -388,28 +453,62 @@ class L2_acls(ConfigBase):
         payload = {'description': remark}
         return {'path': url, 'method': PATCH, 'data': payload}
 
+    def get_create_l2_acl_rules_requests(self, acl_name, rules):
+        """Get requests to create the rules, given as (sequence number,
+        configuration) pairs, in the specified L2 ACL
+
+        With rules_per_request, the rules are sent by PATCH requests of up
+        to rules_per_request ACL entries, instead of one request per rule.
+        Each of them is labelled with the range of its sequence numbers, to
+        find its rules when it fails.
+        """
+        rules_per_request = self._module.params.get('rules_per_request')
+        if not rules_per_request:
+            return [self.get_create_l2_acl_rule_request(acl_name, seq_num, rule) for seq_num, rule in rules]
+
+        url = self.l2_acl_rule_path.format(acl_name=acl_name)
+        entries = [self.get_l2_acl_rule_payload(seq_num, rule) for seq_num, rule in rules]
+        requests = []
+        for start in range(0, len(entries), rules_per_request):
+            chunk = entries[start:start + rules_per_request]
+            request = self.get_acl_entries_request(url, chunk)
+            request['label'] = 'rules {0}-{1}'.format(chunk[0]['sequence-id'], chunk[-1]['sequence-id'])
+            requests.append(request)
+        return requests
+
+    @staticmethod
+    def get_acl_entries_request(url, entries):
+        """Get request to create or update the given ACL entries"""
+        payload = {'openconfig-acl:acl-entries': {'acl-entry': entries}}
+        return {'path': url, 'method': PATCH, 'data': payload}
+
     def get_create_l2_acl_rule_request(self, acl_name, seq_num, rule):
         """Get request to create a rule with given sequence number
         and configuration in the specified L2 ACL
         """
         url = self.l2_acl_rule_path.format(acl_name=acl_name)
+        payload = {'openconfig-acl:acl-entry': [self.get_l2_acl_rule_payload(seq_num, rule)]}
+        return {'path': url, 'method': POST, 'data': payload}
+
+    def get_l2_acl_rule_payload(self, seq_num, rule):
+        """Get the ACL entry of a rule with given sequence number
+        and configuration in an L2 ACL
+        """
         payload = {
-            'openconfig-acl:acl-entry': [{
-                'sequence-id': seq_num,
+            'sequence-id': seq_num,
+            'config': {
+                'sequence-id': seq_num
+            },
+            'l2': {
+                'config': {}
+            },
+            'actions': {
                 'config': {
-                    'sequence-id': seq_num
-                },
-                'l2': {
-                    'config': {}
-                },
-                'actions': {
-                    'config': {
-                        'forwarding-action': action_value_to_payload_map[rule['action']]
-                    }
+                    'forwarding-action': action_value_to_payload_map[rule['action']]
                 }
-            }]
+            }
         }
-        rule_l2_config = payload['openconfig-acl:acl-entry'][0]['l2']['config']
+        rule_l2_config = payload['l2']['config']
 
         if rule['source'].get('host'):
             rule_l2_config['source-mac'] = rule['source']['host']
@@ -446,9 +545,9 @@ class L2_acls(ConfigBase):
                 rule_l2_config['pcp-mask'] = rule['pcp']['mask']
 
         if rule.get('remark'):
-            payload['openconfig-acl:acl-entry'][0]['config']['description'] = rule['remark']
+            payload['config']['description'] = rule['remark']
 
-        return {'path': url, 'method': POST, 'data': payload}
+        return payload
 
     def get_delete_l2_acl_request(self, acl_name):
         """Get request to delete L2 ACL with specified name"""
@@ -468,6 +567,28 @@ class L2_acls(ConfigBase):
         url += '/acl-entry={0}'.format(seq_num)
         return {'path': url, 'method': DELETE}
 
+    def get_delete_l2_acl_rules_requests(self, acl_name, seq_nums, have_seq_nums):
+        """Get requests to delete the rules with given sequence numbers,
+        out of the existing ones, in the specified L2 ACL
+
+        With rules_per_request, all the rules are deleted by a single
+        request when none of the existing ones is kept. Otherwise, RESTCONF
+        deleting one list entry per request, the requests are sent
+        concurrently.
+        """
+        if not self._module.params.get('rules_per_request'):
+            return [self.get_delete_l2_acl_rule_request(acl_name, seq_num) for seq_num in seq_nums]
+
+        if seq_nums and len(seq_nums) == len(have_seq_nums):
+            return [{'path': self.l2_acl_rule_path.format(acl_name=acl_name), 'method': DELETE}]
+
+        requests = []
+        for seq_num in seq_nums:
+            request = self.get_delete_l2_acl_rule_request(acl_name, seq_num)
+            request['independent'] = True
+            requests.append(request)
+        return requests
+
     def validate_and_normalize_config(self, config_list):
         """Validate and normalize the given config"""
         # Remove empties and validate the config with argument spec
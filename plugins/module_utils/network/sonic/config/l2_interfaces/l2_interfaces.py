@@ -20,9 +20,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
-    get_ranges_in_list,
     update_states,
-    normalize_interface_name
+    normalize_interface_name,
+    VlanSet
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     remove_empties,
@@ -31,6 +31,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import (
     Facts
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts  # noqa: F401
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -254,13 +255,14 @@ class L2_interfaces(ConfigBase):
         else:
             diff = want
 
+        have_dict = self.get_config_dict(have)
         for cmd in diff:
             name = cmd['name']
             if name == 'eth0':
                 continue
 
             if cmd.get('trunk') and cmd['trunk'].get('allowed_vlans'):
-                match = next((cnf for cnf in have if cnf['name'] == name), None)
+                match = have_dict.get(name)
                 if match:
                     cmd['trunk']['allowed_vlans'] = self.get_trunk_allowed_vlans_diff(cmd, match)
                     if not cmd['trunk']['allowed_vlans']:
@@ -287,9 +289,10 @@ class L2_interfaces(ConfigBase):
             requests = self.get_delete_all_switchport_requests(commands)
             return commands, requests
 
+        have_dict = self.get_config_dict(have)
         for conf in want:
             name = conf['name']
-            matched = next((cnf for cnf in have if cnf['name'] == name), None)
+            matched = have_dict.get(name)
             if matched:
                 # If both access and trunk are not mentioned, delete all config
                 # in that interface
@@ -359,6 +362,7 @@ class L2_interfaces(ConfigBase):
         else:
             del_diff = have
 
+        want_dict = self.get_config_dict(want)
         for conf in del_diff:
             name = conf['name']
 
@@ -382,7 +386,7 @@ class L2_interfaces(ConfigBase):
                     requests.append(self.get_access_delete_switchport_request(name))
 
                 if conf.get('trunk') and conf['trunk'].get('allowed_vlans'):
-                    matched = next((cnf for cnf in want if cnf['name'] == name), None)
+                    matched = want_dict.get(name)
                     if matched:
                         trunk_vlans_to_delete = self.get_trunk_allowed_vlans_diff(conf, matched)
                         if trunk_vlans_to_delete:
@@ -527,9 +531,7 @@ class L2_interfaces(ConfigBase):
         if not match_trunk_vlans:
             return []
 
-        trunk_vlans = self.get_vlan_id_list(trunk_vlans)
-        match_trunk_vlans = self.get_vlan_id_list(match_trunk_vlans)
-        return self.get_allowed_vlan_range_list(list(set(trunk_vlans).intersection(set(match_trunk_vlans))))
+        return self.get_allowed_vlan_range_list(self.get_vlan_set(trunk_vlans) & self.get_vlan_set(match_trunk_vlans))
 
     def get_trunk_allowed_vlans_diff(self, config, match):
         """Returns the allowed vlan ranges present only in 'config'
@@ -549,37 +551,28 @@ class L2_interfaces(ConfigBase):
         if not match_trunk_vlans:
             return trunk_vlans
 
-        trunk_vlans = self.get_vlan_id_list(trunk_vlans)
-        match_trunk_vlans = self.get_vlan_id_list(match_trunk_vlans)
-        return self.get_allowed_vlan_range_list(list(set(trunk_vlans) - set(match_trunk_vlans)))
+        return self.get_allowed_vlan_range_list(self.get_vlan_set(trunk_vlans) - self.get_vlan_set(match_trunk_vlans))
 
     @staticmethod
-    def get_vlan_id_list(allowed_vlan_range_list):
-        """Returns a list of all VLAN IDs specified in allowed_vlans list"""
-        vlan_id_list = []
-        if allowed_vlan_range_list:
-            for vlan_range in allowed_vlan_range_list:
-                vlan_val = vlan_range['vlan']
-                if '-' in vlan_val:
-                    start, end = vlan_val.split('-')
-                    vlan_id_list.extend(range(int(start), int(end) + 1))
-                else:
-                    # Single VLAN ID
-                    vlan_id_list.append(int(vlan_val))
-
-        return vlan_id_list
+    def get_vlan_set(allowed_vlan_range_list):
+        """Returns the VlanSet of all VLAN IDs specified in allowed_vlans list"""
+        return VlanSet.from_ranges(vlan_range['vlan'] for vlan_range in allowed_vlan_range_list)
 
     @staticmethod
-    def get_allowed_vlan_range_list(vlan_id_list):
-        """Returns the allowed_vlans list for given list of VLAN IDs"""
-        allowed_vlan_range_list = []
+    def get_allowed_vlan_range_list(vlan_set):
+        """Returns the allowed_vlans list for given VlanSet"""
+        return [{'vlan': vlan_range} for vlan_range in vlan_set.to_ranges()]
 
-        if vlan_id_list:
-            vlan_id_list.sort()
-            for vlan_range in get_ranges_in_list(vlan_id_list):
-                allowed_vlan_range_list.append({'vlan': '-'.join(map(str, (vlan_range[0], vlan_range[-1])[:len(vlan_range)]))})
+    @staticmethod
+    def get_config_dict(configs):
+        """Returns a dict of the interface configs in the given configs
+        list, by name, the first config of an interface being kept
+        """
+        config_dict = {}
+        for conf in configs:
+            config_dict.setdefault(conf['name'], conf)
 
-        return allowed_vlan_range_list
+        return config_dict
 
     @staticmethod
     def get_interface_names(configs):
@@ -14,6 +14,7 @@ created
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import re
 from ast import literal_eval
 
 from ansible.module_utils._text import to_text
@@ -28,12 +29,17 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     validate_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    update_states
+    find_rejected_entry,
+    is_entry_error,
+    update_states,
+    check_option_range
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    RequestPlan
 )
 
 DELETE = 'delete'
@@ -129,13 +135,18 @@ class L3_acls(ConfigBase):
     def __init__(self, module):
         super(L3_acls, self).__init__(module)
 
-    def get_l3_acls_facts(self):
+    def get_l3_acls_facts(self, acl_keys=None):
         """ Get the 'facts' (the current configuration)
 
+        :param acl_keys: if given, get only the ACLs with these
+                         (name, payload type) keys
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
+        data = None
+        if acl_keys is not None:
+            data = L3_aclsFacts(self._module).get_l3_acls(acl_keys)
+        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources, data)
         l3_acls_facts = facts['ansible_network_resources'].get('l3_acls')
         if not l3_acls_facts:
             return []
@@ -149,19 +160,21 @@ class L3_acls(ConfigBase):
         """
         result = {'changed': False}
         warnings = []
+        check_option_range(self._module, 'rules_per_request', 1)
 
-        existing_l3_acls_facts = self.get_l3_acls_facts()
+        acl_keys = self.get_facts_scope()
+        existing_l3_acls_facts = self.get_l3_acls_facts(acl_keys)
         commands, requests = self.set_config(existing_l3_acls_facts)
         if commands:
             if not self._module.check_mode:
                 try:
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
-                    self._handle_failure_response(exc)
+                    self._handle_failure_response(exc, requests)
 
             result['changed'] = True
 
-        changed_l3_acls_facts = self.get_l3_acls_facts()
+        changed_l3_acls_facts = self.get_l3_acls_facts(acl_keys)
 
         result['before'] = existing_l3_acls_facts
         if result['changed']:
@@ -171,6 +184,27 @@ class L3_acls(ConfigBase):
         result['warnings'] = warnings
         return result
 
+    def get_facts_scope(self):
+        """ Select the ACLs to read from the device
+
+        :rtype: A list
+        :returns: the (name, payload type) keys of the ACLs in the config
+                  when facts_scope is 'config', None to read all the ACLs
+        """
+        want = self._module.params['config']
+        state = self._module.params['state']
+        if self._module.params.get('facts_scope') != 'config' or not want or state == 'overridden':
+            return None
+
+        acl_keys = []
+        for config in want:
+            # Only the type is specified, i.e. all the ACLs of that type
+            if not config.get('acls'):
+                return None
+            acl_type = acl_type_to_payload_map[config['address_family']]
+            acl_keys.extend((acl['name'], acl_type) for acl in config['acls'])
+        return acl_keys
+
     def set_config(self, existing_l3_acls_facts):
         """ Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
@@ -206,8 +240,12 @@ class L3_acls(ConfigBase):
 
         return commands, requests
 
-    def _handle_failure_response(self, connection_error):
+    def _handle_failure_response(self, connection_error, requests=None):
         log = None
+        response = None
+        sequence_num = None
+        if requests:
+            connection_error, sequence_num = self.get_failed_rule(connection_error, requests)
         try:
             response = literal_eval(connection_error.args[0])
             error_app_tag = response['ietf-restconf:errors']['error'][0].get('error-app-tag')
@@ -219,12 +257,56 @@ class L3_acls(ConfigBase):
             elif error_app_tag == 'update-not-allowed':
                 log = 'Creating ACLs with same name and different type not allowed'
 
+        if sequence_num is not None:
+            rule_log = 'Failed to configure the rule with sequence number {0}'.format(sequence_num)
+            log = '{0}: {1}'.format(rule_log, log) if log else rule_log
+            if not isinstance(response, dict):
+                self._module.fail_json(msg='{0}: {1}'.format(rule_log, connection_error), code=connection_error.code)
+
         if log:
             response.update({u'log': log})
             self._module.fail_json(msg=to_text(response), code=connection_error.code)
         else:
             self._module.fail_json(msg=str(connection_error), code=connection_error.code)
 
+    def get_failed_rule(self, connection_error, requests):
+        """Get the sequence number of the rule whose request failed
+
+        When a bulk request fails on a rule the device rejects, the rules of
+        that request are sent again, in halves, to find that rule.
+
+        :rtype: A tuple
+        :returns: the error to report and the sequence number of the
+                  failed rule, None if it is unknown
+        """
+        try:
+            failed_request = literal_eval(connection_error.args[0])['request_data']
+            path = failed_request['path']
+            method = failed_request['method'].lower()
+        except Exception:
+            return connection_error, None
+
+        if method == DELETE:
+            match = re.search(r'/acl-entries/acl-entry=(\d+)$', path)
+            return connection_error, int(match.group(1)) if match else None
+        if method != PATCH or not failed_request.get('label') or not is_entry_error(connection_error):
+            return connection_error, None
+
+        entries = None
+        for request in requests:
+            if request['path'] == path and request.get('label') == failed_request['label']:
+                entries = request['data']['openconfig-acl:acl-entries']['acl-entry']
+                break
+        if not entries:
+            return connection_error, None
+        if len(entries) == 1:
+            return connection_error, entries[0]['sequence-id']
+
+        entry, exc = find_rejected_entry(self._module, entries, lambda rules: self.get_acl_entries_request(path, rules))
+        if entry is None:
+            return connection_error, None
+        return exc, entry['sequence-id']
+
     def _state_merged_overridden_replaced(self, want, have, state):
         """ The command generator when state is merged/overridden/replaced
 
@@ -254,7 +336,7 @@ class L3_acls(ConfigBase):
                 # Delete non-modified ACLs
                 for acl_name in have_acl_names.difference(want_acl_names):
                     acl_type_del_commands.append({'name': acl_name})
-                    del_requests.append(self.get_delete_l3_acl_request(acl_type, acl_name))
+                    del_requests.append(((acl_type, acl_name), self.get_delete_l3_acl_request(acl_type, acl_name)))
 
             # Modify existing ACLs
             for acl_name in want_acl_names.intersection(have_acl_names):
@@ -268,20 +350,22 @@ class L3_acls(ConfigBase):
                 if not want_acl['remark']:
                     if have_acl['remark'] and state in ('replaced', 'overridden'):
                         acl_del_command['remark'] = have_acl['remark']
-                        del_requests.append(self.get_delete_l3_acl_remark_request(acl_type, acl_name))
+                        del_requests.append(((acl_type, acl_name), self.get_delete_l3_acl_remark_request(acl_type, acl_name)))
                 else:
                     if want_acl['remark'] != have_acl['remark']:
                         acl_add_command['remark'] = want_acl['remark']
-                        add_requests.append(self.get_create_l3_acl_remark_request(acl_type, acl_name, want_acl['remark']))
+                        add_requests.append(((acl_type, acl_name), self.get_create_l3_acl_remark_request(acl_type, acl_name, want_acl['remark'])))
 
                 have_seq_nums = set(have_acl['rules'].keys())
                 want_seq_nums = set(want_acl['rules'].keys())
+                del_seq_nums = []
+                add_rules = []
 
                 if state in ('replaced', 'overridden'):
                     # Delete non-modified rules
                     for seq_num in have_seq_nums.difference(want_seq_nums):
                         rule_del_commands.append({'sequence_num': seq_num})
-                        del_requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                        del_seq_nums.append(seq_num)
 
                 for seq_num in want_seq_nums.intersection(have_seq_nums):
                     # Replace existing rules
@@ -293,15 +377,20 @@ class L3_acls(ConfigBase):
                             )
 
                         rule_del_commands.append({'sequence_num': seq_num})
-                        del_requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                        del_seq_nums.append(seq_num)
 
                         rule_add_commands.append(want_acl['rules'][seq_num])
-                        add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                        add_rules.append((seq_num, want_acl['rules'][seq_num]))
 
                 # Add new rules
                 for seq_num in want_seq_nums.difference(have_seq_nums):
                     rule_add_commands.append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                    add_rules.append((seq_num, want_acl['rules'][seq_num]))
+
+                for request in self.get_delete_l3_acl_rules_requests(acl_type, acl_name, del_seq_nums, have_seq_nums):
+                    del_requests.append(((acl_type, acl_name), request))
+                for request in self.get_create_l3_acl_rules_requests(acl_type, acl_name, add_rules):
+                    add_requests.append(((acl_type, acl_name), request))
 
                 if rule_del_commands:
                     acl_del_command['rules'] = rule_del_commands
@@ -316,20 +405,24 @@ class L3_acls(ConfigBase):
             # Add new ACLs
             for acl_name in want_acl_names.difference(have_acl_names):
                 acl_add_command = {'name': acl_name}
-                add_requests.append(self.get_create_l3_acl_request(acl_type, acl_name))
+                add_requests.append(((acl_type, acl_name), self.get_create_l3_acl_request(acl_type, acl_name)))
 
                 want_acl = want_dict[acl_type][acl_name]
                 if want_acl['remark']:
                     acl_add_command['remark'] = want_acl['remark']
-                    add_requests.append(self.get_create_l3_acl_remark_request(acl_type, acl_name, want_acl['remark']))
+                    add_requests.append(((acl_type, acl_name), self.get_create_l3_acl_remark_request(acl_type, acl_name, want_acl['remark'])))
 
                 # Add new rules
                 want_seq_nums = set(want_acl['rules'].keys())
                 if want_seq_nums:
                     acl_add_command['rules'] = []
+                    add_rules = []
                     for seq_num in want_seq_nums:
                         acl_add_command['rules'].append(want_acl['rules'][seq_num])
-                        add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                        add_rules.append((seq_num, want_acl['rules'][seq_num]))
+
+                    for request in self.get_create_l3_acl_rules_requests(acl_type, acl_name, add_rules):
+                        add_requests.append(((acl_type, acl_name), request))
 
                 acl_type_add_commands.append(acl_add_command)
 
@@ -341,11 +434,12 @@ class L3_acls(ConfigBase):
 
         if del_commands:
             commands = update_states(del_commands, 'deleted')
-            requests = del_requests
 
         if add_commands:
             commands.extend(update_states(add_commands, state))
-            requests.extend(add_requests)
+
+        if commands:
+            requests = self.get_request_plan(del_requests, add_requests).requests
 
         return commands, requests
 
@@ -409,9 +503,12 @@ class L3_acls(ConfigBase):
 
                     # Delete existing rules
                     # When state is deleted, options other than sequence_num are not considered
+                    del_seq_nums = []
                     for seq_num in want_seq_nums.intersection(have_seq_nums):
                         rule_del_commands.append({'sequence_num': seq_num})
-                        requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                        del_seq_nums.append(seq_num)
+
+                    requests.extend(self.get_delete_l3_acl_rules_requests(acl_type, acl_name, del_seq_nums, have_seq_nums))
 
                     if rule_del_commands:
                         acl_del_command['rules'] = rule_del_commands
@@ -425,6 +522,23 @@ class L3_acls(ConfigBase):
         commands = update_states(commands, "deleted")
         return commands, requests
 
+    def get_request_plan(self, del_requests, add_requests):
+        """Get the plan of the given (ACL key, request) pairs, sending the
+        delete requests first and making the requests on an ACL follow only
+        the delete requests on that ACL, or its creation
+        """
+        plan = RequestPlan()
+        acl_positions = {}
+        for acl_key, request in del_requests:
+            acl_positions.setdefault(acl_key, []).append(plan.add(request, []))
+
+        for acl_key, request in add_requests:
+            position = plan.add(request, acl_positions.get(acl_key, []))
+            if request['path'] == self.acl_path:
+                acl_positions[acl_key] = [position]
+
+        return plan
+
     def get_create_l3_acl_request(self, acl_type, acl_name):
         """Get request to create L3 ACL with specified type and name"""
         url = self.acl_path
@@ -447,32 +561,66 @@ class L3_acls(ConfigBase):
         payload = {'description': remark}
         return {'path': url, 'method': PATCH, 'data': payload}
 
+    def get_create_l3_acl_rules_requests(self, acl_type, acl_name, rules):
+        """Get requests to create the rules, given as (sequence number,
+        configuration) pairs, in the specified L3 ACL
+
+        With rules_per_request, the rules are sent by PATCH requests of up
+        to rules_per_request ACL entries, instead of one request per rule.
+        Each of them is labelled with the range of its sequence numbers, to
+        find its rules when it fails.
+        """
+        rules_per_request = self._module.params.get('rules_per_request')
+        if not rules_per_request:
+            return [self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, rule) for seq_num, rule in rules]
+
+        url = self.l3_acl_rule_path.format(acl_name=acl_name, acl_type=acl_type_to_payload_map[acl_type])
+        entries = [self.get_l3_acl_rule_payload(acl_type, seq_num, rule) for seq_num, rule in rules]
+        requests = []
+        for start in range(0, len(entries), rules_per_request):
+            chunk = entries[start:start + rules_per_request]
+            request = self.get_acl_entries_request(url, chunk)
+            request['label'] = 'rules {0}-{1}'.format(chunk[0]['sequence-id'], chunk[-1]['sequence-id'])
+            requests.append(request)
+        return requests
+
+    @staticmethod
+    def get_acl_entries_request(url, entries):
+        """Get request to create or update the given ACL entries"""
+        payload = {'openconfig-acl:acl-entries': {'acl-entry': entries}}
+        return {'path': url, 'method': PATCH, 'data': payload}
+
     def get_create_l3_acl_rule_request(self, acl_type, acl_name, seq_num, rule):
         """Get request to create a rule with given sequence number
         and configuration in the specified L3 ACL
         """
         url = self.l3_acl_rule_path.format(acl_name=acl_name, acl_type=acl_type_to_payload_map[acl_type])
+        payload = {'openconfig-acl:acl-entry': [self.get_l3_acl_rule_payload(acl_type, seq_num, rule)]}
+        return {'path': url, 'method': POST, 'data': payload}
+
+    def get_l3_acl_rule_payload(self, acl_type, seq_num, rule):
+        """Get the ACL entry of a rule with given sequence number
+        and configuration in an L3 ACL
+        """
         payload = {
-            'openconfig-acl:acl-entry': [{
-                'sequence-id': seq_num,
+            'sequence-id': seq_num,
+            'config': {
+                'sequence-id': seq_num
+            },
+            acl_type: {
+                'config': {}
+            },
+            'transport': {
+                'config': {}
+            },
+            'actions': {
                 'config': {
-                    'sequence-id': seq_num
-                },
-                acl_type: {
-                    'config': {}
-                },
-                'transport': {
-                    'config': {}
-                },
-                'actions': {
-                    'config': {
-                        'forwarding-action': action_value_to_payload_map[rule['action']]
-                    }
+                    'forwarding-action': action_value_to_payload_map[rule['action']]
                 }
-            }]
+            }
         }
-        rule_l3_config = payload['openconfig-acl:acl-entry'][0][acl_type]['config']
-        rule_l4_config = payload['openconfig-acl:acl-entry'][0]['transport']['config']
+        rule_l3_config = payload[acl_type]['config']
+        rule_l4_config = payload['transport']['config']
 
         if rule['protocol'].get('number') is not None:
             protocol = rule['protocol']['number']
@@ -519,7 +667,7 @@ class L3_acls(ConfigBase):
                         rule_l4_config['tcp-flags'] = tcp_flag_list
 
         if rule.get('vlan_id') is not None:
-            payload['openconfig-acl:acl-entry'][0]['l2'] = {
+            payload['l2'] = {
                 'config': {
                     'vlanid': rule['vlan_id']
                 }
@@ -534,9 +682,9 @@ class L3_acls(ConfigBase):
                     rule_l3_config['dscp'] = dscp_name_to_value_map[dscp_opt]
 
         if rule.get('remark'):
-            payload['openconfig-acl:acl-entry'][0]['config']['description'] = rule['remark']
+            payload['config']['description'] = rule['remark']
 
-        return {'path': url, 'method': POST, 'data': payload}
+        return payload
 
     def get_delete_l3_acl_request(self, acl_type, acl_name):
         """Get request to delete L3 ACL with specified type and name"""
@@ -556,6 +704,29 @@ class L3_acls(ConfigBase):
         url += '/acl-entry={0}'.format(seq_num)
         return {'path': url, 'method': DELETE}
 
+    def get_delete_l3_acl_rules_requests(self, acl_type, acl_name, seq_nums, have_seq_nums):
+        """Get requests to delete the rules with given sequence numbers,
+        out of the existing ones, in the specified L3 ACL
+
+        With rules_per_request, all the rules are deleted by a single
+        request when none of the existing ones is kept. Otherwise, RESTCONF
+        deleting one list entry per request, the requests are sent
+        concurrently.
+        """
+        if not self._module.params.get('rules_per_request'):
+            return [self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num) for seq_num in seq_nums]
+
+        if seq_nums and len(seq_nums) == len(have_seq_nums):
+            url = self.l3_acl_rule_path.format(acl_name=acl_name, acl_type=acl_type_to_payload_map[acl_type])
+            return [{'path': url, 'method': DELETE}]
+
+        requests = []
+        for seq_num in seq_nums:
+            request = self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num)
+            request['independent'] = True
+            requests.append(request)
+        return requests
+
     def validate_and_normalize_config(self, config_list):
         """Validate and normalize the given config"""
         # Remove empties and validate the config with argument spec
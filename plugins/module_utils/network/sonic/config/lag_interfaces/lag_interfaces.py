@@ -15,11 +15,12 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 try:
-    from urllib import quote
+    from urllib import quote, unquote
 except ImportError:
-    from urllib.parse import quote
+    from urllib.parse import quote, unquote
 
 import json
+import re
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase,
@@ -35,9 +36,13 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     remove_empties_from_list,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import (  # noqa: F401
+    Lag_interfacesFacts,
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    RequestPlan
 )
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
@@ -60,6 +65,10 @@ DELETE = 'delete'
 TEST_KEYS = [
     {'interfaces': {'member': ''}},
 ]
+INTERFACES_PATH = 'data/openconfig-interfaces:interfaces'
+INTERFACE_PATH_REGEXP = re.compile(r'^data/openconfig-interfaces:interfaces/interface=([^/]+)$')
+AGGREGATE_ID_PATH_REGEXP = re.compile(
+    r'^data/openconfig-interfaces:interfaces/interface=(.+)/openconfig-if-ethernet:ethernet/config/openconfig-if-aggregate:aggregate-id$')
 
 
 class Lag_interfaces(ConfigBase):
@@ -107,7 +116,7 @@ class Lag_interfaces(ConfigBase):
         if commands:
             if not self._module.check_mode:
                 try:
-                    edit_config(self._module, to_request(self._module, requests))
+                    edit_config(self._module, to_request(self._module, self.get_request_plan(requests).requests))
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
@@ -428,3 +437,40 @@ class Lag_interfaces(ConfigBase):
             requests.append(request)
 
         return requests
+
+    def get_request_plan(self, requests):
+        """Get the plan of the given requests, in which a member follows the
+        creation of its portchannel, a portchannel deletion follows the
+        removal of the members and the requests on an interface follow each
+        other. Any other request follows all the preceding requests.
+        """
+        plan = RequestPlan()
+        positions = {}
+        member_removals = []
+        barrier = []
+        for request in requests:
+            path = request['path']
+            method = request['method']
+            match = AGGREGATE_ID_PATH_REGEXP.match(path)
+            if match:
+                member = unquote(match.group(1))
+                depends_on = barrier + positions.get(member, [])
+                if method == PATCH:
+                    depends_on += positions.get(request['data']['openconfig-if-aggregate:aggregate-id'], [])
+                position = plan.add(request, depends_on)
+                positions[member] = [position]
+                if method == DELETE:
+                    member_removals.append(position)
+                continue
+
+            match = INTERFACE_PATH_REGEXP.match(path)
+            if match and method == DELETE:
+                name = unquote(match.group(1))
+                positions[name] = [plan.add(request, barrier + member_removals + positions.get(name, []))]
+            elif path == INTERFACES_PATH and method == PATCH:
+                name = request['data']['openconfig-interfaces:interfaces']['interface'][0]['name']
+                positions[name] = [plan.add(request, barrier + positions.get(name, []))]
+            else:
+                barrier = [plan.add(request)]
+
+        return plan
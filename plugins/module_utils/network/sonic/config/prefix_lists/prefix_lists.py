@@ -24,6 +24,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts \
     import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists \
+    import Prefix_listsFacts  # noqa: F401
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils \
     import (
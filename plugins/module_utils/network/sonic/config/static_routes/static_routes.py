@@ -19,16 +19,19 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
+    remove_empties,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts  # noqa: F401
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    get_requests_saved
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states,
-    get_diff,
     get_replaced_config,
+    check_option_range,
 )
 
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
@@ -80,6 +83,7 @@ class Static_routes(ConfigBase):
         """
         result = {'changed': False}
         warnings = []
+        check_option_range(self._module, 'prefixes_per_request', 1)
         commands = []
         existing_static_routes_facts = self.get_static_routes_facts()
         commands, requests = self.set_config(existing_static_routes_facts)
@@ -89,6 +93,9 @@ class Static_routes(ConfigBase):
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
+                requests_saved = get_requests_saved(self._module)
+                if requests_saved:
+                    result['requests_saved'] = requests_saved
             result['changed'] = True
         result['commands'] = commands
 
@@ -128,7 +135,7 @@ class Static_routes(ConfigBase):
         requests = []
         state = self._module.params['state']
 
-        diff = get_diff(want, have, TEST_KEYS)
+        diff = self.get_static_routes_diff(want, have)
 
         if state == 'deleted':
             commands, requests = self._state_deleted(want, have, diff)
@@ -192,10 +199,8 @@ class Static_routes(ConfigBase):
         """
         commands = []
         requests = []
-        self.sort_lists_in_config(want)
-        self.sort_lists_in_config(have)
 
-        if have and have != want:
+        if have and self.get_static_routes_index(have) != self.get_static_routes_index(want):
             is_delete_all = True
             del_requests = self.get_delete_static_routes_requests(have, None, is_delete_all)
             requests.extend(del_requests)
@@ -224,9 +229,7 @@ class Static_routes(ConfigBase):
 
         mod_commands = []
         if replaced_config:
-            self.sort_lists_in_config(replaced_config)
-            self.sort_lists_in_config(have)
-            is_delete_all = (replaced_config == have)
+            is_delete_all = (self.get_static_routes_index(replaced_config) == self.get_static_routes_index(have))
             del_requests = self.get_delete_static_routes_requests(replaced_config, have, is_delete_all)
             requests.extend(del_requests)
             commands.extend(update_states(replaced_config, "deleted"))
@@ -243,12 +246,80 @@ class Static_routes(ConfigBase):
 
         return commands, requests
 
+    def get_static_routes_index(self, config):
+        """Index the next-hops of config by VRF name, prefix and next-hop index"""
+        routes = {}
+        for conf in config or []:
+            vrf_routes = routes.setdefault(conf.get('vrf_name'), {})
+            for static in conf.get('static_list') or []:
+                prefix_next_hops = vrf_routes.setdefault(static.get('prefix'), {})
+                for next_hop in static.get('next_hops') or []:
+                    prefix_next_hops[self.generate_index(next_hop.get('index', {}))] = next_hop
+        return routes
+
+    def get_static_routes_diff(self, want, have):
+        """Get the configuration in want that is not in have, looking up
+        the VRFs, prefixes and next-hops of have in their index
+        """
+        if not have:
+            return want
+
+        diff = []
+        have_routes = self.get_static_routes_index(have)
+        for conf in want or []:
+            vrf_routes = have_routes.get(conf['vrf_name'])
+            if vrf_routes is None:
+                diff.append(remove_empties(conf))
+                continue
+            if not vrf_routes:
+                if conf.get('static_list'):
+                    diff.append({'vrf_name': conf['vrf_name'], 'static_list': conf['static_list']})
+                continue
+
+            static_list = []
+            for static in conf.get('static_list') or []:
+                prefix_next_hops = vrf_routes.get(static['prefix'])
+                if prefix_next_hops is None:
+                    static_list.append(remove_empties(static))
+                    continue
+                if not prefix_next_hops:
+                    if static.get('next_hops'):
+                        static_list.append({'prefix': static['prefix'], 'next_hops': static['next_hops']})
+                    continue
+
+                next_hops = []
+                for next_hop in static.get('next_hops') or []:
+                    have_next_hop = prefix_next_hops.get(self.generate_index(next_hop['index']))
+                    if have_next_hop is None or have_next_hop['index'] != next_hop['index']:
+                        next_hops.append(remove_empties(next_hop))
+                        continue
+
+                    next_hop_diff = {}
+                    for attr in ('metric', 'track', 'tag'):
+                        if next_hop.get(attr) is not None and next_hop[attr] != have_next_hop.get(attr):
+                            next_hop_diff[attr] = next_hop[attr]
+                    if next_hop_diff:
+                        next_hop_diff['index'] = next_hop['index']
+                        next_hops.append(next_hop_diff)
+
+                if next_hops:
+                    static_list.append({'prefix': static['prefix'], 'next_hops': next_hops})
+
+            if static_list:
+                diff.append({'vrf_name': conf['vrf_name'], 'static_list': static_list})
+
+        return diff
+
     def get_modify_static_routes_requests(self, commands):
         requests = []
 
         if not commands:
             return requests
 
+        prefixes_per_request = self._module.params.get('prefixes_per_request')
+        if prefixes_per_request:
+            return self.get_bulk_modify_static_routes_requests(commands, prefixes_per_request)
+
         for conf in commands:
             vrf_name = conf.get('vrf_name', None)
             static_list = conf.get('static_list', [])
@@ -261,8 +332,37 @@ class Static_routes(ConfigBase):
 
         return requests
 
+    def get_bulk_modify_static_routes_requests(self, commands, prefixes_per_request):
+        """Get the requests configuring the routes of each VRF, with up to
+        prefixes_per_request prefixes in each request
+        """
+        requests = []
+        for conf in commands:
+            vrf_name = conf.get('vrf_name', None)
+            url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
+            static_cfgs = []
+            for static in conf.get('static_list') or []:
+                prefix = static.get('prefix', None)
+                next_hops = static.get('next_hops', [])
+                if next_hops:
+                    next_hops_cfg = {'next-hop': [self.get_next_hop_payload(next_hop) for next_hop in next_hops]}
+                    static_cfgs.append({'prefix': prefix, 'config': {'prefix': prefix}, 'next-hops': next_hops_cfg})
+
+            for start in range(0, len(static_cfgs), prefixes_per_request):
+                payload = {'openconfig-network-instance:static-routes': {'static': static_cfgs[start:start + prefixes_per_request]}}
+                requests.append({'path': url, 'method': PATCH, 'data': payload})
+
+        return requests
+
     def get_modify_static_route_request(self, vrf_name, prefix, next_hop):
-        request = None
+        url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
+        next_hops_cfg = {'next-hop': [self.get_next_hop_payload(next_hop)]}
+        payload = {'openconfig-network-instance:static-routes': {'static': [{'prefix': prefix, 'config': {'prefix': prefix}, 'next-hops': next_hops_cfg}]}}
+        request = {'path': url, 'method': PATCH, 'data': payload}
+
+        return request
+
+    def get_next_hop_payload(self, next_hop):
         next_hop_cfg = {}
         index = next_hop.get('index', {})
         blackhole = index.get('blackhole', None)
@@ -288,14 +388,11 @@ class Static_routes(ConfigBase):
             if tag:
                 next_hop_cfg['tag'] = tag
 
-        url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
-        next_hops_cfg = {'next-hop': [{'index': idx, 'config': next_hop_cfg}]}
+        next_hop_payload = {'index': idx, 'config': next_hop_cfg}
         if interface:
-            next_hops_cfg['next-hop'][0]['interface-ref'] = {'config': {'interface': interface}}
-        payload = {'openconfig-network-instance:static-routes': {'static': [{'prefix': prefix, 'config': {'prefix': prefix}, 'next-hops': next_hops_cfg}]}}
-        request = {'path': url, 'method': PATCH, 'data': payload}
+            next_hop_payload['interface-ref'] = {'config': {'interface': interface}}
 
-        return request
+        return next_hop_payload
 
     def generate_index(self, index):
         idx = None
@@ -332,55 +429,70 @@ class Static_routes(ConfigBase):
                 if vrf_name:
                     requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
         else:
+            bulk = bool(self._module.params.get('prefixes_per_request'))
+            have_routes = self.get_static_routes_index(have)
             for cmd in commands:
                 vrf_name = cmd.get('vrf_name', None)
                 static_list = cmd.get('static_list', [])
-                for cfg in have:
-                    cfg_vrf_name = cfg.get('vrf_name', None)
-                    if vrf_name == cfg_vrf_name:
-                        if not static_list:
-                            requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
+                vrf_routes = have_routes.get(vrf_name)
+                if vrf_routes is None:
+                    continue
+                if not static_list or (bulk and vrf_routes and self.is_delete_all_prefixes(static_list, vrf_routes)):
+                    requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
+                    continue
+
+                vrf_requests = []
+                for static in static_list:
+                    prefix = static.get('prefix', None)
+                    next_hops = static.get('next_hops', [])
+                    cfg_next_hops = vrf_routes.get(prefix)
+                    if cfg_next_hops is None:
+                        continue
+                    if prefix and not next_hops:
+                        vrf_requests.append(self.get_delete_static_routes_prefix_request(vrf_name, prefix))
+                        continue
+
+                    for next_hop in next_hops:
+                        index = next_hop.get('index', {})
+                        idx = self.generate_index(index)
+                        metric = next_hop.get('metric', None)
+                        track = next_hop.get('track', None)
+                        tag = next_hop.get('tag', None)
+
+                        cfg_next_hop = cfg_next_hops.get(idx)
+                        if cfg_next_hop is None:
+                            continue
+                        cfg_metric = cfg_next_hop.get('metric', None)
+                        cfg_track = cfg_next_hop.get('track', None)
+                        cfg_tag = cfg_next_hop.get('tag', None)
+                        if not metric and not track and not tag:
+                            vrf_requests.append(self.get_delete_static_routes_next_hop_request(vrf_name, prefix, idx))
                         else:
-                            for static in static_list:
-                                prefix = static.get('prefix', None)
-                                next_hops = static.get('next_hops', [])
-                                cfg_static_list = cfg.get('static_list', [])
-                                for cfg_static in cfg_static_list:
-                                    cfg_prefix = cfg_static.get('prefix', None)
-                                    if prefix == cfg_prefix:
-                                        if prefix and not next_hops:
-                                            requests.append(self.get_delete_static_routes_prefix_request(vrf_name, prefix))
-                                        else:
-                                            for next_hop in next_hops:
-                                                index = next_hop.get('index', {})
-                                                idx = self.generate_index(index)
-                                                metric = next_hop.get('metric', None)
-                                                track = next_hop.get('track', None)
-                                                tag = next_hop.get('tag', None)
-
-                                                cfg_next_hops = cfg_static.get('next_hops', [])
-                                                if cfg_next_hops:
-                                                    for cfg_next_hop in cfg_next_hops:
-                                                        cfg_index = cfg_next_hop.get('index', {})
-                                                        cfg_idx = self.generate_index(cfg_index)
-                                                        if idx == cfg_idx:
-                                                            cfg_metric = cfg_next_hop.get('metric', None)
-                                                            cfg_track = cfg_next_hop.get('track', None)
-                                                            cfg_tag = cfg_next_hop.get('tag', None)
-                                                            if not metric and not track and not tag:
-                                                                requests.append(self.get_delete_static_routes_next_hop_request(vrf_name, prefix, idx))
-                                                            else:
-                                                                if metric == cfg_metric:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx,
-                                                                                                                                 'metric'))
-                                                                if track == cfg_track:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx,
-                                                                                                                                 'track'))
-                                                                if tag == cfg_tag:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'tag'))
+                            if metric == cfg_metric:
+                                vrf_requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'metric'))
+                            if track == cfg_track:
+                                vrf_requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'track'))
+                            if tag == cfg_tag:
+                                vrf_requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'tag'))
+
+                if bulk:
+                    # The routes of a VRF are deleted concurrently, in runs of
+                    # max_workers requests, by the httpapi plugin
+                    for request in vrf_requests:
+                        request['independent'] = True
+                requests.extend(vrf_requests)
 
         return requests
 
+    def is_delete_all_prefixes(self, static_list, vrf_routes):
+        """Whether static_list deletes all the routes of a VRF indexed in vrf_routes"""
+        prefixes = set()
+        for static in static_list:
+            if static.get('next_hops'):
+                return False
+            prefixes.add(static.get('prefix'))
+        return prefixes.issuperset(vrf_routes)
+
     def get_delete_static_routes_for_vrf(self, vrf_name):
         url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
         request = {'path': url, 'method': DELETE}
@@ -409,20 +521,3 @@ class Static_routes(ConfigBase):
         request = {'path': url, 'method': DELETE}
 
         return request
-
-    def sort_lists_in_config(self, config):
-        if config:
-            config.sort(key=self.get_vrf_name)
-            for cfg in config:
-                if 'static_list' in cfg and cfg['static_list']:
-                    cfg['static_list'].sort(key=self.get_prefix)
-                    for rt in cfg['static_list']:
-                        if 'next_hops' in rt and rt['next_hops']:
-                            rt['next_hops'].sort(key=lambda x: (x['index']['blackhole'] is not None, x['index']['interface'] is not None,
-                                                                x['index']['nexthop_vrf'] is not None, x['index']['next_hop'] is not None))
-
-    def get_vrf_name(self, vrf_name):
-        return vrf_name.get('vrf_name')
-
-    def get_prefix(self, prefix):
-        return prefix.get('prefix')
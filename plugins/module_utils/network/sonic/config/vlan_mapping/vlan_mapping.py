@@ -21,10 +21,12 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts  # noqa: F401
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     update_states,
     remove_empties_from_list,
+    VlanSet,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -471,17 +473,8 @@ class Vlan_mapping(ConfigBase):
         :param same: if true will instead return list of shared values
         :rtype: list(str)
         """
-        results = []
-
-        for vlan_id in vlan_ids:
-            if same:
-                if vlan_id in have_vlan_ids:
-                    results.append(vlan_id)
-            else:
-                if vlan_id not in have_vlan_ids:
-                    results.append(vlan_id)
-
-        return results
+        have_vlan_set = VlanSet.from_vlans(have_vlan_ids)
+        return [vlan_id for vlan_id in vlan_ids if (vlan_id in have_vlan_set) == same]
 
     def vlanIdsRangeStr(self, vlanList):
         rangeList = []
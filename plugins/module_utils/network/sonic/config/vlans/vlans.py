@@ -22,18 +22,25 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     search_obj_in_list,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     get_replaced_config,
     update_states,
     remove_empties_from_list,
+    get_new_config,
+    get_verified_after,
+    check_option_range,
+    is_equal,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.interfaces_util import (
     build_interfaces_create_request,
+    build_interface_create_payload,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    get_requests_saved
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -60,13 +67,17 @@ class Vlans(ConfigBase):
     def __init__(self, module):
         super(Vlans, self).__init__(module)
 
-    def get_vlans_facts(self):
+    def get_vlans_facts(self, vlan_ids=None):
         """ Get the 'facts' (the current configuration)
 
+        :param vlan_ids: if given, get only the VLANs with these IDs
         :rtype: A dictionary
         :returns: The current configuration as a dictionary
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
+        data = None
+        if vlan_ids is not None:
+            data = VlansFacts(self._module).get_vlans(vlan_ids)
+        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources, data)
         vlans_facts = facts['ansible_network_resources'].get('vlans')
         if not vlans_facts:
             return []
@@ -81,7 +92,10 @@ class Vlans(ConfigBase):
         result = {'changed': False}
         warnings = list()
 
-        existing_vlans_facts = self.get_vlans_facts()
+        check_option_range(self._module, 'verify_after_rate', 0, 1)
+        check_option_range(self._module, 'vlans_per_request', 1)
+        vlan_ids = self.get_facts_scope()
+        existing_vlans_facts = self.get_vlans_facts(vlan_ids)
         commands, requests = self.set_config(existing_vlans_facts)
         if commands:
             if not self._module.check_mode:
@@ -89,18 +103,55 @@ class Vlans(ConfigBase):
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
+                requests_saved = get_requests_saved(self._module)
+                if requests_saved:
+                    result['requests_saved'] = requests_saved
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vlans_facts = self.get_vlans_facts()
-
         result['before'] = existing_vlans_facts
         if result['changed']:
-            result['after'] = changed_vlans_facts
+            result['after'] = get_verified_after(self._module, self.get_new_vlans_config(commands, existing_vlans_facts),
+                                                 lambda: self.get_vlans_facts(vlan_ids), TEST_KEYS, warnings)
 
         result['warnings'] = warnings
         return result
 
+    def get_facts_scope(self):
+        """ Select the VLANs to read from the device
+
+        :rtype: A list
+        :returns: the IDs of the VLANs in the config when facts_scope is
+                  'config', None to read all the VLANs
+        """
+        want = self._module.params['config']
+        state = self._module.params['state']
+        if self._module.params.get('facts_scope') != 'config' or not want or state == 'overridden':
+            return None
+        return [conf['vlan_id'] for conf in want]
+
+    def get_new_vlans_config(self, commands, have):
+        """ Derive the configuration resulting from the commands
+
+        :rtype: A list
+        :returns: the VLANs configuration after the commands are applied
+        """
+        state = self._module.params['state']
+        want = remove_empties_from_list(self._module.params['config'])
+        if state == 'deleted' and not want:
+            return []
+        if state == 'overridden':
+            # VLANs absent from want are deleted as a whole
+            want_vlan_ids = set(conf['vlan_id'] for conf in want)
+            have = [conf for conf in have if conf['vlan_id'] in want_vlan_ids]
+            commands = [command for command in commands if command['vlan_id'] in want_vlan_ids]
+
+        new_config = get_new_config(commands, have, TEST_KEYS)
+        # Match the facts, in which every option is present
+        for conf in new_config:
+            conf.setdefault('description', None)
+        return new_config
+
     def set_config(self, existing_vlans_facts):
         """ Collect the configuration from the args passed to the module,
             collect the current configuration (as a dict from facts)
@@ -124,6 +175,9 @@ class Vlans(ConfigBase):
                   to the desired configuration
         """
         state = self._module.params['state']
+        if state != 'deleted' and is_equal(want, have):
+            return [], []
+
         # diff method works on dict, so creating temp dict
         diff = get_diff(want, have, TEST_KEYS)
 
@@ -267,6 +321,12 @@ class Vlans(ConfigBase):
                        }
             requests.append(request)
 
+        if self._module.params.get('vlans_per_request'):
+            # RESTCONF deletes a single list entry per request: let the
+            # httpapi plugin send them concurrently, in runs of max_workers
+            for request in requests:
+                request['independent'] = True
+
         return requests
 
     def get_delete_vlan_config_attr(self, vlan_id, attr_name):
@@ -279,6 +339,9 @@ class Vlans(ConfigBase):
         requests = []
         if not configs:
             return requests
+        vlans_per_request = self._module.params.get('vlans_per_request')
+        if vlans_per_request:
+            return self.get_bulk_create_vlans_requests(configs, vlans_per_request)
         for vlan in configs:
             vlan_id = vlan.get("vlan_id")
             interface_name = "Vlan" + str(vlan_id)
@@ -290,6 +353,20 @@ class Vlans(ConfigBase):
 
         return requests
 
+    def get_bulk_create_vlans_requests(self, configs, vlans_per_request):
+        """Get the requests creating the VLANs with their description, with
+        up to vlans_per_request VLANs in each request
+        """
+        requests = []
+        url = "data/openconfig-interfaces:interfaces"
+        interfaces = [build_interface_create_payload("Vlan" + str(vlan.get("vlan_id")), vlan.get("description", None))
+                      for vlan in configs]
+        for start in range(0, len(interfaces), vlans_per_request):
+            payload = {"openconfig-interfaces:interfaces": {"interface": interfaces[start:start + vlans_per_request]}}
+            requests.append({"path": url, "method": "PATCH", "data": payload})
+
+        return requests
+
     def get_modify_vlan_config_attr(self, intf_name, attr_name, attr_value):
         url = "data/openconfig-interfaces:interfaces/interface={}/config"
         payload = {"openconfig-interfaces:config": {"name": intf_name, attr_name: attr_value}}
@@ -20,20 +20,25 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts  # noqa: F401
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    get_requests_saved
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     update_states,
     get_replaced_config,
-    send_requests
+    send_requests,
+    check_option_range
 )
 from ansible.module_utils.connection import ConnectionError
 
 PATCH = 'patch'
 DELETE = 'delete'
+VLAN_MAP_PATH = 'data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP'
+VLAN_MAP_LIST_PATH = 'data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP/VXLAN_TUNNEL_MAP_LIST'
 test_keys = [
     {'vlan_map': {'vlan': '', 'vni': ''}},
     {'vrf_map': {'vni': '', 'vrf': ''}},
@@ -77,6 +82,7 @@ class Vxlans(ConfigBase):
         """
         result = {'changed': False}
         warnings = list()
+        check_option_range(self._module, 'maps_per_request', 1)
 
         existing_vxlans_facts = self.get_vxlans_facts()
         commands, requests = self.set_config(existing_vxlans_facts)
@@ -87,6 +93,9 @@ class Vxlans(ConfigBase):
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
+                requests_saved = get_requests_saved(self._module)
+                if requests_saved:
+                    result['requests_saved'] = requests_saved
             result['changed'] = True
         result['commands'] = commands
 
@@ -296,7 +305,10 @@ class Vxlans(ConfigBase):
             if vrf_map_list:
                 vrf_map_requests.extend(self.get_delete_vrf_map_request(conf, conf, name, vrf_map_list))
             if vlan_map_list:
-                vlan_map_requests.extend(self.get_delete_vlan_map_request(conf, conf, name, vlan_map_list))
+                if self._module.params.get('maps_per_request'):
+                    vlan_map_requests = [{"path": VLAN_MAP_LIST_PATH, "method": DELETE}]
+                else:
+                    vlan_map_requests.extend(self.get_delete_vlan_map_request(conf, conf, name, vlan_map_list))
             if src_ip:
                 src_ip_requests.extend(self.get_delete_src_ip_request(conf, conf, name, src_ip))
             if primary_ip:
@@ -387,6 +399,9 @@ class Vxlans(ConfigBase):
             if is_delete_full:
                 tunnel_requests.extend(self.get_delete_tunnel_request(conf, matched, name))
 
+        if vlan_map_requests and self._module.params.get('maps_per_request'):
+            vlan_map_requests = self.get_bulk_delete_vlan_map_requests(vlan_map_requests, have)
+
         if vrf_map_requests:
             requests.extend(vrf_map_requests)
         if vlan_map_requests:
@@ -447,33 +462,70 @@ class Vxlans(ConfigBase):
     def get_create_vlan_map_request(self, configs, have):
         # Create URL and payload
         requests = []
+        have_vlan_maps = self.get_vni_index(have, 'vlan_map', 'vlan')
         for conf in configs:
             new_vlan_map_list = conf.get('vlan_map', [])
             if new_vlan_map_list:
+                matched_vlan_maps = have_vlan_maps.get(conf['name'], {})
                 for each_vlan_map in new_vlan_map_list:
-                    name = conf['name']
                     vlan = each_vlan_map.get('vlan')
                     vni = each_vlan_map.get('vni')
-                    matched = next((each_vxlan for each_vxlan in have if each_vxlan['name'] == name), None)
-
-                    is_change_needed = True
-                    if matched:
-                        matched_vlan_map_list = matched.get('vlan_map', [])
-                        if matched_vlan_map_list:
-                            matched_vlan_map = next((e_vlan_map for e_vlan_map in matched_vlan_map_list if e_vlan_map['vni'] == vni), None)
-                            if matched_vlan_map:
-                                if matched_vlan_map['vlan'] == vlan:
-                                    is_change_needed = False
 
+                    is_change_needed = not (vni in matched_vlan_maps and matched_vlan_maps[vni] == vlan)
                     if is_change_needed:
-                        map_name = "map_{0}_Vlan{1}".format(vni, vlan)
                         payload = self.build_create_vlan_map_payload(conf, each_vlan_map)
-                        url = "data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP"
-                        request = {"path": url, "method": PATCH, "data": payload}
+                        request = {"path": VLAN_MAP_PATH, "method": PATCH, "data": payload}
                         requests.append(request)
 
+        maps_per_request = self._module.params.get('maps_per_request')
+        if maps_per_request:
+            requests = self.get_bulk_create_vlan_map_requests(requests, maps_per_request)
+
+        return requests
+
+    def get_bulk_create_vlan_map_requests(self, requests, maps_per_request):
+        """Merge the VLAN map requests into requests of up to maps_per_request maps"""
+        vlan_map_list = []
+        for request in requests:
+            vlan_map_list.extend(request['data']['sonic-vxlan:VXLAN_TUNNEL_MAP']['VXLAN_TUNNEL_MAP_LIST'])
+
+        bulk_requests = []
+        for start in range(0, len(vlan_map_list), maps_per_request):
+            payload = {'sonic-vxlan:VXLAN_TUNNEL_MAP': {'VXLAN_TUNNEL_MAP_LIST': vlan_map_list[start:start + maps_per_request]}}
+            bulk_requests.append({"path": VLAN_MAP_PATH, "method": PATCH, "data": payload})
+
+        return bulk_requests
+
+    def get_bulk_delete_vlan_map_requests(self, requests, have):
+        """Replace the VLAN map delete requests by a single request if they
+        delete all the VLAN maps in have, or flag them as independent so that
+        the httpapi plugin sends them concurrently
+        """
+        have_count = sum(len(vlan_maps) for vlan_maps in self.get_vni_index(have, 'vlan_map', 'vlan').values())
+        if len(set(request['path'] for request in requests)) >= have_count:
+            return [{"path": VLAN_MAP_LIST_PATH, "method": DELETE}]
+
+        for request in requests:
+            request['independent'] = True
         return requests
 
+    def get_vni_index(self, configs, map_key, attr):
+        """Index the VLAN or VRF maps of the VTEPs in configs by VTEP name and VNI
+
+        :rtype: A dictionary
+        :returns: for each VTEP name, the dictionary of the 'attr' values of
+                  its 'map_key' maps by VNI. As when scanning the lists, the
+                  first VTEP and the first map of a VNI win.
+        """
+        index = {}
+        for conf in configs or []:
+            if conf['name'] in index:
+                continue
+            vni_index = index[conf['name']] = {}
+            for each_map in conf.get(map_key) or []:
+                vni_index.setdefault(each_map['vni'], each_map[attr])
+        return index
+
     def build_create_vlan_map_payload(self, conf, vlan_map):
         payload_url = dict()
 
@@ -490,24 +542,16 @@ class Vxlans(ConfigBase):
     def get_create_vrf_map_request(self, configs, have):
         # Create URL and payload
         requests = []
+        have_vrf_maps = self.get_vni_index(have, 'vrf_map', 'vrf')
         for conf in configs:
             new_vrf_map_list = conf.get('vrf_map', [])
             if new_vrf_map_list:
+                matched_vrf_maps = have_vrf_maps.get(conf['name'], {})
                 for each_vrf_map in new_vrf_map_list:
-                    name = conf['name']
                     vrf = each_vrf_map.get('vrf')
                     vni = each_vrf_map.get('vni')
-                    matched = next((each_vxlan for each_vxlan in have if each_vxlan['name'] == name), None)
-
-                    is_change_needed = True
-                    if matched:
-                        matched_vrf_map_list = matched.get('vrf_map', [])
-                        if matched_vrf_map_list:
-                            matched_vrf_map = next((e_vrf_map for e_vrf_map in matched_vrf_map_list if e_vrf_map['vni'] == vni), None)
-                            if matched_vrf_map:
-                                if matched_vrf_map['vrf'] == vrf:
-                                    is_change_needed = False
 
+                    is_change_needed = not (vni in matched_vrf_maps and matched_vrf_maps[vni] == vrf)
                     if is_change_needed:
                         payload = self.build_create_vrf_map_payload(conf, each_vrf_map)
                         url = "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST={vrf}/vni".format(vrf=vrf)
@@ -587,20 +631,13 @@ class Vxlans(ConfigBase):
     def get_delete_vlan_map_request(self, conf, matched, name, del_vlan_map_list):
         # Create URL and payload
         requests = []
+        matched_vlan_maps = self.get_vni_index([matched], 'vlan_map', 'vlan')[matched['name']] if matched else {}
 
         for each_vlan_map in del_vlan_map_list:
             vlan = each_vlan_map.get('vlan')
             vni = each_vlan_map.get('vni')
 
-            is_change_needed = False
-            if matched:
-                matched_vlan_map_list = matched.get('vlan_map', None)
-                if matched_vlan_map_list:
-                    matched_vlan_map = next((e_vlan_map for e_vlan_map in matched_vlan_map_list if e_vlan_map['vni'] == vni), None)
-                    if matched_vlan_map:
-                        if matched_vlan_map['vlan'] == vlan:
-                            is_change_needed = True
-
+            is_change_needed = vni in matched_vlan_maps and matched_vlan_maps[vni] == vlan
             if is_change_needed:
                 map_name = "map_{0}_Vlan{1}".format(vni, vlan)
                 url = "data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP/VXLAN_TUNNEL_MAP_LIST={name},{map_name}".format(name=name, map_name=map_name)
@@ -612,20 +649,13 @@ class Vxlans(ConfigBase):
     def get_delete_vrf_map_request(self, conf, matched, name, del_vrf_map_list):
         # Create URL and payload
         requests = []
+        matched_vrf_maps = self.get_vni_index([matched], 'vrf_map', 'vrf')[matched['name']] if matched else {}
 
         for each_vrf_map in del_vrf_map_list:
             vrf = each_vrf_map.get('vrf')
             vni = each_vrf_map.get('vni')
 
-            is_change_needed = False
-            if matched:
-                matched_vrf_map_list = matched.get('vrf_map', None)
-                if matched_vrf_map_list:
-                    matched_vrf_map = next((e_vrf_map for e_vrf_map in matched_vrf_map_list if e_vrf_map['vni'] == vni), None)
-                    if matched_vrf_map:
-                        if matched_vrf_map['vrf'] == vrf:
-                            is_change_needed = True
-
+            is_change_needed = vni in matched_vrf_maps and matched_vrf_maps[vni] == vrf
             if is_change_needed:
                 url = "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST={vrf}/vni".format(vrf=vrf)
                 request = {"path": url, "method": DELETE}
@@ -23,6 +23,10 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     edit_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.aaa.aaa import AaaArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_spec_skeleton,
+    validate_facts
+)
 
 GET = "get"
 
@@ -34,16 +38,7 @@ class AaaFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = AaaArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def get_aaa(self):
         """Get aaa details available in chassis"""
@@ -73,7 +68,7 @@ class AaaFacts(object):
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['aaa'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
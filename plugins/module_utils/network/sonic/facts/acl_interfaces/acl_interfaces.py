@@ -16,10 +16,11 @@ __metaclass__ = type
 from copy import deepcopy
 
 from ansible.module_utils.connection import ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.acl_interfaces.acl_interfaces import Acl_interfacesArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_spec_skeleton,
+    validate_facts
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -33,16 +34,7 @@ class Acl_interfacesFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Acl_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for acl_interfaces
@@ -67,7 +59,7 @@ class Acl_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('acl_interfaces', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['acl_interfaces'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -13,13 +13,10 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    remove_empties_from_list
+    remove_empties_from_list,
+    get_spec_skeleton,
+    validate_facts
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_af.bgp_af import Bgp_afArgs
 
@@ -79,16 +76,7 @@ class Bgp_afFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Bgp_afArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for BGP
@@ -123,7 +111,7 @@ class Bgp_afFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_af', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['bgp_af'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
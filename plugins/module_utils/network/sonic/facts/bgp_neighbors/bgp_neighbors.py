@@ -13,17 +13,15 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    remove_empties_from_list
+    remove_empties_from_list,
+    get_spec_skeleton,
+    validate_facts
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors.bgp_neighbors import Bgp_neighborsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_bgp_neighbors,
+    get_bgp_snapshot,
     get_from_params_map,
     get_peergroups,
 )
@@ -73,16 +71,7 @@ class Bgp_neighborsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Bgp_neighborsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for BGP
@@ -95,8 +84,9 @@ class Bgp_neighborsFacts(object):
         objs = list()
 
         if not data:
-            data = get_all_bgp_neighbors(self._module)
-            filtered_data = self.filter_neighbors_data(data)
+            snapshot = get_bgp_snapshot(self._module)
+            data = get_all_bgp_neighbors(self._module, snapshot)
+            filtered_data = self.filter_neighbors_data(data, snapshot)
             if filtered_data:
                 data = filtered_data
 
@@ -109,7 +99,7 @@ class Bgp_neighborsFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['bgp_neighbors'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -127,7 +117,7 @@ class Bgp_neighborsFacts(object):
 
         return conf
 
-    def filter_neighbors_data(self, data):
+    def filter_neighbors_data(self, data, snapshot=None):
         filtered_data = []
         for conf in data:
             vrf_name = conf['vrf_name']
@@ -139,7 +129,7 @@ class Bgp_neighborsFacts(object):
 
             tmp['vrf_name'] = vrf_name
             tmp['bgp_as'] = bgp_as
-            peergroup = get_peergroups(self._module, vrf_name)
+            peergroup = get_peergroups(self._module, vrf_name, snapshot)
             if peergroup:
                 tmp['peer_group'] = peergroup
             fil_neighbors = []
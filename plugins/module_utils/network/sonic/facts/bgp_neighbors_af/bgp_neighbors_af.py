@@ -13,13 +13,10 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    remove_empties_from_list
+    remove_empties_from_list,
+    get_spec_skeleton,
+    validate_facts
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
@@ -53,16 +50,7 @@ class Bgp_neighbors_afFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Bgp_neighbors_afArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def fill_route_map(self, data):
         for route_map_key in ['out_route_name', 'in_route_name']:
@@ -203,7 +191,7 @@ class Bgp_neighbors_afFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors_af', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': remove_empties_from_list(objs)})
+            params = validate_facts(self.argument_spec, {'config': remove_empties_from_list(objs)}, module=self._module)
             facts['bgp_neighbors_af'] = params['config']
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -12,92 +12,114 @@ calls the appropriate facts gathering function
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+
+from ansible.module_utils._text import to_text
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
-    Bgp_ext_communitiesFacts,
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts
+
+FACTS_PACKAGE = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts'
+
+
+class FactsRegistry(dict):
+    """Map of resource name to facts class, importing the facts module of a
+    resource, <FACTS_PACKAGE>.<resource>.<resource>, when it is looked up
+
+    A module imports only the facts modules of the resources it gathers.
+    These imports must be static, i.e. done by the module or by its config
+    class, for AnsiballZ to ship the facts modules with the module.
+    """
+
+    def __getitem__(self, name):
+        fact_cls = dict.__getitem__(self, name)
+        if not isinstance(fact_cls, type):
+            module = import_module('{0}.{1}.{1}'.format(FACTS_PACKAGE, name))
+            fact_cls = getattr(module, fact_cls)
+            dict.__setitem__(self, name, fact_cls)
+        return fact_cls
+
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
 
 FACT_LEGACY_SUBSETS = {}
-FACT_RESOURCE_SUBSETS = dict(
-    vlans=VlansFacts,
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_interfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    bgp=BgpFacts,
-    bgp_af=Bgp_afFacts,
-    bgp_neighbors=Bgp_neighborsFacts,
-    bgp_neighbors_af=Bgp_neighbors_afFacts,
-    bgp_as_paths=Bgp_as_pathsFacts,
-    bgp_communities=Bgp_communitiesFacts,
-    bgp_ext_communities=Bgp_ext_communitiesFacts,
-    mclag=MclagFacts,
-    prefix_lists=Prefix_listsFacts,
-    vlan_mapping=Vlan_mappingFacts,
-    vrfs=VrfsFacts,
-    vxlans=VxlansFacts,
-    users=UsersFacts,
-    system=SystemFacts,
-    port_breakout=Port_breakoutFacts,
-    aaa=AaaFacts,
-    tacacs_server=Tacacs_serverFacts,
-    radius_server=Radius_serverFacts,
-    static_routes=Static_routesFacts,
-    ntp=NtpFacts,
-    logging=LoggingFacts,
-    ip_neighbor=Ip_neighborFacts,
-    port_group=Port_groupFacts,
-    dhcp_relay=Dhcp_relayFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    l2_acls=L2_aclsFacts,
-    l3_acls=L3_aclsFacts,
-    lldp_global=Lldp_globalFacts,
-    mac=MacFacts,
-    bfd=BfdFacts,
-    copp=CoppFacts,
-    route_maps=Route_mapsFacts
+FACT_RESOURCE_SUBSETS = FactsRegistry(
+    vlans='VlansFacts',
+    interfaces='InterfacesFacts',
+    l2_interfaces='L2_interfacesFacts',
+    l3_interfaces='L3_interfacesFacts',
+    lag_interfaces='Lag_interfacesFacts',
+    bgp='BgpFacts',
+    bgp_af='Bgp_afFacts',
+    bgp_neighbors='Bgp_neighborsFacts',
+    bgp_neighbors_af='Bgp_neighbors_afFacts',
+    bgp_as_paths='Bgp_as_pathsFacts',
+    bgp_communities='Bgp_communitiesFacts',
+    bgp_ext_communities='Bgp_ext_communitiesFacts',
+    mclag='MclagFacts',
+    prefix_lists='Prefix_listsFacts',
+    vlan_mapping='Vlan_mappingFacts',
+    vrfs='VrfsFacts',
+    vxlans='VxlansFacts',
+    users='UsersFacts',
+    system='SystemFacts',
+    port_breakout='Port_breakoutFacts',
+    aaa='AaaFacts',
+    tacacs_server='Tacacs_serverFacts',
+    radius_server='Radius_serverFacts',
+    static_routes='Static_routesFacts',
+    ntp='NtpFacts',
+    logging='LoggingFacts',
+    ip_neighbor='Ip_neighborFacts',
+    port_group='Port_groupFacts',
+    dhcp_relay='Dhcp_relayFacts',
+    acl_interfaces='Acl_interfacesFacts',
+    l2_acls='L2_aclsFacts',
+    l3_acls='L3_aclsFacts',
+    lldp_global='Lldp_globalFacts',
+    mac='MacFacts',
+    bfd='BfdFacts',
+    copp='CoppFacts',
+    route_maps='Route_mapsFacts'
 )
 
 
+class CollectorFailure(Exception):
+    """Raised in place of fail_json by a concurrently running collector"""
+
+    def __init__(self, msg, **kwargs):
+        super(CollectorFailure, self).__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
+
+
+class CollectorModule(object):
+    """Module proxy handed to a concurrently running facts collector
+
+    Attributes are read from and written to the wrapped module, so that the
+    connection and the request cache stay shared. fail_json raises instead
+    of exiting, so that one failing collector does not end the module run
+    while the other collectors are still running.
+    """
+
+    def __init__(self, module):
+        object.__setattr__(self, '_wrapped_module', module)
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped_module, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._wrapped_module, name, value)
+
+    def fail_json(self, msg=None, **kwargs):
+        raise CollectorFailure(msg, **kwargs)
+
+
 class Facts(FactsBase):
     """ The fact class for sonic
     """
@@ -119,9 +141,63 @@ class Facts(FactsBase):
         """
         netres_choices = FactsArgs.argument_spec['gather_network_resources'].get('choices', [])
         if self.VALID_RESOURCE_SUBSETS:
-            self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
+            max_workers = self._module.params.get('max_workers') or 1
+            if max_workers > 1:
+                self.get_network_resources_facts_concurrently(FACT_RESOURCE_SUBSETS, max_workers, resource_facts_type, data)
+            else:
+                self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
 
         if self.VALID_LEGACY_GATHER_SUBSETS:
             self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
 
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts_concurrently(self, facts_resource_obj_map, max_workers, resource_facts_type=None, data=None):
+        """ Collect the resource facts with up to max_workers collectors running at a time
+
+        The facts of each resource are gathered into a separate tree and
+        merged in resource name order, so that the result does not depend on
+        the order in which the collectors complete. The failures of all
+        collectors are reported together.
+
+        :param facts_resource_obj_map: map of resource name to facts class
+        :param max_workers: maximum number of collectors running concurrently
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+
+        restorun_subsets = self.gen_runable(resource_facts_type, frozenset(facts_resource_obj_map.keys()), resource_facts=True)
+        if not restorun_subsets:
+            return
+
+        self.ansible_facts['ansible_net_gather_network_resources'] = list(restorun_subsets)
+        module = CollectorModule(self._module)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key in sorted(restorun_subsets):
+                fact_cls_obj = facts_resource_obj_map.get(key)
+                if fact_cls_obj:
+                    futures[key] = executor.submit(self._populate_resource_facts, fact_cls_obj, module, data)
+                else:
+                    self._warnings.append("network resource fact gathering for '%s' is not supported" % key)
+
+        failures = []
+        for key in sorted(futures):
+            try:
+                resource_facts = futures[key].result()
+            except CollectorFailure as exc:
+                failures.append('%s: %s' % (key, to_text(exc.msg)))
+            except Exception as exc:
+                failures.append('%s: %s' % (key, to_text(exc)))
+            else:
+                self.ansible_facts['ansible_network_resources'].update(resource_facts)
+
+        if failures:
+            self._module.fail_json(msg='Failed to gather network resource facts: %s' % '; '.join(failures))
+
+    def _populate_resource_facts(self, fact_cls_obj, module, data):
+        resource_facts = {'ansible_network_resources': {}}
+        fact_cls_obj(module).populate_facts(self._connection, resource_facts, data)
+        return resource_facts['ansible_network_resources']
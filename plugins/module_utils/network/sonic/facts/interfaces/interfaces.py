@@ -13,16 +13,16 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.interfaces.interfaces import InterfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_existing_resources,
+    get_spec_skeleton,
+    validate_facts
+)
 from ansible.module_utils.connection import ConnectionError
 
 GET = "get"
@@ -36,21 +36,12 @@ class InterfacesFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = InterfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def get_all_interfaces(self):
         """Get all the interfaces available in chassis"""
         all_interfaces = {}
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET, "query": {"content": "config"}}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
@@ -61,6 +52,16 @@ class InterfacesFacts(object):
 
         return all_interfaces['interface']
 
+    def get_interfaces(self, names):
+        """Get the interfaces with the given names, skipping those not found"""
+        requests = [{"path": "data/openconfig-interfaces:interfaces/interface=%s" % name, "method": GET,
+                     "query": {"content": "config"}} for name in names]
+        interfaces = []
+        for value in get_existing_resources(self._module, requests):
+            interfaces.extend(value.get("openconfig-interfaces:interface", []))
+
+        return interfaces
+
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for interfaces
         :param connection: the device connection
@@ -73,7 +74,7 @@ class InterfacesFacts(object):
         if connection:  # just for linting purposes, remove
             pass
 
-        if not data:
+        if data is None:
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
@@ -93,7 +94,7 @@ class InterfacesFacts(object):
         facts = {}
         if objs:
             facts['interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             if params:
                 facts['interfaces'].extend(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
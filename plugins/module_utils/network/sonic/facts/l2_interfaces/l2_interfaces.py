@@ -13,12 +13,14 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l2_interfaces.l2_interfaces import L2_interfacesArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_spec_skeleton,
+    validate_facts
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -35,16 +37,7 @@ class L2_interfacesFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = L2_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def vlan_range_to_list(self, in_range, range_str):
         range_bounds = in_range.split(range_str)
@@ -101,7 +94,7 @@ class L2_interfacesFacts(object):
     def get_all_l2_interfaces(self):
         """Get all the l2_interfaces available in chassis"""
         l2_interfaces = {}
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET, "query": {"content": "config"}}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
@@ -146,7 +139,7 @@ class L2_interfacesFacts(object):
         facts = {}
         if objs:
             facts['l2_interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             for cfg in params['config']:
                 facts['l2_interfaces'].append(utils.remove_empties(cfg))
         ansible_facts['ansible_network_resources'].update(facts)
@@ -24,6 +24,11 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_existing_resources,
+    get_spec_skeleton,
+    validate_facts
+)
 
 IPV4_HOST_MASK = '/32'
 IPV6_HOST_MASK = '/128'
@@ -87,16 +92,7 @@ class L3_aclsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = L3_aclsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for l3_acls
@@ -109,8 +105,10 @@ class L3_aclsFacts(object):
         if connection:  # just for linting purposes, remove
             pass
 
-        if not data:
+        if data is None:
             l3_acls_configs = self.get_l3_acls()
+        else:
+            l3_acls_configs = data
 
         objs = []
         for l3_acl_config in l3_acls_configs:
@@ -121,7 +119,7 @@ class L3_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l3_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['l3_acls'] = utils.remove_empties({'config': params['config']})['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -217,20 +215,31 @@ class L3_aclsFacts(object):
 
         return config
 
-    def get_l3_acls(self):
-        """Get all l3 acl configurations available in chassis"""
-        acls_path = 'data/openconfig-acl:acl/acl-sets'
+    def get_l3_acls(self, acl_keys=None):
+        """Get all l3 acl configurations available in chassis
+
+        :param acl_keys: if given, get only the ACLs with these
+                         (name, payload type) keys, e.g. ('acl1', 'ACL_IPV4')
+        """
         method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
+        if acl_keys is not None:
+            acl_path = 'data/openconfig-acl:acl/acl-sets/acl-set={0},{1}'
+            requests = [{'path': acl_path.format(acl_name, acl_type), 'method': method} for acl_name, acl_type in acl_keys]
+            acls = []
+            for value in get_existing_resources(self._module, requests):
+                acls.extend(value.get('openconfig-acl:acl-set', []))
+        else:
+            acls_path = 'data/openconfig-acl:acl/acl-sets'
+            request = [{'path': acls_path, 'method': method}]
 
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
+            try:
+                response = edit_config(self._module, to_request(self._module, request))
+            except ConnectionError as exc:
+                self._module.fail_json(msg=str(exc), code=exc.code)
 
-        acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
-            acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+            acls = []
+            if response[0][1].get('openconfig-acl:acl-sets'):
+                acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
 
         ipv4_acls_configs = []
         ipv6_acls_configs = []
@@ -13,14 +13,14 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import re
-from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.route_maps.route_maps import Route_mapsArgs
 
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import remove_empties_from_list
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    remove_empties_from_list,
+    get_spec_skeleton,
+    validate_facts
+)
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic \
     import to_request, edit_config
@@ -33,16 +33,7 @@ class Route_mapsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Route_mapsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for route_maps
@@ -68,8 +59,9 @@ class Route_mapsFacts(object):
         ansible_facts['ansible_network_resources'].pop('route_maps', None)
         facts = {}
         if route_maps:
-            params = utils.validate_config(self.argument_spec,
-                                           {'config': route_maps})
+            params = validate_facts(self.argument_spec,
+                                    {'config': route_maps},
+                                    module=self._module)
             params_cleaned = {'config': remove_empties_from_list(params['config'])}
             facts['route_maps'] = params_cleaned['config']
         ansible_facts['ansible_network_resources'].update(facts)
@@ -23,6 +23,11 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_existing_resources,
+    get_spec_skeleton,
+    validate_facts
+)
 from ansible.module_utils.connection import ConnectionError
 
 GET = "get"
@@ -35,16 +40,7 @@ class VlansFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = VlansArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for vlans
@@ -57,8 +53,10 @@ class VlansFacts(object):
         if connection:  # just for linting purposes, remove
             pass
 
-        if not data:
+        if data is None:
             vlans = self.get_vlans()
+        else:
+            vlans = data
         objs = []
         for vlan_id, vlan_config in vlans.items():
             obj = self.render_config(self.generated_spec, vlan_config)
@@ -67,7 +65,7 @@ class VlansFacts(object):
         ansible_facts['ansible_network_resources'].pop('vlans', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             facts['vlans'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -93,19 +91,29 @@ class VlansFacts(object):
             config['description'] = None
         return utils.remove_empties(config)
 
-    def get_vlans(self):
-        """Get all the l2_interfaces available in chassis"""
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        interfaces = {}
-        if "openconfig-interfaces:interfaces" in response[0][1]:
-            interfaces = response[0][1].get("openconfig-interfaces:interfaces", {})
-            if interfaces.get("interface"):
-                interfaces = interfaces['interface']
+    def get_vlans(self, vlan_ids=None):
+        """Get all the l2_interfaces available in chassis
+
+        :param vlan_ids: if given, get only the VLANs with these IDs
+        """
+        if vlan_ids is not None:
+            requests = [{"path": "data/openconfig-interfaces:interfaces/interface=Vlan%s" % vlan_id, "method": GET,
+                         "query": {"content": "config"}} for vlan_id in vlan_ids]
+            interfaces = []
+            for value in get_existing_resources(self._module, requests):
+                interfaces.extend(value.get("openconfig-interfaces:interface", []))
+        else:
+            request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET, "query": {"content": "config"}}]
+            try:
+                response = edit_config(self._module, to_request(self._module, request))
+            except ConnectionError as exc:
+                self._module.fail_json(msg=str(exc), code=exc.code)
+
+            interfaces = {}
+            if "openconfig-interfaces:interfaces" in response[0][1]:
+                interfaces = response[0][1].get("openconfig-interfaces:interfaces", {})
+                if interfaces.get("interface"):
+                    interfaces = interfaces['interface']
 
         ret_vlan_configs = {}
 
@@ -13,12 +13,11 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vxlans.vxlans import VxlansArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_spec_skeleton,
+    validate_facts
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -35,16 +34,7 @@ class VxlansFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = VxlansArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_spec_skeleton(self.argument_spec, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for vxlans
@@ -74,7 +64,7 @@ class VxlansFacts(object):
         facts = {}
         if objs:
             facts['vxlans'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_facts(self.argument_spec, {'config': objs}, module=self._module)
             if params:
                 facts['vxlans'].extend(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
@@ -159,21 +149,29 @@ class VxlansFacts(object):
         return vxlans_tunnels_vlan_map
 
     def fill_tunnel_source_ip(self, vxlans, vxlan_tunnels, vxlans_evpn_nvo_list):
+        evpn_nvos = {}
+        for nvo_map in vxlans_evpn_nvo_list:
+            evpn_nvos.setdefault(nvo_map['source_vtep'], nvo_map['name'])
+
         for each_tunnel in vxlan_tunnels:
             vxlan = dict()
             vxlan['name'] = each_tunnel['name']
             vxlan['source_ip'] = each_tunnel.get('src_ip', None)
             vxlan['primary_ip'] = each_tunnel.get('primary_ip', None)
             vxlan['evpn_nvo'] = None
-            evpn_nvo = next((nvo_map['name'] for nvo_map in vxlans_evpn_nvo_list if nvo_map['source_vtep'] == vxlan['name']), None)
+            evpn_nvo = evpn_nvos.get(vxlan['name'])
             if evpn_nvo:
                 vxlan['evpn_nvo'] = evpn_nvo
             vxlans.append(vxlan)
 
     def fill_vlan_map(self, vxlans, vxlan_vlan_map):
+        vteps = {}
+        for each_vxlan in vxlans:
+            vteps.setdefault(each_vxlan['name'], each_vxlan)
+
         for each_vlan_map in vxlan_vlan_map:
             name = each_vlan_map['name']
-            matched_vtep = next((each_vxlan for each_vxlan in vxlans if each_vxlan['name'] == name), None)
+            matched_vtep = vteps.get(name)
             if matched_vtep:
                 vni = int(each_vlan_map['vni'])
                 vlan = int(each_vlan_map['vlan'][4:])
@@ -184,17 +182,18 @@ class VxlansFacts(object):
                     matched_vtep['vlan_map'] = [dict({'vni': vni, 'vlan': vlan})]
 
     def fill_vrf_map(self, vxlans, vxlan_vrf_list):
+        # A VNI mapped on several VTEPs is assigned to the last one
+        vni_vteps = {}
+        for each_vxlan in vxlans:
+            for each_vlan in each_vxlan.get('vlan_map', []):
+                vni_vteps[each_vlan['vni']] = each_vxlan
+
         for each_vrf in vxlan_vrf_list:
             vni = each_vrf.get('vni', None)
             if vni is None:
                 continue
 
-            matched_vtep = None
-            for each_vxlan in vxlans:
-                for each_vlan in each_vxlan.get('vlan_map', []):
-                    if vni == each_vlan['vni']:
-                        matched_vtep = each_vxlan
-
+            matched_vtep = vni_vteps.get(vni)
             if matched_vtep:
                 vni = int(each_vrf['vni'])
                 vrf = each_vrf['vrf_name']
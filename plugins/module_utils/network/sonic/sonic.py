@@ -31,6 +31,8 @@ __metaclass__ = type
 
 import json
 import re
+import threading
+from copy import deepcopy
 
 from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
@@ -38,11 +40,19 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     ComplexList
 )
 from ansible.module_utils.connection import Connection, ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, ConfigLine
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, ConfigLine, ignore_line
 
 _DEVICE_CONFIGS = {}
+_REQUEST_CACHE_LOCK = threading.Lock()
 STANDARD_ETH_REGEXP = r"Eth\d+(/\d+)+"
 PATTERN = re.compile(STANDARD_ETH_REGEXP)
+NAME_KEY_RE = re.compile(r"(^|[_-])name$")
+# Keys of the sonic-* lists that are not only their name leaves
+SONIC_LIST_KEYS = {
+    "PORTCHANNEL_MEMBER_LIST": ("name", "ifname"),
+    "VLAN_MEMBER_LIST": ("name", "ifname"),
+    "VXLAN_TUNNEL_MAP_LIST": ("name", "mapname"),
+}
 
 
 def get_connection(module):
@@ -87,10 +97,101 @@ def get_config(module, flags=None):
         return cfg
 
 
+def get_config_sections(module, keys=None, flags=None):
+    """Return the sections of the running config of the top-level lines in
+    keys, the whole running config if keys is None
+
+    The connection indexes the running config, see RunningConfigIndex.
+    """
+    connection = get_connection(module)
+    try:
+        out = connection.get_config_sections(keys=keys, flags=to_list(flags))
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+    return to_text(out, errors="surrogate_then_replace").strip()
+
+
+class RunningConfigIndex(object):
+    """Index of the sections of a running config by their top-level line
+
+    A section is made of a top-level line and the indented lines following
+    it. The lines ignored by NetworkConfig are dropped. The sections of the
+    lines of a candidate config, or of a path of parents, can then be parsed
+    and compared without parsing the rest of the running config.
+    """
+
+    def __init__(self, contents=None):
+        self.contents = None
+        self.keys = []
+        self.sections = {}
+        if contents is not None:
+            self.load(contents)
+
+    def load(self, contents):
+        """Index the contents, unless they are already indexed"""
+        if contents == self.contents:
+            return
+
+        keys = []
+        sections = {}
+        lines = sections.setdefault('', [])
+        for line in contents.splitlines():
+            text = line.strip()
+            if not text or ignore_line(text):
+                continue
+            if not line[0].isspace():
+                if text not in sections:
+                    keys.append(text)
+                    sections[text] = []
+                lines = sections[text]
+            lines.append(line)
+
+        self.contents = contents
+        self.keys = keys
+        self.sections = sections
+
+    def get_text(self, keys=None):
+        """Return the sections of the top-level lines in keys, in the order
+        of the running config, or the whole running config if keys is None
+        """
+        if keys is None:
+            return self.contents
+        keys = set(key.strip() for key in keys)
+        return '\n'.join('\n'.join(self.sections[key]) for key in self.keys if key in keys)
+
+
+class ConfigLineList(list):
+    """List of ConfigLine objects testing the membership of a ConfigLine by
+    its line, as ConfigLine objects are compared, in constant time
+    """
+
+    def __init__(self, *args):
+        super(ConfigLineList, self).__init__(*args)
+        self._lines = None
+        self._lines_count = 0
+
+    def __contains__(self, item):
+        if self._lines is None or self._lines_count != len(self):
+            self._lines = set(config_line.line for config_line in self)
+            self._lines_count = len(self)
+        return item.line in self._lines
+
+
+class IndexedNetworkConfig(NetworkConfig):
+    """NetworkConfig whose items are a ConfigLineList, so that the line match
+    of NetworkConfig.difference against it takes linear time
+    """
+
+    def load(self, s):
+        super(IndexedNetworkConfig, self).load(s)
+        self._items = ConfigLineList(self._items)
+
+
 def get_sublevel_config(running_config, module):
     contents = list()
     current_config_contents = list()
-    running_config = NetworkConfig(contents=running_config, indent=1)
+    section = RunningConfigIndex(running_config).get_text(module.params['parents'][:1])
+    running_config = NetworkConfig(contents=section, indent=1)
     obj = running_config.get_object(module.params['parents'])
     if obj:
         contents = obj.children
@@ -136,9 +237,315 @@ def edit_config(module, commands, skip_code=None):
             if url:
                 request["path"] = update_url(url)
     # End
+    if commands and all(type(request) is dict and request.get("path") for request in commands):
+        return _edit_config_cached(module, connection, commands)
     return connection.edit_config(commands)
 
 
+def _edit_config_cached(module, connection, requests):
+    """Send REST requests, serving GET requests from the per-run cache
+
+    Every module run keeps the responses of the GET requests it has sent,
+    so that fact classes reading the same subtree (e.g. interfaces, vlans,
+    l2_interfaces and l3_interfaces) fetch it only once. Any other request
+    invalidates the cached subtrees it may affect.
+    """
+    cache = get_request_cache(module)
+    if any(not is_get_request(request) for request in requests):
+        for request in requests:
+            if not is_get_request(request):
+                invalidate_request_cache(module, request["path"])
+        # The positions in depends_on would not survive merging requests
+        if get_capabilities(module).get("coalesce_requests") and not is_request_plan(requests):
+            return _edit_config_coalesced(module, connection, requests)
+        return connection.edit_config(requests)
+
+    keys = [get_request_cache_key(request) for request in requests]
+    pending = {}
+    for key, request in zip(keys, requests):
+        if (key not in cache or request.get("bypass_cache")) and key not in pending:
+            pending[key] = request
+
+    if pending:
+        responses = connection.edit_config(list(pending.values()))
+        for key, response in zip(pending, responses):
+            cache[key] = response
+
+    return [deepcopy(cache[key]) for key in keys]
+
+
+def _edit_config_coalesced(module, connection, requests):
+    """Send REST requests, merging consecutive PATCH requests to the same path
+
+    Every request gets the response of the request it was merged into. The
+    number of requests saved is added to the module's count, see
+    get_requests_saved.
+    """
+    coalesced, positions = coalesce_requests(requests)
+    module._sonic_requests_saved = get_requests_saved(module) + len(requests) - len(coalesced)
+    if len(coalesced) == len(requests):
+        return connection.edit_config(requests)
+
+    responses = connection.edit_config(coalesced)
+    return [responses[position] for position in positions]
+
+
+def get_requests_saved(module):
+    """Return the number of requests the module saved by coalescing them"""
+    return getattr(module, "_sonic_requests_saved", 0)
+
+
+def coalesce_requests(requests):
+    """Merge consecutive PATCH requests to the same path into one request
+
+    The payloads are deep-merged, the entries of a YANG list being merged
+    when their keys are the same, see get_list_entry_key. A request is not
+    merged if the keys of one of its lists cannot be found, if it sets a
+    leaf of the merged payload to another value, or if anything but its
+    payload differs from the preceding request, so that the requests that
+    conflict are still sent in order.
+
+    :rtype: A tuple
+    :returns: the requests to send, and for each of the given requests the
+              position of the request it is sent in
+    """
+    coalesced = []
+    positions = []
+    data = None
+    indexes = None
+    for request in requests:
+        if coalesced and is_coalescable(coalesced[-1], request):
+            if data is None:
+                data = deepcopy(coalesced[-1]["data"])
+                indexes = {}
+            try:
+                check_payload_merge(data, request["data"], indexes)
+            except (TypeError, ValueError):
+                pass
+            else:
+                merge_payload(data, request["data"], indexes)
+                coalesced[-1] = dict(coalesced[-1], data=data)
+                positions.append(len(coalesced) - 1)
+                continue
+
+        coalesced.append(request)
+        positions.append(len(coalesced) - 1)
+        data = None
+        indexes = None
+
+    return coalesced, positions
+
+
+def is_coalescable(request, next_request):
+    if (request.get("method") or "").lower() != "patch":
+        return False
+    if not (isinstance(request.get("data"), dict) and isinstance(next_request.get("data"), dict)):
+        return False
+    return (dict((key, value) for key, value in request.items() if key != "data") ==
+            dict((key, value) for key, value in next_request.items() if key != "data"))
+
+
+def get_list_entry_key(entry, name=None):
+    """Return the key identifying a YANG list entry, or a leaf-list value
+
+    The list keys are not known without the YANG models, so they are taken
+    from the naming conventions of the payloads:
+
+    - an entry holding containers follows the openconfig convention, where
+      the list keys are the only leaves outside the containers;
+    - an entry made of leaves only, as in the sonic-* models, is keyed by
+      the keys of its list, given by its name in SONIC_LIST_KEYS, or else
+      by its name leaves, i.e. "name" and the leaves ending with "_name" or
+      "-name".
+
+    Taking fewer leaves than the actual keys is safe, as the entries with
+    different keys then conflict on a key leaf. A TypeError is raised if no
+    key leaf is found, so that the request holding the list is not merged.
+    """
+    if isinstance(entry, dict):
+        leaves = dict((key, value) for key, value in entry.items() if not isinstance(value, (dict, list)))
+        if not any(isinstance(value, dict) for value in entry.values()):
+            list_keys = SONIC_LIST_KEYS.get((name or "").split(":")[-1])
+            if list_keys:
+                leaves = dict((key, value) for key, value in leaves.items() if key in list_keys)
+            else:
+                leaves = dict((key, value) for key, value in leaves.items() if NAME_KEY_RE.search(key))
+        if not leaves:
+            raise TypeError("list entry without key")
+        return frozenset(leaves.items())
+    if isinstance(entry, list):
+        raise TypeError("list of lists")
+    return entry
+
+
+def get_list_entry_index(entries, indexes, name=None):
+    """Index the entries of a payload list by key, keeping the index in indexes"""
+    cached = indexes.get(id(entries))
+    if cached is not None:
+        return cached[0]
+
+    index = {}
+    for position, entry in enumerate(entries):
+        index.setdefault(get_list_entry_key(entry, name), position)
+    # Keep a reference to entries so that its id is not reused.
+    indexes[id(entries)] = (index, entries)
+    return index
+
+
+def check_payload_merge(base, data, indexes, name=None):
+    """Raise a ValueError if data cannot be merged into base
+
+    name is the name of base in its parent, to find the keys of a list.
+    """
+    if isinstance(base, dict) and isinstance(data, dict):
+        for key, value in data.items():
+            if key in base:
+                check_payload_merge(base[key], value, indexes, key)
+    elif isinstance(base, list) and isinstance(data, list):
+        index = get_list_entry_index(base, indexes, name)
+        new_keys = set()
+        for entry in data:
+            key = get_list_entry_key(entry, name)
+            if key in index:
+                check_payload_merge(base[index[key]], entry, indexes)
+            elif key in new_keys:
+                raise ValueError("duplicate list entry")
+            else:
+                new_keys.add(key)
+    elif isinstance(base, (dict, list)) or isinstance(data, (dict, list)) or base != data:
+        raise ValueError("conflicting values")
+
+
+def merge_payload(base, data, indexes, name=None):
+    """Merge data into base, which check_payload_merge accepted"""
+    if isinstance(base, dict):
+        for key, value in data.items():
+            if key in base:
+                merge_payload(base[key], value, indexes, key)
+            else:
+                base[key] = deepcopy(value)
+    elif isinstance(base, list):
+        index = get_list_entry_index(base, indexes, name)
+        for entry in data:
+            key = get_list_entry_key(entry, name)
+            if key in index:
+                merge_payload(base[index[key]], entry, indexes)
+            else:
+                index[key] = len(base)
+                base.append(deepcopy(entry))
+
+
+class RequestPlan(object):
+    """REST requests declaring the preceding requests each of them must follow
+
+    The requests of a plan are built in an order that is valid when they are
+    sent one at a time, e.g. a parent object before its children, or the
+    delete of an entry before its re-creation. Declaring which preceding
+    requests a request actually depends on lets the httpapi plugin send
+    independent branches concurrently when its max_workers option is above
+    1, and skip only the requests depending on a failed one.
+
+    The position of a request in the plan is its position in the list sent
+    by edit_config, so the list must be sent whole and unchanged.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __len__(self):
+        return len(self.requests)
+
+    def add(self, request, depends_on=None):
+        """Add a request following the requests at the positions in depends_on
+
+        A request added without depends_on follows all the preceding requests.
+
+        :rtype: int
+        :returns: the position of the request, to list in the depends_on
+                  of the requests following it
+        """
+        request = dict(request)
+        if depends_on is not None:
+            request["depends_on"] = sorted(set(depends_on))
+        self.requests.append(request)
+        return len(self.requests) - 1
+
+    def extend(self, requests, depends_on=()):
+        """Add requests independent of each other, see add
+
+        :rtype: list
+        :returns: the positions of the requests
+        """
+        return [self.add(request, depends_on) for request in requests]
+
+
+def is_request_plan(requests):
+    """Whether any of the requests declares its dependencies, see RequestPlan"""
+    return any(request.get("depends_on") is not None for request in requests)
+
+
+def is_get_request(request):
+    return (request.get("method") or "").lower() == "get"
+
+
+def get_request_cache(module):
+    # Facts collectors may run concurrently and must share one cache
+    with _REQUEST_CACHE_LOCK:
+        if not hasattr(module, "_sonic_request_cache"):
+            module._sonic_request_cache = {}
+    return module._sonic_request_cache
+
+
+def get_request_cache_key(request):
+    key = request["path"].strip("/")
+    query = request.get("query")
+    if query:
+        key += "?" + "&".join("%s=%s" % (k, v) for k, v in sorted(query.items()) if v is not None)
+    return key
+
+
+def invalidate_request_cache(module, path):
+    """Drop the cached GET responses a write to 'path' may have changed
+
+    An entry survives only if it belongs to the same YANG module as the
+    written path and neither path is a prefix of the other. Entries of other
+    YANG modules are dropped as well, because the openconfig and sonic
+    models are views of the same device tables.
+    """
+    invalidate_cached_responses(get_request_cache(module), path)
+
+
+def invalidate_cached_responses(cache, path):
+    """Drop the entries of a response cache a write to 'path' may have changed
+
+    The cache maps the keys built by get_request_cache_key to responses. It
+    is shared with the httpapi plugin, which keeps such a cache across tasks.
+    """
+    path = path.strip("/")
+    root = path.split("/")[:2]
+    for key in list(cache):
+        key_path = key.split("?")[0]
+        if key_path.split("/")[:2] != root or key_path.startswith(path) or path.startswith(key_path):
+            del cache[key]
+
+
+def flush_cache(module):
+    """Drop every device response cached for the module and its connection
+
+    Besides the per-run caches, this flushes the cache the persistent
+    connection keeps across tasks when its response_cache (httpapi) or
+    config_cache (cliconf) option is enabled.
+    """
+    _DEVICE_CONFIGS.clear()
+    with _REQUEST_CACHE_LOCK:
+        module._sonic_request_cache = {}
+    connection = get_connection(module)
+    try:
+        return connection.flush_cache()
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+
+
 def update_url(url):
     match = re.search(STANDARD_ETH_REGEXP, url)
     ret_url = url
@@ -150,5 +557,7 @@ def update_url(url):
 
 
 def to_request(module, requests):
-    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict')), module)
+    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict'), query=dict(type='dict'),
+                                 independent=dict(type='bool'), bypass_cache=dict(type='bool'),
+                                 depends_on=dict(type='list'), label=dict()), module)
     return transform(to_list(requests))
@@ -29,7 +29,8 @@ afi_safi_types_map = {
     'openconfig-bgp-types:L2VPN_EVPN': 'l2vpn_evpn',
 }
 GET = "get"
-network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
+network_instances_path = '/data/openconfig-network-instance:network-instances'
+network_instance_path = network_instances_path + '/network-instance'
 protocol_bgp_path = 'protocols/protocol=BGP,bgp/bgp'
 
 
@@ -52,18 +53,54 @@ def get_all_vrfs(module):
     return all_vrfs
 
 
-def get_peergroups(module, vrf_name):
-    peer_groups = []
-    request_path = '%s=%s/protocols/protocol=BGP,bgp/bgp/peer-groups' % (network_instance_path, vrf_name)
-    request = {"path": request_path, "method": GET}
+def get_bgp_snapshot(module):
+    """Get the BGP configuration of all the network instances in one request
+
+    The bgp, bgp_af, bgp_neighbors and bgp_neighbors_af facts are all parsed
+    from this snapshot. The response is kept in the per-run request cache,
+    so that these facts share a single request.
+
+    Only the configuration is read (content=config), so the 'state'
+    containers are not part of the snapshot. get_bgp_neighbors reads the
+    neighbors again when their timers are needed from the state.
+
+    :rtype: A dictionary
+    :returns: for each network instance name, a dict holding the 'global',
+              'neighbors', 'peer-groups' and 'table-connections' subtrees
+              that are configured
+    """
+    request = {"path": network_instances_path, "method": GET, "query": {"content": "config"}}
     try:
         response = edit_config(module, to_request(module, request))
     except ConnectionError as exc:
         module.fail_json(msg=str(exc), code=exc.code)
 
-    resp = response[0][1]
-    if 'openconfig-network-instance:peer-groups' in resp:
-        data = resp['openconfig-network-instance:peer-groups']
+    instances = []
+    resp = response[0][1] if response and len(response[0]) > 1 else {}
+    if resp and 'openconfig-network-instance:network-instances' in resp:
+        instances = resp['openconfig-network-instance:network-instances'].get('network-instance', [])
+
+    snapshot = {}
+    for instance in instances:
+        instance_data = {}
+        for protocol in instance.get('protocols', {}).get('protocol', []):
+            if protocol.get('identifier', '').endswith('BGP') and 'bgp' in protocol:
+                for key in ('global', 'neighbors', 'peer-groups'):
+                    if key in protocol['bgp']:
+                        instance_data[key] = protocol['bgp'][key]
+        if 'table-connections' in instance:
+            instance_data['table-connections'] = instance['table-connections']
+        snapshot[instance['name']] = instance_data
+
+    return snapshot
+
+
+def get_peergroups(module, vrf_name, snapshot=None):
+    peer_groups = []
+    if snapshot is None:
+        snapshot = get_bgp_snapshot(module)
+    data = snapshot.get(vrf_name, {}).get('peer-groups')
+    if data:
         if 'peer-group' in data:
             for peer_group in data['peer-group']:
                 pg = {}
@@ -285,17 +322,12 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
     """Get all BGP Global Address Family Redistribute configurations available in chassis"""
     all_af_redis_data = []
     ret_redis_data = []
+    snapshot = get_bgp_snapshot(module) if vrfs else {}
     for vrf_name in vrfs:
         af_redis_data = {}
-        request_path = '%s=%s/table-connections' % (network_instance_path, vrf_name)
-        request = {"path": request_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        if "openconfig-network-instance:table-connections" in response[0][1]:
-            af_redis_data.update({vrf_name: response[0][1]['openconfig-network-instance:table-connections']})
+        table_connections = snapshot.get(vrf_name, {}).get('table-connections')
+        if table_connections is not None:
+            af_redis_data.update({vrf_name: table_connections})
 
         if af_redis_data:
             all_af_redis_data.append(af_redis_data)
@@ -326,18 +358,13 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
 def get_all_bgp_globals(module, vrfs):
     """Get all BGP configurations available in chassis"""
     all_bgp_globals = []
+    snapshot = get_bgp_snapshot(module) if vrfs else {}
     for vrf_name in vrfs:
-        get_path = '%s=%s/%s/global' % (network_instance_path, vrf_name, protocol_bgp_path)
-        request = {"path": get_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-        for resp in response:
-            if "openconfig-network-instance:global" in resp[1]:
-                bgp_data = {'global': resp[1].get("openconfig-network-instance:global", {})}
-                bgp_data.update({'vrf_name': vrf_name})
-                all_bgp_globals.append(bgp_data)
+        bgp_global = snapshot.get(vrf_name, {}).get('global')
+        if bgp_global is not None:
+            bgp_data = {'global': bgp_global}
+            bgp_data.update({'vrf_name': vrf_name})
+            all_bgp_globals.append(bgp_data)
     return all_bgp_globals
 
 
@@ -475,23 +502,28 @@ def get_bgp_af_data(module, af_params_map):
     return objs
 
 
-def get_bgp_as(module, vrf_name):
+def get_bgp_as(module, vrf_name, snapshot=None):
     as_val = None
-    get_path = '%s=%s/%s/global/config' % (network_instance_path, vrf_name, protocol_bgp_path)
-    request = {"path": get_path, "method": GET}
-    try:
-        response = edit_config(module, to_request(module, request))
-    except ConnectionError as exc:
-        module.fail_json(msg=str(exc), code=exc.code)
-
-    resp = response[0][1]
-    if "openconfig-network-instance:config" in resp and 'as' in resp['openconfig-network-instance:config']:
-        as_val = resp['openconfig-network-instance:config']['as']
+    if snapshot is None:
+        snapshot = get_bgp_snapshot(module)
+    bgp_global = snapshot.get(vrf_name, {}).get('global', {})
+    if 'config' in bgp_global and 'as' in bgp_global['config']:
+        as_val = bgp_global['config']['as']
     return as_val
 
 
-def get_bgp_neighbors(module, vrf_name):
-    neighbors_data = None
+def get_bgp_neighbors(module, vrf_name, snapshot=None):
+    if snapshot is None:
+        snapshot = get_bgp_snapshot(module)
+    neighbors_data = snapshot.get(vrf_name, {}).get('neighbors')
+    if not neighbors_data:
+        return neighbors_data
+
+    # The timers of a neighbor without configured timers are read from their
+    # state, which is not in the snapshot; read the neighbors with it then.
+    if all('config' in neighbor.get('timers', {}) for neighbor in neighbors_data.get('neighbor', [])):
+        return neighbors_data
+
     get_path = '%s=%s/%s/neighbors' % (network_instance_path, vrf_name, protocol_bgp_path)
     request = {"path": get_path, "method": GET}
     try:
@@ -499,29 +531,31 @@ def get_bgp_neighbors(module, vrf_name):
     except ConnectionError as exc:
         module.fail_json(msg=str(exc), code=exc.code)
 
-    resp = response[0][1]
-    if "openconfig-network-instance:neighbors" in resp:
+    resp = response[0][1] if response and len(response[0]) > 1 else {}
+    if resp and 'openconfig-network-instance:neighbors' in resp:
         neighbors_data = resp['openconfig-network-instance:neighbors']
 
     return neighbors_data
 
 
-def get_all_bgp_neighbors(module):
+def get_all_bgp_neighbors(module, snapshot=None):
     vrf_list = get_all_vrfs(module)
     """Get all BGP neighbor configurations available in chassis"""
     all_bgp_neighbors = []
+    if snapshot is None and vrf_list:
+        snapshot = get_bgp_snapshot(module)
 
     for vrf_name in vrf_list:
         neighbors_cfg = {}
 
-        bgp_as = get_bgp_as(module, vrf_name)
+        bgp_as = get_bgp_as(module, vrf_name, snapshot)
         if bgp_as:
             neighbors_cfg['bgp_as'] = bgp_as
             neighbors_cfg['vrf_name'] = vrf_name
         else:
             continue
 
-        neighbors = get_bgp_neighbors(module, vrf_name)
+        neighbors = get_bgp_neighbors(module, vrf_name, snapshot)
         if neighbors:
             neighbors_cfg['neighbors'] = neighbors
 
@@ -13,27 +13,69 @@ __metaclass__ = type
 import re
 import json
 import ast
-from copy import copy
+import random
+import threading
+from copy import copy, deepcopy
 from itertools import (count, groupby)
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
-    remove_empties
+    generate_dict,
+    remove_empties,
+    validate_config
 )
 from ansible.module_utils.common.network import (
     is_masklen,
     to_netmask,
 )
-from ansible.module_utils.common.validation import check_required_arguments
+from ansible.module_utils.common.validation import (
+    check_required_arguments,
+    check_type_bits,
+    check_type_bool,
+    check_type_bytes,
+    check_type_dict,
+    check_type_float,
+    check_type_int,
+    check_type_jsonarg,
+    check_type_list,
+    check_type_path,
+    check_type_raw,
+    check_type_str
+)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
 )
 from ansible.module_utils.connection import ConnectionError
 
+try:
+    from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+    HAS_ARG_SPEC_VALIDATOR = True
+except ImportError:
+    HAS_ARG_SPEC_VALIDATOR = False
+
 DEFAULT_TEST_KEY = {'config': {'name': ''}}
 GET = 'get'
+# RESTCONF error-tag values of a list entry the device rejects, see RFC 8040
+ENTRY_ERROR_TAGS = frozenset(('invalid-value', 'bad-attribute', 'bad-element', 'unknown-attribute',
+                              'unknown-element', 'data-exists'))
+TYPE_CHECKERS = {
+    'bits': check_type_bits,
+    'bool': check_type_bool,
+    'bytes': check_type_bytes,
+    'dict': check_type_dict,
+    'float': check_type_float,
+    'int': check_type_int,
+    'jsonarg': check_type_jsonarg,
+    'json': check_type_jsonarg,
+    'list': check_type_list,
+    'path': check_type_path,
+    'raw': check_type_raw,
+    'str': check_type_str
+}
 
 intf_naming_mode = ""
+spec_skeletons = {}
+validation_lock = threading.Lock()
 
 
 def remove_matching_defaults(root, default_entry):
@@ -57,14 +99,16 @@ def get_diff(base_data, compare_with_data, test_keys=None, is_skeleton=None):
         is_skeleton = False
 
     test_keys = normalize_testkeys(test_keys)
+    hash_cache = {}
 
     if isinstance(base_data, list) and isinstance(compare_with_data, list):
-        dict_diff = get_diff_dict({"config": base_data}, {"config": compare_with_data}, test_keys, is_skeleton)
+        dict_diff = get_diff_dict({"config": base_data}, {"config": compare_with_data}, test_keys, is_skeleton,
+                                  hash_cache)
         diff = dict_diff.get("config", [])
 
     else:
         new_base, new_compare = convert_dict_to_single_entry_list(base_data, compare_with_data, test_keys)
-        diff = get_diff_dict(new_base, new_compare, test_keys, is_skeleton)
+        diff = get_diff_dict(new_base, new_compare, test_keys, is_skeleton, hash_cache)
         if diff:
             diff = convert_single_entry_list_to_dict(diff)
         else:
@@ -73,13 +117,16 @@ def get_diff(base_data, compare_with_data, test_keys=None, is_skeleton=None):
     return diff
 
 
-def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None):
+def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None, hash_cache=None):
     if is_skeleton is None:
         is_skeleton = False
 
     if test_keys is None:
         test_keys = []
 
+    if hash_cache is None:
+        hash_cache = {}
+
     if not base_data:
         return base_data
 
@@ -98,11 +145,11 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
                 if isinstance(base_data[key], dict):
                     val_dict = remove_empties(base_data[key])
                     if val_dict:
-                        changed_dict[key] = remove_empties(base_data[key])
+                        changed_dict[key] = val_dict
                 elif isinstance(base_data[key], list):
                     val_list = remove_empties_from_list(base_data[key])
                     if val_list:
-                        changed_dict[key] = remove_empties_from_list(base_data[key])
+                        changed_dict[key] = val_list
                 else:
                     changed_dict[key] = base_data[key]
     for key in intersect_set:
@@ -114,38 +161,44 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
             keys_to_compare = next((test_key_item[key] for test_key_item in test_keys if key in test_key_item), None)
             changed_list = []
             if p_list and d_list:
+                d_index = None
+                d_values = None
+                d_hashes = None
+                if keys_to_compare:
+                    remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
+                    d_index = get_list_index(d_list, keys_to_compare)
                 for p_list_item in p_list:
                     matched = False
                     has_diff = False
-                    for d_list_item in d_list:
-                        if (isinstance(p_list_item, dict) and isinstance(d_list_item, dict)):
-                            if keys_to_compare:
-                                key_matched_cnt = 0
-                                test_keys_present_cnt = 0
-                                common_keys = set(p_list_item).intersection(d_list_item)
+                    if isinstance(p_list_item, dict) and keys_to_compare:
+                        d_list_item = find_keyed_list_item(p_list_item, d_list, keys_to_compare, d_index)
+                        if d_list_item is not None:
+                            dict_diff = get_diff_dict(p_list_item, d_list_item, remaining_keys, is_skeleton, hash_cache)
+                            matched = True
+                            if dict_diff:
+                                has_diff = True
                                 for test_key in keys_to_compare:
-                                    if test_key in common_keys:
-                                        test_keys_present_cnt += 1
-                                        if p_list_item[test_key] == d_list_item[test_key]:
-                                            key_matched_cnt += 1
-                                if key_matched_cnt and key_matched_cnt == test_keys_present_cnt:
-                                    remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
-                                    dict_diff = get_diff_dict(p_list_item, d_list_item, remaining_keys, is_skeleton)
+                                    dict_diff.update({test_key: p_list_item[test_key]})
+                    elif isinstance(p_list_item, dict):
+                        # An item found unchanged has no difference, except
+                        # in a skeleton diff, where its unset options count.
+                        if not is_skeleton:
+                            if d_hashes is None:
+                                d_hashes = get_hash_index(d_list, hash_cache)
+                            matched = find_equal_item(p_list_item, d_hashes, test_keys, hash_cache) is not None
+                        if not matched:
+                            for d_list_item in d_list:
+                                if isinstance(d_list_item, dict) and not get_diff_dict(p_list_item, d_list_item, test_keys,
+                                                                                       is_skeleton, hash_cache):
                                     matched = True
-                                    if dict_diff:
-                                        has_diff = True
-                                        for test_key in keys_to_compare:
-                                            dict_diff.update({test_key: p_list_item[test_key]})
                                     break
-                            else:
-                                dict_diff = get_diff_dict(p_list_item, d_list_item, test_keys, is_skeleton)
-                                if not dict_diff:
-                                    matched = True
-                                    break
-                        else:
-                            if p_list_item == d_list_item:
-                                matched = True
-                                break
+                    else:
+                        if d_values is None:
+                            d_values = get_hashable_items(d_list)
+                        try:
+                            matched = p_list_item in d_values
+                        except TypeError:
+                            matched = p_list_item in d_list
                     if not matched:
                         if is_skeleton:
                             changed_list.append(p_list_item)
@@ -168,7 +221,7 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
             elif p_list and (not d_list):
                 changed_dict[key] = p_list
         elif (isinstance(value, dict) and isinstance(compare_with_data[key], dict)):
-            dict_diff = get_diff_dict(base_data[key], compare_with_data[key], test_keys, is_skeleton)
+            dict_diff = get_diff_dict(base_data[key], compare_with_data[key], test_keys, is_skeleton, hash_cache)
             if dict_diff:
                 changed_dict[key] = dict_diff
         elif value is not None:
@@ -178,6 +231,192 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
     return changed_dict
 
 
+def get_list_index(items, keys):
+    """Index the dict items of a list by the values of their test keys
+
+    :rtype: A dictionary
+    :returns: the first item for each tuple of test key values, None if an
+              item lacks one of the keys or has an unhashable key value, in
+              which case the items must be matched by scanning the list
+    """
+    index = {}
+    for item in items:
+        if isinstance(item, dict):
+            try:
+                index.setdefault(tuple(item[test_key] for test_key in keys), item)
+            except (KeyError, TypeError):
+                return None
+    return index
+
+
+def find_keyed_list_item(item, items, keys, index=None):
+    """Find the first of items whose test keys match those of item
+
+    Only the test keys present in both dicts are compared, and at least one
+    of them must be present. The index from get_list_index is used when
+    item has all the test keys, otherwise the items are scanned.
+    """
+    if index is not None:
+        try:
+            return index.get(tuple(item[test_key] for test_key in keys))
+        except (KeyError, TypeError):
+            pass
+
+    for list_item in items:
+        if isinstance(list_item, dict):
+            key_matched_cnt = 0
+            test_keys_present_cnt = 0
+            for test_key in keys:
+                if test_key in item and test_key in list_item:
+                    test_keys_present_cnt += 1
+                    if item[test_key] == list_item[test_key]:
+                        key_matched_cnt += 1
+            if key_matched_cnt and key_matched_cnt == test_keys_present_cnt:
+                return list_item
+    return None
+
+
+def get_hashable_items(items):
+    hashable_items = set()
+    for item in items:
+        try:
+            hashable_items.add(item)
+        except TypeError:
+            pass
+    return hashable_items
+
+
+def get_config_hash(conf, hash_cache=None):
+    """Return the structural hash of a configuration
+
+    Dict entries whose value is None are left out, so that configurations
+    that differ only by unset options have the same hash. The hash of each
+    dict and list is kept in hash_cache, by object id, so that a subtree is
+    hashed once however many times it is compared. A TypeError is raised if
+    the configuration holds an unhashable value other than a dict or list.
+    """
+    if not isinstance(conf, (dict, list)):
+        return hash(conf)
+
+    if hash_cache is not None:
+        cached = hash_cache.get(id(conf))
+        if cached is not None:
+            return cached[0]
+
+    if isinstance(conf, dict):
+        conf_hash = hash(frozenset((key, get_config_hash(value, hash_cache) if isinstance(value, (dict, list)) else value)
+                                   for key, value in conf.items() if value is not None))
+    else:
+        conf_hash = hash(tuple(get_config_hash(item, hash_cache) if isinstance(item, (dict, list)) else item
+                               for item in conf))
+
+    if hash_cache is not None:
+        # Keep a reference to conf so that its id is not reused.
+        hash_cache[id(conf)] = (conf_hash, conf)
+    return conf_hash
+
+
+def is_equal(want, have, hash_cache=None):
+    """Check whether two configurations are the same
+
+    Dict entries whose value is None are ignored, so a configuration that
+    only sets some of the options of a list entry to None is the same as
+    the one that leaves them out. Config classes can call it before
+    generating any request, since there is nothing to change when the
+    desired configuration is the same as the existing one.
+
+    :param hash_cache: dict in which structural hashes are kept across
+                       calls. When given, the hashes are compared first, so
+                       that configurations compared repeatedly are told
+                       apart without walking them.
+    :rtype: A boolean
+    :returns: True if want and have hold the same configuration
+    """
+    if hash_cache is not None:
+        try:
+            if get_config_hash(want, hash_cache) != get_config_hash(have, hash_cache):
+                return False
+        except TypeError:
+            pass
+    return is_equal_config(want, have)
+
+
+def is_equal_config(want, have, test_keys=None):
+    """Compare two configurations, ignoring dict entries set to None
+
+    When test_keys are given, the configurations are only reported equal if
+    get_diff finds no difference between them, which also requires the dict
+    items of each list with test keys to have all the test keys, with
+    distinct values, since get_diff cannot match the list items otherwise.
+    """
+    if isinstance(want, dict):
+        if not isinstance(have, dict):
+            return False
+        want_keys = set(key for key, value in want.items() if value is not None)
+        have_keys = set(key for key, value in have.items() if value is not None)
+        if want_keys != have_keys:
+            return False
+        for key in want_keys:
+            item_test_keys = test_keys
+            if test_keys is not None and isinstance(want[key], list):
+                keys = get_test_keys(key, test_keys)
+                if keys:
+                    if not (has_distinct_test_keys(want[key], keys) and has_distinct_test_keys(have[key], keys)):
+                        return False
+                    item_test_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
+            if not is_equal_config(want[key], have[key], item_test_keys):
+                return False
+        return True
+
+    if isinstance(want, list):
+        if not isinstance(have, list) or len(want) != len(have):
+            return False
+        # A list item of a list is only found by get_diff if it is the
+        # same, None values included.
+        return all(want_item == have_item if isinstance(want_item, list) else is_equal_config(want_item, have_item, test_keys)
+                   for want_item, have_item in zip(want, have))
+
+    if isinstance(have, (dict, list)):
+        return False
+    return want == have
+
+
+def has_distinct_test_keys(items, keys):
+    if not isinstance(items, list):
+        return False
+    index = get_list_index(items, keys)
+    return index is not None and len(index) == len([item for item in items if isinstance(item, dict)])
+
+
+def get_hash_index(items, hash_cache):
+    """Index the dict items of a list by their structural hash
+
+    :rtype: A dictionary
+    :returns: the items for each hash, None if an item cannot be hashed
+    """
+    index = {}
+    try:
+        for item in items:
+            if isinstance(item, dict):
+                index.setdefault(get_config_hash(item, hash_cache), []).append(item)
+    except TypeError:
+        return None
+    return index
+
+
+def find_equal_item(item, index, test_keys, hash_cache):
+    """Find an item of a get_hash_index index that get_diff finds unchanged"""
+    if index:
+        try:
+            item_hash = get_config_hash(item, hash_cache)
+        except TypeError:
+            return None
+        for index_item in index.get(item_hash, []):
+            if is_equal_config(item, index_item, test_keys):
+                return index_item
+    return None
+
+
 def convert_dict_to_single_entry_list(base_data, compare_with_data, test_keys):
     # if it is dict comparision convert dict into single entry list by adding 'config' as key
     new_base = {'config': [base_data]}
@@ -218,6 +457,134 @@ def normalize_testkeys(test_keys):
     return test_keys
 
 
+def get_test_keys(key, test_keys):
+    return next((test_key_item[key] for test_key_item in test_keys if key in test_key_item), None)
+
+
+def get_new_config(commands, have, test_keys=None):
+    """Derive the configuration that results from applying commands to have
+
+    The commands are those reported to the user, each annotated with its
+    'state' by update_states. A 'deleted' command removes the attributes
+    it specifies, or the whole list entry when it specifies only the test
+    keys of the entry. Commands of any other state are merged into the
+    configuration.
+    """
+    test_keys = normalize_testkeys(test_keys)
+    new_conf = {'config': deepcopy(have) if have else []}
+    for command in commands:
+        command = dict(command)
+        state = command.pop('state', 'merged')
+        if state == 'deleted':
+            delete_config(new_conf, {'config': [command]}, test_keys)
+        else:
+            merge_config(new_conf, {'config': [command]}, test_keys)
+
+    return new_conf.get('config', [])
+
+
+def find_list_item(items, item, keys):
+    for list_item in items:
+        if isinstance(list_item, dict) and all(list_item.get(key) == item.get(key) for key in keys):
+            return list_item
+    return None
+
+
+def merge_config(conf, command, test_keys):
+    for key, value in command.items():
+        if value is None:
+            continue
+        existing = conf.get(key)
+        if isinstance(value, dict) and isinstance(existing, dict):
+            merge_config(existing, value, test_keys)
+        elif isinstance(value, list) and isinstance(existing, list):
+            keys = get_test_keys(key, test_keys)
+            for item in value:
+                match = None
+                if isinstance(item, dict) and keys:
+                    match = find_list_item(existing, item, keys)
+                    if match is not None:
+                        merge_config(match, item, test_keys)
+                        continue
+                if item not in existing:
+                    existing.append(deepcopy(item))
+        else:
+            conf[key] = deepcopy(value)
+
+
+def delete_config(conf, command, test_keys, key_names=()):
+    for key, value in command.items():
+        if value is None or key in key_names or conf.get(key) is None:
+            continue
+        existing = conf[key]
+        if isinstance(value, dict) and isinstance(existing, dict):
+            delete_config(existing, value, test_keys)
+            if not existing:
+                conf.pop(key)
+        elif isinstance(value, list) and isinstance(existing, list):
+            keys = get_test_keys(key, test_keys)
+            for item in value:
+                if isinstance(item, dict) and keys:
+                    match = find_list_item(existing, item, keys)
+                    if match is None:
+                        continue
+                    if all(item_key in keys for item_key, item_value in item.items() if item_value is not None):
+                        existing.remove(match)
+                    else:
+                        delete_config(match, item, test_keys, keys)
+                elif item in existing:
+                    existing.remove(item)
+            if not existing:
+                conf.pop(key)
+        else:
+            conf.pop(key)
+
+
+def check_option_range(module, name, minimum=None, maximum=None):
+    """Fail the module if the value of the option is out of the range
+
+    :param name: the name of the option, not checked if it is not set
+    :param minimum: the lowest valid value, None for no lower bound
+    :param maximum: the highest valid value, None for no upper bound
+    """
+    value = module.params.get(name)
+    if value is None:
+        return
+
+    if maximum is None:
+        if value < minimum:
+            module.fail_json(msg='{0} must be at least {1}, got {2}'.format(name, minimum, value))
+    elif minimum is None:
+        if value > maximum:
+            module.fail_json(msg='{0} must be at most {1}, got {2}'.format(name, maximum, value))
+    elif not minimum <= value <= maximum:
+        module.fail_json(msg='{0} must be between {1} and {2}, got {3}'.format(name, minimum, maximum, value))
+
+
+def get_verified_after(module, derived_config, get_config, test_keys=None, warnings=None):
+    """Return the 'after' configuration selected by the 'verify_after' option
+
+    :param derived_config: the configuration derived with get_new_config,
+                           None if it cannot be derived for the commands sent
+    :param get_config: function reading the configuration from the device
+    :rtype: A list
+    :returns: the derived or the device configuration
+    """
+    verify_after = module.params.get('verify_after') or 'always'
+    if derived_config is None or verify_after == 'always':
+        return get_config()
+
+    if verify_after == 'sampled' and random.random() < module.params['verify_after_rate']:
+        device_config = get_config()
+        if get_diff(derived_config, device_config, test_keys) or get_diff(device_config, derived_config, test_keys):
+            if warnings is not None:
+                warnings.append('The derived after configuration does not match the device configuration, '
+                                'returning the device configuration')
+        return device_config
+
+    return derived_config
+
+
 def update_states(commands, state):
     ret_list = list()
     if commands:
@@ -365,6 +732,29 @@ def get_device_interface_naming_mode(module):
     return intf_naming_mode
 
 
+def get_existing_resources(module, requests):
+    """Send GET requests for resources that may not exist on the device
+
+    Each request is sent on its own, so that a resource that is not found
+    does not fail the others.
+
+    :rtype: A list
+    :returns: the response values of the resources found
+    """
+    values = []
+    for request in requests:
+        try:
+            response = edit_config(module, to_request(module, request))
+        except ConnectionError as exc:
+            if re.search("code.*404", str(exc)):
+                # 'code': 404, 'error-message': 'Resource not found'
+                continue
+            module.fail_json(msg=str(exc), code=exc.code)
+        if response and len(response[0]) > 1 and response[0][1]:
+            values.append(response[0][1])
+    return values
+
+
 STANDARD_ETH_REGEXP = r"[e|E]th\s*\d+/\d+"
 NATIVE_ETH_REGEXP = r"[e|E]th*\d+$"
 NATIVE_MODE = "native"
@@ -542,6 +932,56 @@ def send_requests(module, requests):
     return reply
 
 
+def is_entry_error(connection_error):
+    """Check if a failed request was rejected for the content of its list entries
+
+    The error must be a RESTCONF error whose error-tags are all entry
+    specific, e.g. 'invalid-value'. Resources not found, limits such as
+    'too-many-elements', and errors of the device or the connection are not.
+    """
+    try:
+        response = ast.literal_eval(connection_error.args[0])
+        errors = response['ietf-restconf:errors']['error']
+    except Exception:
+        return False
+
+    if response.get('code') == 404 or not errors:
+        return False
+    return all(error.get('error-tag') in ENTRY_ERROR_TAGS and error.get('error-app-tag') != 'too-many-elements'
+               for error in errors)
+
+
+def find_rejected_entry(module, entries, get_request):
+    """Find the first list entry of a failed bulk request that the device rejects
+
+    The entries, those of the failed request only, are sent again in halves,
+    get_request returning the request for a list of entries, so that a
+    rejected entry is found with about log2(len(entries)) requests. The
+    requests must be safe to send again, e.g. PATCH requests, and the
+    entries accepted before the rejected one are then configured. The
+    search stops as soon as a request fails with an error that is not
+    specific to its entries, see is_entry_error.
+
+    :rtype: A tuple
+    :returns: the rejected entry and the ConnectionError of its request,
+              or (None, None) if it is not found
+    """
+    while entries:
+        half = entries[:max(len(entries) // 2, 1)]
+        try:
+            edit_config(module, to_request(module, [get_request(half)]))
+        except ConnectionError as exc:
+            if not is_entry_error(exc):
+                return None, None
+            if len(half) == 1:
+                return half[0], exc
+            entries = half
+        else:
+            entries = entries[len(half):]
+
+    return None, None
+
+
 def get_replaced_config(new_conf, exist_conf, test_keys=None):
 
     replace_conf = []
@@ -630,32 +1070,19 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
             e_list = exist_value
             t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
             t_key_set = set()
+            remaining_keys = test_keys
             if t_keys:
                 t_key_set = set(t_keys.keys())
+                remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
 
-            replaced_list = list()
             not_dict_item = False
             dict_no_key_item = False
-            for n_item in n_list:
-                for e_item in e_list:
-                    if (isinstance(n_item, dict) and isinstance(e_item, dict)):
-                        if t_keys:
-                            remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
-                            replaced_dict = get_replaced_config_dict(n_item, e_item,
-                                                                     remaining_keys, t_key_set)
-                        else:
-                            dict_no_key_item = True
-                            break
-
-                        if replaced_dict:
-                            replaced_list.append(replaced_dict)
-                            break
-                    else:
-                        not_dict_item = True
-                        break
-
-                if not_dict_item or dict_no_key_item:
-                    break
+            replaced_list = None
+            if t_keys and all(isinstance(item, dict) for item in n_list) and all(isinstance(item, dict) for item in e_list):
+                replaced_list = get_replaced_list_items_by_index(n_list, e_list, remaining_keys, t_key_set)
+            if replaced_list is None:
+                replaced_list, not_dict_item, dict_no_key_item = get_replaced_list_items_by_scan(n_list, e_list, remaining_keys,
+                                                                                                 t_key_set)
 
             if dict_no_key_item:
                 replaced_list = e_list
@@ -694,6 +1121,92 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
     return replaced_conf
 
 
+def get_replaced_list_items_by_scan(n_list, e_list, remaining_keys, t_key_set):
+    """Match each new list item against the existing list items in turn
+
+    :rtype: A tuple
+    :returns: the replaced existing items, and whether a non-dict item or a
+              dict item without test keys was found, which ends the matching
+    """
+    replaced_list = list()
+    not_dict_item = False
+    dict_no_key_item = False
+    for n_item in n_list:
+        for e_item in e_list:
+            if (isinstance(n_item, dict) and isinstance(e_item, dict)):
+                if t_key_set:
+                    replaced_dict = get_replaced_config_dict(n_item, e_item,
+                                                             remaining_keys, t_key_set)
+                else:
+                    dict_no_key_item = True
+                    break
+
+                if replaced_dict:
+                    replaced_list.append(replaced_dict)
+                    break
+            else:
+                not_dict_item = True
+                break
+
+        if not_dict_item or dict_no_key_item:
+            break
+
+    return replaced_list, not_dict_item, dict_no_key_item
+
+
+def get_replaced_list_items_by_index(n_list, e_list, remaining_keys, t_key_set):
+    """Match the new list items against the existing ones by their test keys
+
+    All the items must be dicts. An existing item can only match a new item
+    if both have the same scalar values for all the test keys, so the
+    existing items are indexed by the tuple of these values and only the
+    items with the same tuple are compared, in list order.
+
+    :rtype: A list
+    :returns: the replaced existing items, None if a test key value is not
+              hashable, in which case the items must be matched by scanning
+    """
+    t_keys = sorted(t_key_set)
+    try:
+        index = dict()
+        for e_item in e_list:
+            index_key = get_scalar_values(e_item, t_keys)
+            if index_key is not None:
+                index.setdefault(index_key, []).append(e_item)
+        n_index_keys = [get_scalar_values(n_item, t_keys) for n_item in n_list]
+    except TypeError:
+        return None
+
+    replaced_list = list()
+    for n_item, index_key in zip(n_list, n_index_keys):
+        if index_key is None:
+            continue
+        for e_item in index.get(index_key, []):
+            replaced_dict = get_replaced_config_dict(n_item, e_item, remaining_keys, t_key_set)
+            if replaced_dict:
+                replaced_list.append(replaced_dict)
+                break
+
+    return replaced_list
+
+
+def get_scalar_values(conf, keys):
+    """Return the tuple of the values of keys in conf
+
+    None is returned if a key is missing, or if its value is empty or not a
+    scalar, since get_replaced_config_dict never matches such keys.
+    """
+    values = []
+    for key in keys:
+        value = conf.get(key)
+        if value in [None, [], {}] or isinstance(value, (list, dict)):
+            return None
+        values.append(value)
+    values = tuple(values)
+    hash(values)
+    return values
+
+
 def check_required(module, required_parameters, parameters, options_context=None):
     '''This utility is a wrapper for the Ansible "check_required_arguments"
     function. The "required_parameters" input list provides a list of
@@ -717,3 +1230,204 @@ def get_ranges_in_list(num_list):
     """
     for key, group in groupby(num_list, lambda num, i=count(): num - next(i)):
         yield list(group)
+
+
+class VlanSet(object):
+    """Set of VLAN IDs, stored as a bitmap in an int
+
+    Union, intersection and difference are single bitwise operations,
+    whatever the number of VLAN IDs, and VLAN ranges are encoded and
+    decoded without expanding them into lists.
+    """
+    __slots__ = ('bits',)
+
+    def __init__(self, bits=0):
+        self.bits = bits
+
+    @classmethod
+    def from_vlans(cls, vlans):
+        """Returns the set of the given VLAN IDs, as ints or strings"""
+        bits = 0
+        for vlan in vlans:
+            bits |= 1 << int(vlan)
+        return cls(bits)
+
+    @classmethod
+    def from_ranges(cls, vlan_ranges, separator='-'):
+        """Returns the set of the VLAN IDs in the given VLAN ranges,
+        e.g. ['1-100', '200'], a range with a start above its end being empty
+        """
+        bits = 0
+        for vlan_range in vlan_ranges:
+            start, _, end = str(vlan_range).partition(separator)
+            start = int(start)
+            end = int(end) if end else start
+            if end >= start:
+                bits |= ((1 << (end - start + 1)) - 1) << start
+        return cls(bits)
+
+    def get_ranges(self):
+        """Returns a generator of the (start, end) bounds of the ranges
+        of consecutive VLAN IDs in the set, in ascending order
+        """
+        bits = self.bits
+        while bits:
+            start = (bits & -bits).bit_length() - 1
+            run = bits >> start
+            # Number of trailing ones in run
+            length = (~run & (run + 1)).bit_length() - 1
+            yield start, start + length - 1
+            bits &= ~(((1 << length) - 1) << start)
+
+    def to_ranges(self, separator='-'):
+        """Returns the VLAN ranges of the set as strings, e.g. ['1-100', '200']"""
+        return [str(start) if start == end else '{0}{1}{2}'.format(start, separator, end)
+                for start, end in self.get_ranges()]
+
+    def __iter__(self):
+        for start, end in self.get_ranges():
+            for vlan in range(start, end + 1):
+                yield vlan
+
+    def __contains__(self, vlan):
+        return bool(self.bits >> int(vlan) & 1)
+
+    def __len__(self):
+        return bin(self.bits).count('1')
+
+    def __bool__(self):
+        return bool(self.bits)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return isinstance(other, VlanSet) and self.bits == other.bits
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __or__(self, other):
+        return VlanSet(self.bits | other.bits)
+
+    def __and__(self, other):
+        return VlanSet(self.bits & other.bits)
+
+    def __sub__(self, other):
+        return VlanSet(self.bits & ~other.bits)
+
+    def __repr__(self):
+        return 'VlanSet({0!r})'.format(self.to_ranges())
+
+
+def get_spec_skeleton(argument_spec, subspec='config', options='options'):
+    """Return the dictionary generated by generate_dict for the options of
+    the argument spec, as the facts classes use it to render the config
+
+    The dictionary is generated once per argument spec and is shared, it is
+    copied before being modified.
+    """
+    key = (id(argument_spec), subspec, options)
+    if key not in spec_skeletons:
+        spec = deepcopy(argument_spec)
+        if subspec:
+            spec = spec[subspec][options] if options else spec[subspec]
+        spec_skeletons[key] = (argument_spec, generate_dict(spec))
+
+    return spec_skeletons[key][1]
+
+
+def validate_facts(argument_spec, data, strict=None, module=None):
+    """Validate the facts in data against the argument spec and return the
+    parameters, as validate_config does
+
+    The facts are read from the device, so by default the values are only
+    converted to the types of their options and the defaults of the missing
+    options are set, without the choices, required and mutually exclusive
+    checks of AnsibleModule. The full validation is used if strict is True,
+    or if a value cannot be converted so that the error is reported as usual.
+    If strict is None, it is read from the strict_facts_validation option of
+    module. A validation error is then reported by the fail_json of module
+    if it is given, else by validate_config.
+
+    The facts collectors may run concurrently and validate_config goes
+    through the process wide module arguments, so the validate_config
+    fallback is serialized by validation_lock.
+    """
+    if strict is None:
+        strict = module is not None and bool(module.params.get('strict_facts_validation'))
+
+    if not strict:
+        try:
+            return get_validated_options(argument_spec, data)
+        except (TypeError, ValueError):
+            pass
+
+    if module is not None and HAS_ARG_SPEC_VALIDATOR:
+        result = ArgumentSpecValidator(argument_spec).validate(data)
+        if result.error_messages:
+            module.fail_json(msg=result.errors.msg)
+        return result.validated_parameters
+
+    with validation_lock:
+        return validate_config(argument_spec, data)
+
+
+def get_validated_options(argument_spec, params):
+    """Return the options of params converted to the types of the argument
+    spec, with the defaults of the missing options set
+
+    TypeError or ValueError is raised for the values that AnsibleModule
+    rejects without checking choices and constraints.
+    """
+    if not isinstance(params, dict):
+        raise TypeError('{0!r} is not a dictionary'.format(params))
+    for name in params:
+        if name not in argument_spec:
+            raise TypeError('Unsupported option {0}'.format(name))
+
+    validated = {}
+    for name, spec in argument_spec.items():
+        default = spec.get('default')
+        if name in params:
+            value = params[name]
+        elif default is None and spec.get('required'):
+            raise TypeError('Missing required option {0}'.format(name))
+        else:
+            value = default
+
+        if value is None and default is None and not spec.get('required'):
+            if spec.get('apply_defaults') and spec.get('options') is not None:
+                value = get_validated_options(spec['options'], {})
+            validated[name] = value
+            continue
+
+        wanted = spec.get('type') or 'str'
+        value = get_type_checker(wanted)(value)
+        elements = spec.get('elements')
+        if elements:
+            if wanted != 'list' or not isinstance(value, list):
+                raise TypeError('Invalid type for the elements of {0}'.format(name))
+            type_checker = get_type_checker(elements)
+            value = [type_checker(element) for element in value]
+
+        options = spec.get('options')
+        if options is not None:
+            if wanted == 'dict':
+                value = get_validated_options(options, value)
+            elif elements == 'dict':
+                value = [get_validated_options(options, element) for element in value]
+
+        validated[name] = value
+
+    return validated
+
+
+def get_type_checker(wanted):
+    """Return the function converting the values of the wanted type"""
+    if callable(wanted):
+        return wanted
+    if wanted not in TYPE_CHECKERS:
+        raise TypeError('Unsupported type {0}'.format(wanted))
+    return TYPE_CHECKERS[wanted]
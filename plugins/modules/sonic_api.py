@@ -110,10 +110,11 @@ def initiate_request(module):
     url = module.params['url']
     body = module.params['body']
     method = module.params['method']
+    # Always read the device, never a response cached by the connection
     if method == "GET" or method == "DELETE":
-        request = to_request(module, [{"path": url, "method": method}])
+        request = to_request(module, [{"path": url, "method": method, "bypass_cache": True}])
     elif method == "PATCH" or method == "PUT" or method == "POST":
-        request = to_request(module, [{"path": url, "method": method, "data": body}])
+        request = to_request(module, [{"path": url, "method": method, "data": body, "bypass_cache": True}])
 
     try:
         response = edit_config(module, request)
@@ -74,8 +74,37 @@ options:
         of the command. If the command does not pass the specified
         conditions, the interval indicates how long to wait before
         trying the command again.
+      - With I(polling=adaptive), it is the wait before the first retry,
+        doubled on each further retry up to I(max_interval).
     type: int
     default: 1
+  polling:
+    description:
+      - Specifies how the commands are re-run while the I(wait_for)
+        conditions are not satisfied.
+      - C(fixed) re-runs all the commands every I(interval) seconds.
+      - C(adaptive) re-runs only the commands used by the conditions that
+        are not satisfied yet. The wait between retries starts at I(interval),
+        doubles on each retry up to I(max_interval) and is randomized
+        between half and all of that value. The time taken by each attempt
+        is returned in I(attempts).
+    type: str
+    default: fixed
+    choices: [ 'fixed', 'adaptive' ]
+    version_added: 2.3.0
+  max_interval:
+    description:
+      - Maximum wait in seconds between retries with I(polling=adaptive).
+    type: int
+    default: 30
+    version_added: 2.3.0
+  timeout:
+    description:
+      - Maximum time in seconds to wait for the I(wait_for) conditions with
+        I(polling=adaptive). No retry is started after this time, even if
+        I(retries) is not reached.
+    type: int
+    version_added: 2.3.0
 """
 
 EXAMPLES = """
@@ -103,6 +132,19 @@ EXAMPLES = """
         - result[0] contains Dell
         - result[1] contains Hostname
 
+  - name: Waits for the BGP sessions to come up, re-running only the command of the unmet condition
+    dellemc.enterprise_sonic.sonic_command:
+      commands:
+        - 'show version'
+        - 'show bgp ipv4 unicast summary'
+      wait_for:
+        - result[0] contains Dell
+        - result[1] not contains Active
+      polling: adaptive
+      retries: 20
+      max_interval: 30
+      timeout: 600
+
   - name: Runs commands that require answering a prompt
     dellemc.enterprise_sonic.sonic_command:
       commands:
@@ -127,12 +169,23 @@ failed_conditions:
   returned: failed
   type: list
   sample: ['...', '...']
+attempts:
+  description:
+    - The attempts made to satisfy the I(wait_for) conditions with I(polling=adaptive).
+    - Each attempt holds the indexes of the commands run, the time in seconds
+      taken to run them and the wait in seconds before the next attempt.
+  returned: when I(polling=adaptive) and I(wait_for) are set
+  type: list
+  sample: [{'commands': [0, 1], 'elapsed': 0.42, 'wait': 0.8}, {'commands': [1], 'elapsed': 0.21, 'wait': 0}]
+  version_added: 2.3.0
 warnings:
   description: The list of warnings (if any) generated by module based on arguments.
   returned: always
   type: list
   sample: ['...', '...']
 """
+import random
+import re
 import time
 
 from ansible.module_utils._text import to_text
@@ -171,6 +224,69 @@ def parse_commands(module, warnings):
     return commands
 
 
+RESULT_INDEX_RE = re.compile(r"^result\[(\d+)\]")
+
+
+def get_conditional_commands(conditional, command_count):
+    """Returns the indexes of the commands whose output the conditional reads
+    """
+    match = RESULT_INDEX_RE.match(conditional.key)
+    if match and int(match.group(1)) < command_count:
+        return [int(match.group(1))]
+    return list(range(command_count))
+
+
+def get_backoff_wait(interval, max_interval, attempt):
+    """Returns the jittered exponential wait before the retry after the attempt
+    """
+    wait = min(interval * 2 ** min(attempt, 32), max_interval)
+    return random.uniform(wait / 2.0, wait)
+
+
+def wait_for_adaptive(module, commands, conditionals, match):
+    """Runs the commands until the conditionals are satisfied, re-running
+    only the commands used by the unsatisfied conditionals with an
+    exponential backoff between the attempts
+    """
+    retries = max(module.params['retries'], 1)
+    interval = module.params['interval']
+    max_interval = module.params['max_interval']
+    timeout = module.params['timeout']
+    deadline = None if timeout is None else time.time() + timeout
+
+    responses = [None] * len(commands)
+    indexes = list(range(len(commands)))
+    attempts = list()
+    for attempt in range(retries):
+        start = time.time()
+        for index, response in zip(indexes, run_commands(module, [commands[index] for index in indexes])):
+            responses[index] = response
+        attempts.append({'commands': indexes, 'elapsed': round(time.time() - start, 3), 'wait': 0})
+
+        for item in list(conditionals):
+            if item(responses):
+                if match == 'any':
+                    conditionals = list()
+                    break
+                conditionals.remove(item)
+
+        if not conditionals or attempt == retries - 1:
+            break
+
+        wait = get_backoff_wait(interval, max_interval, attempt)
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            wait = min(wait, remaining)
+        attempts[-1]['wait'] = round(wait, 3)
+        time.sleep(wait)
+
+        indexes = sorted(set(index for item in conditionals for index in get_conditional_commands(item, len(commands))))
+
+    return responses, conditionals, attempts
+
+
 def main():
     """main entry point for module execution
     """
@@ -182,7 +298,10 @@ def main():
         match=dict(default='all', choices=['all', 'any']),
 
         retries=dict(default=10, type='int'),
-        interval=dict(default=1, type='int')
+        interval=dict(default=1, type='int'),
+        polling=dict(default='fixed', choices=['fixed', 'adaptive']),
+        max_interval=dict(default=30, type='int'),
+        timeout=dict(type='int')
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
@@ -203,24 +322,31 @@ def main():
     interval = module.params['interval']
     match = module.params['match']
 
-    while retries > 0:
-        responses = run_commands(module, commands)
-        for item in list(conditionals):
-            if item(responses):
-                if match == 'any':
-                    conditionals = list()
-                    break
-                conditionals.remove(item)
+    if module.params['polling'] == 'adaptive':
+        responses, conditionals, attempts = wait_for_adaptive(module, commands, conditionals, match)
+        if wait_for:
+            result['attempts'] = attempts
+    else:
+        while retries > 0:
+            responses = run_commands(module, commands)
+            for item in list(conditionals):
+                if item(responses):
+                    if match == 'any':
+                        conditionals = list()
+                        break
+                    conditionals.remove(item)
 
-        if not conditionals:
-            break
+            if not conditionals:
+                break
 
-        time.sleep(interval)
-        retries -= 1
+            time.sleep(interval)
+            retries -= 1
 
     if conditionals:
         failed_conditions = [item.raw for item in conditionals]
         msg = 'One or more conditional statements have not been satisfied.'
+        if 'attempts' in result:
+            module.fail_json(msg=msg, failed_conditions=failed_conditions, attempts=result['attempts'])
         module.fail_json(msg=msg, failed_conditions=failed_conditions)
 
     result.update({
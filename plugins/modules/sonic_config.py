@@ -197,6 +197,7 @@ from ansible.module_utils.connection import ConnectionError
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_config, get_sublevel_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_config_sections, IndexedNetworkConfig, RunningConfigIndex
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config, run_commands
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import command_list_str_to_dict
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, dumps
@@ -218,13 +219,31 @@ def get_candidate(module):
     return candidate
 
 
-def get_running_config(module):
+def get_running_config(module, keys=None):
     contents = module.params['config']
     if not contents:
-        contents = get_config(module)
+        contents = get_config_sections(module, keys)
+    elif keys is not None:
+        contents = RunningConfigIndex(contents).get_text(keys)
     return contents
 
 
+def get_section_keys(candidate, parents, match):
+    """Return the top-level lines of the sections of the running config the
+    candidate is compared with, or None to compare it with the whole config
+
+    A line only matches the running config lines with the same parents, so
+    the sections of the top-level lines of the candidate are enough to match
+    its lines. The strict and exact matches compare the positions of the
+    lines, so they need the whole config, except below parents.
+    """
+    if parents:
+        return parents[:1]
+    if match == 'line':
+        return [item.parents[0] if item.parents else item.text for item in candidate.items]
+    return None
+
+
 def main():
 
     backup_spec = dict(
@@ -273,12 +292,12 @@ def main():
     candidate = get_candidate(module)
     if any((module.params['lines'], module.params['src'])):
         if match != 'none':
-            config = get_running_config(module)
+            config = get_running_config(module, get_section_keys(candidate, parents, match))
             if parents:
                 contents = get_sublevel_config(config, module)
-                config = NetworkConfig(contents=contents, indent=1)
+                config = IndexedNetworkConfig(contents=contents, indent=1)
             else:
-                config = NetworkConfig(contents=config, indent=1)
+                config = IndexedNetworkConfig(contents=config, indent=1)
             configobjs = candidate.difference(config, match=match, replace=replace)
         else:
 
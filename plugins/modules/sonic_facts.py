@@ -90,6 +90,31 @@ options:
       - bfd
       - copp
       - route_maps
+  max_workers:
+    description:
+      - Maximum number of network resource facts collectors that run
+        concurrently.
+      - The facts are merged in resource name order, so the result does not
+        depend on this value. All collector failures are reported together.
+      - Concurrent collectors share the persistent connection to the device,
+        which handles one request batch at a time. The gain comes from
+        parsing the responses of one collector while the requests of
+        another are in flight.
+    required: false
+    type: int
+    default: 1
+    version_added: 2.3.0
+  strict_facts_validation:
+    description:
+      - Validate the network resource facts read from the device against
+        all the constraints of their options, e.g. the choices.
+      - By default the facts are only converted to the types of their
+        options, so that a value unknown to the collection is still
+        reported.
+    required: false
+    type: bool
+    default: false
+    version_added: 2.3.0
 """
 
 EXAMPLES = """
@@ -113,6 +138,10 @@ EXAMPLES = """
   dellemc.enterprise_sonic.sonic_facts:
     gather_subset: min
     gather_network_resources: vlans
+- name: Collect all resource facts with up to eight collectors at a time
+  dellemc.enterprise_sonic.sonic_facts:
+    gather_network_resources: all
+    max_workers: 8
 - name: Collect lag_interfaces and minimal default facts
   dellemc.enterprise_sonic.sonic_facts:
     gather_subset: min
@@ -125,6 +154,54 @@ RETURN = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+# The facts modules of all the resources are shipped with this module, see FactsRegistry
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import (  # noqa: F401
+    Lag_interfacesFacts,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import (  # noqa: F401
+    Bgp_neighbors_afFacts,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import (  # noqa: F401
+    Bgp_communitiesFacts,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (  # noqa: F401
+    Bgp_ext_communitiesFacts,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import (  # noqa: F401
+    Acl_interfacesFacts,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts  # noqa: F401
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts  # noqa: F401
 
 
 def main():
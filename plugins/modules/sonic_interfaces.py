@@ -112,6 +112,43 @@ options:
     - overridden
     - deleted
     default: merged
+  verify_after:
+    description:
+      - Specifies how the C(after) configuration is obtained when the configuration changed.
+      - C(always) reads the configuration back from the device.
+      - C(never) derives it from C(before) and the generated commands, without reading the device.
+      - C(sampled) derives it and, in a random fraction I(verify_after_rate) of the runs,
+        reads the configuration back from the device instead. A warning is returned when the
+        two differ.
+      - The configuration is always read back after commands other than C(merged) ones,
+        because the defaults an interface is reset to are only known to the device.
+    type: str
+    choices:
+    - always
+    - never
+    - sampled
+    default: always
+    version_added: 2.3.0
+  verify_after_rate:
+    description:
+      - Fraction of the runs in which the configuration is read back when I(verify_after=sampled).
+      - Must be between 0.0 and 1.0.
+    type: float
+    default: 0.1
+    version_added: 2.3.0
+  facts_scope:
+    description:
+      - Specifies which interfaces are read from the device to compute the changes.
+      - C(all) reads all the interfaces.
+      - C(config) reads only the interfaces specified in I(config), so that C(before) and C(after)
+        include only those. All the interfaces are still read when I(state=overridden), or when
+        I(config) is not specified.
+    type: str
+    choices:
+    - all
+    - config
+    default: all
+    version_added: 2.3.0
 """
 EXAMPLES = """
 # Using deleted
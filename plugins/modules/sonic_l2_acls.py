@@ -224,6 +224,18 @@ options:
       - overridden
       - deleted
     default: merged
+  rules_per_request:
+    description:
+      - Enables the bulk programming of the ACL rules, e.g. for ACLs with thousands of rules.
+      - The rules of an ACL are created by PATCH requests of up to I(rules_per_request) rules,
+        instead of one request per rule.
+      - The rules of an ACL are deleted by a single request when none of its existing rules is kept,
+        otherwise by requests sent concurrently, in runs of up to the I(max_workers) option of the httpapi connection.
+      - When a bulk request fails on a rule the device rejects, the rules of that request are sent again, in halves,
+        to report the sequence number of the rejected rule. The rules of that request accepted before it are then configured.
+      - Must be at least 1.
+    type: int
+    version_added: 2.3.0
 """
 EXAMPLES = """
 # Using merged
@@ -111,6 +111,17 @@ options:
     - overridden
     - replaced
     default: merged
+  prefixes_per_request:
+    description:
+      - Enables the bulk programming of the static routes, for VRFs with thousands of routes.
+      - The routes of each VRF are configured by requests of up to I(prefixes_per_request) prefixes
+        with all their next-hops, instead of one request per next-hop.
+      - The routes deleted from a VRF are deleted by requests sent concurrently, in runs of
+        up to the I(max_workers) option of the httpapi connection, and deleting every route
+        of a VRF deletes them with a single request.
+      - Must be at least 1.
+    type: int
+    version_added: 2.3.0
 """
 EXAMPLES = """
 
@@ -302,6 +313,14 @@ commands:
   returned: always
   type: list
   sample: ['command 1', 'command 2', 'command 3']
+requests_saved:
+  description:
+    - The number of REST requests saved by merging consecutive requests to the same path.
+    - Only reported when the I(coalesce_requests) httpapi option is enabled.
+  returned: when requests were merged
+  type: int
+  sample: 42
+  version_added: 2.3.0
 """
 
 
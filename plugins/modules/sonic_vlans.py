@@ -67,6 +67,51 @@ options:
     - overridden
     - deleted
     default: merged
+  verify_after:
+    description:
+      - Specifies how the C(after) configuration is obtained when the configuration changed.
+      - C(always) reads the configuration back from the device.
+      - C(never) derives it from C(before) and the generated commands, without reading the device.
+      - C(sampled) derives it and, in a random fraction I(verify_after_rate) of the runs,
+        reads the configuration back from the device instead. A warning is returned when the
+        two differ.
+    type: str
+    choices:
+    - always
+    - never
+    - sampled
+    default: always
+    version_added: 2.3.0
+  verify_after_rate:
+    description:
+      - Fraction of the runs in which the configuration is read back when I(verify_after=sampled).
+      - Must be between 0.0 and 1.0.
+    type: float
+    default: 0.1
+    version_added: 2.3.0
+  facts_scope:
+    description:
+      - Specifies which VLANs are read from the device to compute the changes.
+      - C(all) reads all the VLANs.
+      - C(config) reads only the VLANs specified in I(config), so that C(before) and C(after)
+        include only those. All the VLANs are still read when I(state=overridden), or when
+        I(config) is not specified.
+    type: str
+    choices:
+    - all
+    - config
+    default: all
+    version_added: 2.3.0
+  vlans_per_request:
+    description:
+      - Enables the bulk programming of the VLANs, e.g. to provision all 4094 VLANs.
+      - The VLANs are created, with their description, by requests of up to I(vlans_per_request) VLANs,
+        instead of one request per VLAN and one per description.
+      - The VLANs and descriptions are deleted by requests sent concurrently, in runs of
+        up to the I(max_workers) option of the httpapi connection.
+      - Must be at least 1.
+    type: int
+    version_added: 2.3.0
 """
 EXAMPLES = """
 # Using merged
@@ -276,6 +321,14 @@ commands:
   returned: always
   type: list
   sample: ['command 1', 'command 2', 'command 3']
+requests_saved:
+  description:
+    - The number of REST requests saved by merging consecutive requests to the same path.
+    - Only reported when the I(coalesce_requests) httpapi option is enabled.
+  returned: when requests were merged
+  type: int
+  sample: 42
+  version_added: 2.3.0
 """
 
 
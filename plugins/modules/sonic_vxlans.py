@@ -92,6 +92,15 @@ options:
     - replaced
     - overridden
     default: merged
+  maps_per_request:
+    description:
+      - Enables the bulk programming of the VLAN maps, for VTEPs with thousands of VNIs.
+      - The VLAN maps are created by requests of up to I(maps_per_request) maps, instead of one request per map.
+      - Deleting all the VLAN maps uses a single request. Otherwise, the VLAN maps are deleted by requests
+        sent concurrently, in runs of up to the I(max_workers) option of the httpapi connection.
+      - Must be at least 1.
+    type: int
+    version_added: 2.3.0
 """
 EXAMPLES = """
 # Using deleted
@@ -301,6 +310,14 @@ commands:
   returned: always
   type: list
   sample: ['command 1', 'command 2', 'command 3']
+requests_saved:
+  description:
+    - The number of REST requests saved by merging consecutive requests to the same path.
+    - Only reported when the I(coalesce_requests) httpapi option is enabled.
+  returned: when requests were merged
+  type: int
+  sample: 42
+  version_added: 2.3.0
 """
 
 
@@ -36,3 +36,4 @@ class TestSonicInterfacesModule(TestSonicModule):
     def test_sonic_api_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
         result = self.execute_module(changed=True)
+        self.assertTrue(self.edit_config.call_args[0][1][0]['bypass_cache'])
@@ -51,6 +51,10 @@ class TestSonicBgpModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+        # The BGP configuration of all the VRFs is read in a single request
+        facts_paths = set(request['path'] for call in self.utils_edit_config.call_args_list for request in call[0][1])
+        self.assertEqual(facts_paths, set(["/data/openconfig-network-instance:network-instances",
+                                           "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST"]))
 
     # Merge test when neighbor and peer-group are already present in existing config
     def test_sonic_bgp_neighbors_merged_02(self):
@@ -60,6 +64,15 @@ class TestSonicBgpModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    # The timers in the state container only are read from the neighbors with their state
+    def test_sonic_bgp_neighbors_merged_03_state_timers(self):
+        set_module_args(self.fixture_data['merged_03_state_timers']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_state_timers']['existing_bgp_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_state_timers']['expected_config_requests'])
+        result = self.execute_module(changed=False)
+        self.validate_config_requests()
+        self.assertEqual(result['before'], self.fixture_data['merged_03_state_timers']['expected_before'])
+
     def test_sonic_bgp_neighbors_deleted_01(self):
         set_module_args(self.fixture_data['deleted_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_bgp_config'])
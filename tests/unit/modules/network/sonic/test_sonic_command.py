@@ -22,6 +22,9 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_run_commands = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_command.run_commands"
         )
+        cls.mock_time_sleep = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_command.time.sleep"
+        )
         cls.fixture_data = cls.load_fixtures('sonic_command.yaml')
 
     def run_commands_side_effect(self, module, commands):
@@ -34,6 +37,16 @@ class TestSonicInterfacesModule(TestSonicModule):
         # Simulate a dummy return value for the "show version" command that is being unit tested.
         return ['Software Version : dell_sonic_4.x_share.770-0beb2c821\n']
 
+    def device_responses_side_effect(self, module, commands):
+        """Side effect function for run commands mock returning the next response of each command"""
+
+        responses = []
+        for cmd in commands:
+            self.config_commands_sent.append(cmd['command'])
+            command_responses = self.device_responses[cmd['command']]
+            responses.append(command_responses.pop(0) if len(command_responses) > 1 else command_responses[0])
+        return responses
+
     def validate_config_commands(self):
         """Check if both list of requests sent and expected are same"""
 
@@ -47,13 +60,39 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = []
         self.run_commands = self.mock_run_commands.start()
         self.run_commands.side_effect = self.run_commands_side_effect
+        self.sleep = self.mock_time_sleep.start()
 
     def tearDown(self):
         super(TestSonicInterfacesModule, self).tearDown()
         self.mock_run_commands.stop()
+        self.mock_time_sleep.stop()
 
     def test_sonic_commands_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
         self.config_commands_valid = self.fixture_data['merged_01']['expected_command_requests']
         result = self.execute_module(changed=False)
         self.validate_config_commands()
+
+    def test_sonic_commands_adaptive_01(self):
+        set_module_args(self.fixture_data['adaptive_01']['module_args'])
+        self.device_responses = self.fixture_data['adaptive_01']['device_responses']
+        self.run_commands.side_effect = self.device_responses_side_effect
+        self.config_commands_valid = self.fixture_data['adaptive_01']['expected_command_requests']
+        result = self.execute_module(changed=False)
+        self.validate_config_commands()
+        self.assertEqual([attempt['commands'] for attempt in result['attempts']], [[0, 1], [1], [1]])
+        self.assertEqual(len(self.sleep.call_args_list), 2)
+        self.assertTrue(0.5 <= self.sleep.call_args_list[0][0][0] <= 1)
+        self.assertTrue(1 <= self.sleep.call_args_list[1][0][0] <= 2)
+        self.assertIn('Software Version', result['stdout'][0])
+
+    def test_sonic_commands_adaptive_02(self):
+        set_module_args(self.fixture_data['adaptive_02']['module_args'])
+        self.device_responses = self.fixture_data['adaptive_02']['device_responses']
+        self.run_commands.side_effect = self.device_responses_side_effect
+        self.config_commands_valid = self.fixture_data['adaptive_02']['expected_command_requests']
+        result = self.execute_module(failed=True)
+        self.validate_config_commands()
+        self.assertEqual(result['failed_conditions'], ['result[1] not contains Active'])
+        self.assertEqual(len(result['attempts']), 1)
+        self.sleep.assert_not_called()
@@ -8,6 +8,9 @@ from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import
 from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
     sonic_config,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    RunningConfigIndex,
+)
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -22,6 +25,9 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_get_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.get_config"
         )
+        cls.mock_get_config_sections = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.get_config_sections"
+        )
         cls.mock_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.edit_config"
         )
@@ -30,6 +36,11 @@ class TestSonicInterfacesModule(TestSonicModule):
         )
         cls.fixture_data = cls.load_fixtures('sonic_config.yaml')
 
+    def get_config_sections_side_effect(self, module, keys=None):
+        """Side effect function for 'get_config_sections' mock"""
+
+        return RunningConfigIndex(self.get_config.return_value).get_text(keys)
+
     def edit_config_side_effect(self, module, commands):
         """Side effect function for 'config' requests mock"""
 
@@ -54,6 +65,8 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = []
         self.get_config = self.mock_get_config.start()
         self.get_config.return_value = "show running-configuration\nip load-share hash ipv4 ipv4-dst-ip"
+        self.get_config_sections = self.mock_get_config_sections.start()
+        self.get_config_sections.side_effect = self.get_config_sections_side_effect
         self.edit_config = self.mock_edit_config.start()
         self.edit_config.side_effect = self.edit_config_side_effect
         self.run_commands = self.mock_run_commands.start()
@@ -62,6 +75,7 @@ class TestSonicInterfacesModule(TestSonicModule):
     def tearDown(self):
         super(TestSonicInterfacesModule, self).tearDown()
         self.mock_get_config.stop()
+        self.mock_get_config_sections.stop()
         self.mock_edit_config.stop()
         self.mock_run_commands.stop()
 
@@ -76,3 +90,23 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = self.fixture_data['merged_02']['expected_commands_to_device']
         result = self.execute_module(changed=True)
         self.validate_config_commands()
+
+    def test_sonic_config_merged_03(self):
+        self.get_config.return_value = self.fixture_data['merged_03']['existing_config']
+        set_module_args(self.fixture_data['merged_03']['module_args'])
+        self.config_commands_valid = self.fixture_data['merged_03']['expected_commands_to_device']
+        result = self.execute_module(changed=True)
+        self.validate_config_commands()
+
+    def test_sonic_config_merged_04(self):
+        self.get_config.return_value = self.fixture_data['merged_04']['existing_config']
+        set_module_args(self.fixture_data['merged_04']['module_args'])
+        self.config_commands_valid = self.fixture_data['merged_04']['expected_commands_to_device']
+        result = self.execute_module(changed=True)
+        self.validate_config_commands()
+
+    def test_sonic_config_merged_05(self):
+        self.get_config.return_value = self.fixture_data['merged_05']['existing_config']
+        set_module_args(self.fixture_data['merged_05']['module_args'])
+        result = self.execute_module(changed=False)
+        self.assertEqual(self.get_config_sections.call_args[0][1], ['interface Eth1/2'])
@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible.module_utils import basic
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
@@ -43,3 +44,53 @@ class TestSonicInterfacesModule(TestSonicModule):
     def test_sonic_facts_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
         result = self.execute_module(changed=False)
+
+    def _start_facts_edit_config_mocks(self, resources=('vlans', 'l2_interfaces')):
+        for resource in resources:
+            mock_edit_config = patch(
+                "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.%s.%s.edit_config" % (resource, resource)
+            )
+            mock_edit_config.start().side_effect = self.facts_side_effect
+            self.addCleanup(mock_edit_config.stop)
+
+    def test_sonic_facts_concurrent_01(self):
+        self._start_facts_edit_config_mocks()
+        set_module_args(self.fixture_data['concurrent_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['concurrent_01']['existing_config'])
+        result = self.execute_module(changed=False)
+        self.get_network_resources_facts.assert_not_called()
+        resources = result['ansible_facts']['ansible_network_resources']
+        self.assertEqual(resources, self.fixture_data['concurrent_01']['expected_facts'])
+        self.assertEqual(sorted(result['ansible_facts']['ansible_net_gather_network_resources']), ['l2_interfaces', 'vlans'])
+
+    def test_sonic_facts_concurrent_02_failures(self):
+        self._start_facts_edit_config_mocks()
+        set_module_args(self.fixture_data['concurrent_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['concurrent_02']['existing_config'])
+        result = self.execute_module(failed=True)
+        self.assertIn('l2_interfaces: ', result['msg'])
+        self.assertIn('vlans: ', result['msg'])
+
+    def test_sonic_facts_concurrent_03_validation_failures(self):
+        self._start_facts_edit_config_mocks(('interfaces', 'l2_interfaces'))
+        set_module_args(self.fixture_data['concurrent_03']['module_args'])
+        module_args = basic._ANSIBLE_ARGS
+        self.initialize_facts_get_requests(self.fixture_data['concurrent_03']['existing_config'])
+        result = self.execute_module(failed=True)
+        self.assertRegex(result['msg'], r"interfaces: argument 'mtu' .*; l2_interfaces: argument 'vlan' ")
+        self.assertEqual(basic._ANSIBLE_ARGS, module_args)
+
+    def test_sonic_facts_strict_01(self):
+        self._start_facts_edit_config_mocks(('interfaces',))
+        module_args = self.fixture_data['strict_01']['module_args']
+        self.initialize_facts_get_requests(self.fixture_data['strict_01']['existing_config'])
+
+        # A speed unknown to the choices of the option is reported by default
+        set_module_args(module_args)
+        result = self.execute_module(changed=False)
+        interfaces = result['ansible_facts']['ansible_network_resources']['interfaces']
+        self.assertEqual(interfaces[0]['speed'], 'SPEED_800GB')
+
+        set_module_args(dict(module_args, strict_facts_validation=True))
+        result = self.execute_module(failed=True)
+        self.assertIn('interfaces: value of speed must be one of', result['msg'])
@@ -74,3 +74,10 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_l2_interfaces_replaced_01_vlan_ranges(self):
+        set_module_args(self.fixture_data['replaced_01_vlan_ranges']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['replaced_01_vlan_ranges']['existing_l2_interfaces_config'])
+        self.initialize_config_requests(self.fixture_data['replaced_01_vlan_ranges']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
@@ -0,0 +1,116 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
+    sonic_l3_acls,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .sonic_module import TestSonicModule
+
+
+class TestSonicL3AclsModule(TestSonicModule):
+    module = sonic_l3_acls
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_facts_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls.edit_config"
+        )
+        cls.mock_config_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.l3_acls.l3_acls.edit_config"
+        )
+        cls.mock_utils_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.edit_config"
+        )
+        cls.mock_get_interface_naming_mode = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.get_device_interface_naming_mode"
+        )
+        cls.fixture_data = cls.load_fixtures('sonic_l3_acls.yaml')
+
+    def setUp(self):
+        super(TestSonicL3AclsModule, self).setUp()
+        self.facts_edit_config = self.mock_facts_edit_config.start()
+        self.config_edit_config = self.mock_config_edit_config.start()
+        self.facts_edit_config.side_effect = self.facts_side_effect
+        self.config_edit_config.side_effect = self.config_side_effect
+        self.get_interface_naming_mode = self.mock_get_interface_naming_mode.start()
+        self.get_interface_naming_mode.return_value = 'standard'
+        self.utils_edit_config = self.mock_utils_edit_config.start()
+        self.utils_edit_config.side_effect = self.facts_side_effect
+
+    def tearDown(self):
+        super(TestSonicL3AclsModule, self).tearDown()
+        self.mock_facts_edit_config.stop()
+        self.mock_config_edit_config.stop()
+        self.mock_get_interface_naming_mode.stop()
+        self.mock_utils_edit_config.stop()
+
+    def test_sonic_l3_acls_merged_01_invalid_rules_per_request(self):
+        set_module_args(self.fixture_data['merged_01_invalid_rules_per_request']['module_args'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'rules_per_request must be at least 1, got 0')
+        self.facts_edit_config.assert_not_called()
+        self.config_edit_config.assert_not_called()
+
+    def test_sonic_l3_acls_merged_02_bulk(self):
+        set_module_args(self.fixture_data['merged_02_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02_bulk']['existing_l3_acls_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        labels = [request['label'] for request in self.config_edit_config.call_args[0][1]]
+        self.assertEqual(labels, ['rules 3-4', 'rules 5-5'])
+
+    def test_sonic_l3_acls_merged_03_bulk_rejected_rule(self):
+        set_module_args(self.fixture_data['merged_03_bulk_rejected_rule']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_bulk_rejected_rule']['existing_l3_acls_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_bulk_rejected_rule']['expected_config_requests'])
+        self.config_edit_config.side_effect = self.rejecting_side_effect(6, 'invalid-value')
+        self.utils_edit_config.side_effect = self.rejecting_side_effect(6, 'invalid-value')
+        result = self.execute_module(failed=True)
+        self.validate_config_requests()
+        self.assertIn("'log': 'Failed to configure the rule with sequence number 6'", result['msg'])
+
+    def test_sonic_l3_acls_merged_04_bulk_not_rule_error(self):
+        set_module_args(self.fixture_data['merged_04_bulk_not_rule_error']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_04_bulk_not_rule_error']['existing_l3_acls_config'])
+        self.initialize_config_requests(self.fixture_data['merged_04_bulk_not_rule_error']['expected_config_requests'])
+        self.config_edit_config.side_effect = self.rejecting_side_effect(5, 'invalid-value', code=404)
+        self.utils_edit_config.side_effect = self.rejecting_side_effect(5, 'invalid-value')
+        result = self.execute_module(failed=True)
+        self.validate_config_requests()
+        self.assertEqual(result['code'], 404)
+        self.assertNotIn('sequence number', result['msg'])
+
+    def test_sonic_l3_acls_deleted_01_bulk(self):
+        set_module_args(self.fixture_data['deleted_01_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_01_bulk']['existing_l3_acls_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_01_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def rejecting_side_effect(self, sequence_num, error_tag, error_app_tag=None, code=400):
+        """Side effect failing the first request that holds the ACL rule
+        with the given sequence number, as the httpapi plugin does
+        """
+        def side_effect(module, commands):
+            responses = []
+            for command in commands:
+                responses.extend(self.config_side_effect(module, [command]))
+                entries = (command['data'] or {}).get('openconfig-acl:acl-entries', {}).get('acl-entry', [])
+                if any(entry['sequence-id'] == sequence_num for entry in entries):
+                    error = {'error-type': 'application', 'error-tag': error_tag, 'error-message': 'Invalid ACL rule'}
+                    if error_app_tag:
+                        error['error-app-tag'] = error_app_tag
+                    request_data = {'path': command['path'], 'method': command['method'], 'label': command['label']}
+                    response = {'ietf-restconf:errors': {'error': [error]}, 'code': code, 'request_data': request_data}
+                    raise ConnectionError(str(response), code=code)
+            return responses
+        return side_effect
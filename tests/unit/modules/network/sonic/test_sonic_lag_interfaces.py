@@ -74,3 +74,21 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_03']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_lag_interfaces_merged_02_request_plan(self):
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_lag_interfaces_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+        # Only the members of the created PortChannel20 wait for its creation
+        requests = self.config_edit_config.call_args[0][1]
+        create_po20 = [position for position, request in enumerate(requests)
+                       if request['path'] == 'data/openconfig-interfaces:interfaces'
+                       and request['data']['openconfig-interfaces:interfaces']['interface'][0]['name'] == 'PortChannel20']
+        for request in requests:
+            if request['data'].get('openconfig-if-aggregate:aggregate-id') == 'PortChannel20':
+                self.assertEqual(request['depends_on'], create_po20)
+            else:
+                self.assertEqual(request['depends_on'], [])
@@ -3,11 +3,13 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    MagicMock,
     patch,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
     sonic_static_routes,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -58,6 +60,33 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_static_routes_merged_02_coalesce_requests(self):
+        set_module_args(self.fixture_data['merged_02_coalesce_requests']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02_coalesce_requests']['existing_static_routes_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02_coalesce_requests']['expected_config_requests'])
+        connection = MagicMock()
+        connection.edit_config.side_effect = lambda requests: self.config_side_effect(None, requests)
+        self.config_edit_config.side_effect = sonic.edit_config
+        with patch.object(sonic, 'get_connection', return_value=connection), \
+                patch.object(sonic, 'get_capabilities', return_value={'network_api': 'sonic_rest', 'coalesce_requests': True}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(connection.edit_config.call_count, 1)
+        self.assertEqual(result['requests_saved'], 1)
+
+    def test_sonic_static_routes_merged_03_bulk(self):
+        set_module_args(self.fixture_data['merged_03_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_bulk']['existing_static_routes_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_static_routes_merged_04_invalid_prefixes_per_request(self):
+        set_module_args(self.fixture_data['merged_04_invalid_prefixes_per_request']['module_args'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'prefixes_per_request must be at least 1, got -1')
+        self.config_edit_config.assert_not_called()
+
     def test_sonic_static_routes_deleted_01(self):
         set_module_args(self.fixture_data['deleted_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_static_routes_config'])
@@ -71,3 +100,13 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_static_routes_deleted_03_bulk(self):
+        set_module_args(self.fixture_data['deleted_03_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03_bulk']['existing_static_routes_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        independent = [request['independent'] for request in self.config_edit_config.call_args[0][1]
+                       if request['path'].endswith('static=2.0.0.0%2F8')]
+        self.assertEqual(independent, [True])
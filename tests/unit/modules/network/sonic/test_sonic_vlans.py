@@ -65,6 +65,26 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vlans_merged_04_bulk(self):
+        set_module_args(self.fixture_data['merged_04_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_04_bulk']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_04_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_vlans_merged_05_invalid_verify_after_rate(self):
+        set_module_args(self.fixture_data['merged_05_invalid_verify_after_rate']['module_args'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'verify_after_rate must be between 0 and 1, got 1.5')
+        self.facts_edit_config.assert_not_called()
+        self.config_edit_config.assert_not_called()
+
+    def test_sonic_vlans_merged_06_invalid_vlans_per_request(self):
+        set_module_args(self.fixture_data['merged_06_invalid_vlans_per_request']['module_args'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'vlans_per_request must be at least 1, got -5')
+        self.config_edit_config.assert_not_called()
+
     def test_sonic_vlans_deleted_01_vlan_descr(self):
         set_module_args(self.fixture_data['deleted_01_vlan_descr']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01_vlan_descr']['existing_vlans_config'])
@@ -79,6 +99,14 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vlans_deleted_04_bulk(self):
+        set_module_args(self.fixture_data['deleted_04_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_04_bulk']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_04_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertTrue(all(request['independent'] for request in self.config_edit_config.call_args[0][1]))
+
     def test_sonic_vlans_replaced_01(self):
         set_module_args(self.fixture_data['replaced_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['replaced_01']['existing_vlans_config'])
@@ -92,3 +120,42 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['overridden_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_vlans_overridden_02_verify_after_never(self):
+        set_module_args(self.fixture_data['overridden_02_verify_after_never']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['overridden_02_verify_after_never']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['overridden_02_verify_after_never']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(self.facts_edit_config.call_count, 1)
+        self.assertEqual(result['after'], self.fixture_data['overridden_02_verify_after_never']['expected_after'])
+
+    def test_sonic_vlans_overridden_03_unchanged(self):
+        set_module_args(self.fixture_data['overridden_03_unchanged']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['overridden_03_unchanged']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['overridden_03_unchanged']['expected_config_requests'])
+        self.execute_module(changed=False)
+        self.validate_config_requests()
+
+    def test_sonic_vlans_deleted_03_verify_after_never(self):
+        set_module_args(self.fixture_data['deleted_03_verify_after_never']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03_verify_after_never']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03_verify_after_never']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(self.facts_edit_config.call_count, 1)
+        self.assertEqual(result['after'], self.fixture_data['deleted_03_verify_after_never']['expected_after'])
+
+    def test_sonic_vlans_merged_03_facts_scope(self):
+        set_module_args(self.fixture_data['merged_03_facts_scope']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_facts_scope']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_facts_scope']['expected_config_requests'])
+        with patch("ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.edit_config") as edit_config:
+            edit_config.side_effect = self.facts_side_effect
+            result = self.execute_module(changed=True)
+            self.assertEqual(sorted(request[0][1][0]['path'] for request in edit_config.call_args_list),
+                             ['data/openconfig-interfaces:interfaces/interface=Vlan10',
+                              'data/openconfig-interfaces:interfaces/interface=Vlan30'])
+        self.validate_config_requests()
+        self.assertEqual(self.facts_edit_config.call_count, 0)
+        self.assertEqual(result['before'], self.fixture_data['merged_03_facts_scope']['expected_before'])
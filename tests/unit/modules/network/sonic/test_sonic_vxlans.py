@@ -3,11 +3,13 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    MagicMock,
     patch,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
     sonic_vxlans,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -64,6 +66,33 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vxlans_merged_02_bulk(self):
+        set_module_args(self.fixture_data['merged_02_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02_bulk']['existing_vxlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_vxlans_merged_03_invalid_maps_per_request(self):
+        set_module_args(self.fixture_data['merged_03_invalid_maps_per_request']['module_args'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'maps_per_request must be at least 1, got 0')
+        self.config_edit_config.assert_not_called()
+
+    def test_sonic_vxlans_merged_04_coalesce_requests(self):
+        set_module_args(self.fixture_data['merged_04_coalesce_requests']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_04_coalesce_requests']['existing_vxlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_04_coalesce_requests']['expected_config_requests'])
+        connection = MagicMock()
+        connection.edit_config.side_effect = lambda requests: self.config_side_effect(None, requests)
+        self.config_edit_config.side_effect = sonic.edit_config
+        with patch.object(sonic, 'get_connection', return_value=connection), \
+                patch.object(sonic, 'get_capabilities', return_value={'network_api': 'sonic_rest', 'coalesce_requests': True}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(connection.edit_config.call_count, 1)
+        self.assertEqual(result['requests_saved'], 2)
+
     def test_sonic_vxlans_deleted_01(self):
         set_module_args(self.fixture_data['deleted_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_vxlans_config'])
@@ -78,6 +107,13 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vxlans_deleted_03_bulk(self):
+        set_module_args(self.fixture_data['deleted_03_bulk']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03_bulk']['existing_vxlans_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03_bulk']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
     # When replace is executed, it first deletes the existing config and then patches the new config.
     # As part of UT, sonic_module.py does a SORTING before comparison and hence the sequence of the actual configs sent to device varies from the sequence.
     # in which the UT test case compares with expected results. The actual sequence in which the requests are sent to device should be working fine.
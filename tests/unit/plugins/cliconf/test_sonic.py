@@ -0,0 +1,170 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import re
+import unittest
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.plugins.loader import cliconf_loader
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.terminal.sonic import TerminalModule
+
+
+class FakeCli(object):
+    """Connection to a SONiC CLI that runs the lines written to it in order
+
+    The CLI echoes a line after the prompt that follows the previous line,
+    and a read returns the output up to the next prompt(s) matching the
+    terminal_stdout_re regexes, as network_cli does. A read that finds no
+    prompt stands for a command timeout.
+    """
+
+    def __init__(self, errors=None, confirms=(), prompts_per_read=1, width=None, console_messages=0):
+        self.errors = errors or {}
+        self.confirms = confirms
+        self.prompts_per_read = prompts_per_read
+        self.width = width
+        self.console_messages = console_messages
+        self.prompt = 'sonic#'
+        self.stream = ''
+        self.writes = []
+        self.executed = []
+        self.options = {'terminal_stderr_re': None, 'terminal_stdout_re': None}
+
+    def get_prompt(self):
+        return to_bytes(self.prompt)
+
+    def get_option(self, name):
+        return self.options[name]
+
+    def set_option(self, name, value):
+        self.options[name] = value
+
+    def send(self, command, sendonly=False, prompt=None, answer=None, **kwargs):
+        lines = to_text(command).split('\r')
+        self.writes.append(lines)
+        if not sendonly:
+            self.executed.append(lines[0] if prompt is None else (lines[0], to_text(answer)))
+            output = self.run(lines[0])
+            if output:
+                raise AnsibleConnectionFailure(output)
+            return ''
+
+        for line in lines:
+            if line in self.confirms:
+                # The CLI drops the lines written ahead and waits for the answer
+                self.executed.append(line)
+                self.stream += '%s\nDo you want to continue? [y/N]: ' % line
+                return
+            if line.startswith('!') and self.console_messages:
+                # Console messages, each followed by the prompt, hide the end of the block
+                self.stream += ''.join('Link down\n%s ' % self.prompt for count in range(self.console_messages))
+                continue
+            if not line.startswith('!'):
+                self.executed.append(line)
+            output = self.run(line)
+            echo = line
+            if self.width:
+                echo = '\n'.join(line[start:start + self.width] for start in range(0, len(line), self.width))
+            self.stream += '%s\n%s%s ' % (echo, output + '\n' if output else '', self.prompt)
+
+    def run(self, line):
+        if line == 'configure terminal' or line == 'exit':
+            self.prompt = 'sonic(config)#'
+        elif line == 'end':
+            self.prompt = 'sonic#'
+        elif line.startswith('interface '):
+            self.prompt = 'sonic(conf-if-%s)#' % line.split()[1]
+        return self.errors.get(line, '')
+
+    def receive(self, strip_prompt=True):
+        if self.options['terminal_stdout_re']:
+            stdout_re = [re.compile(to_bytes(item['pattern']), re.I if item.get('flags') else 0)
+                         for item in self.options['terminal_stdout_re']]
+        else:
+            stdout_re = TerminalModule.terminal_stdout_re
+
+        prompts = 0
+        for end in range(1, len(self.stream) + 1):
+            if any(regex.search(to_bytes(self.stream[:end])) for regex in stdout_re) and self.stream[end:end + 1] != ' ':
+                prompts += 1
+                if prompts == self.prompts_per_read or end == len(self.stream):
+                    response, self.stream = self.stream[:end], self.stream[end:]
+                    return to_bytes(response.strip())
+        raise AnsibleConnectionFailure('command timeout triggered')
+
+
+class TestSonicCliconf(unittest.TestCase):
+
+    def get_cliconf(self, connection, batch_size=3):
+        cliconf = cliconf_loader.get('dellemc.enterprise_sonic.sonic', connection)
+        cliconf.set_options(direct={'config_batch_size': batch_size})
+        return cliconf
+
+    def test_01_block_success(self):
+        lines = ['interface Eth1/1', 'mtu 9100', 'exit', 'interface Eth1/2', 'mtu 9100', 'exit', 'hostname leaf1']
+        for prompts_per_read in (1, 3):
+            connection = FakeCli(prompts_per_read=prompts_per_read)
+            self.get_cliconf(connection).edit_config(lines)
+            self.assertEqual(connection.executed, ['configure terminal'] + lines + ['end'])
+            self.assertEqual([len(write) for write in connection.writes], [1, 4, 4, 2, 1])
+            self.assertEqual(connection.stream, '')
+            self.assertEqual(connection.options, {'terminal_stderr_re': None, 'terminal_stdout_re': None})
+
+    def test_02_block_error_mid_block(self):
+        lines = ['interface Eth1/1', 'mtu 99999', 'description uplink', 'exit']
+        for prompts_per_read in (1, 2):
+            connection = FakeCli(errors={'mtu 99999': '%Error: Invalid MTU'}, prompts_per_read=prompts_per_read)
+            with self.assertRaises(AnsibleConnectionFailure) as exc:
+                self.get_cliconf(connection).edit_config(lines)
+            self.assertEqual(to_text(exc.exception), 'sonic(conf-if-Eth1/1)# mtu 99999\n%Error: Invalid MTU')
+            # No line is sent again, the lines following the failed line have run
+            self.assertEqual(connection.executed, ['configure terminal'] + lines[:3])
+            self.assertEqual(connection.options, {'terminal_stderr_re': None, 'terminal_stdout_re': None})
+
+        connection = FakeCli(errors={'interface Eth1/1': '%Error: Invalid interface'})
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.get_cliconf(connection).edit_config(lines)
+        self.assertEqual(to_text(exc.exception), 'interface Eth1/1\n%Error: Invalid interface')
+
+    def test_03_block_with_prompt_commands(self):
+        clear = {'command': 'clear counters', 'prompt': r'\[y/N\]', 'answer': 'y'}
+        lines = ['interface Eth1/1', 'mtu 9100', clear, 'exit', 'hostname leaf1']
+        connection = FakeCli()
+        self.get_cliconf(connection).edit_config(lines)
+        self.assertEqual(connection.executed, ['configure terminal', 'interface Eth1/1', 'mtu 9100', ('clear counters', 'y'),
+                                               'exit', 'hostname leaf1', 'end'])
+        self.assertEqual([len(write) for write in connection.writes], [1, 3, 1, 3, 1])
+
+    def test_04_block_confirmation_prompt(self):
+        lines = ['interface Eth1/1', 'shutdown', 'mtu 9100', 'exit']
+        connection = FakeCli(confirms=('shutdown',))
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.get_cliconf(connection).edit_config(lines)
+        self.assertIn("'shutdown' asked for a confirmation", to_text(exc.exception))
+        self.assertEqual(connection.executed, ['configure terminal', 'interface Eth1/1', 'shutdown'])
+        self.assertEqual(connection.options, {'terminal_stderr_re': None, 'terminal_stdout_re': None})
+
+    def test_05_block_error_without_echo(self):
+        lines = ['interface Eth1/1', 'description %s' % ('x' * 80), 'mtu 99999', 'exit']
+        connection = FakeCli(errors={'mtu 99999': '%Error: Invalid MTU'}, width=60)
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.get_cliconf(connection, batch_size=4).edit_config(lines)
+        # The wrapped echo of the description leaves the error to the block
+        self.assertTrue(to_text(exc.exception).startswith('interface Eth1/1\n'))
+        self.assertIn('mtu 99999\n%Error: Invalid MTU', to_text(exc.exception))
+        self.assertEqual(connection.executed, ['configure terminal'] + lines)
+
+    def test_06_block_end_not_received(self):
+        lines = ['interface Eth1/1', 'mtu 9100']
+        connection = FakeCli(console_messages=10)
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.get_cliconf(connection).edit_config(lines)
+        self.assertTrue(to_text(exc.exception).startswith('the end of the configuration block was not received after 6 prompts'))
+        self.assertEqual(connection.options, {'terminal_stderr_re': None, 'terminal_stdout_re': None})
+
+
+if __name__ == '__main__':
+    unittest.main()
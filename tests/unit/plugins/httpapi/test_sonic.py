@@ -0,0 +1,311 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import socket
+import threading
+import unittest
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
+from ansible.plugins.loader import httpapi_loader
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.httpapi import sonic
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import MagicMock, patch
+
+# Time allowed to a request thread to reach a point of a test
+WAIT_TIMEOUT = 5
+
+
+def new_http_connection():
+    """Return a mocked http_client connection answering 200 to every request
+
+    A test makes a request fail with the side effect of request() or
+    getresponse().
+    """
+    conn = MagicMock(spec=http_client.HTTPConnection)
+    conn.sock = MagicMock()
+
+    def getresponse():
+        response = MagicMock(status=200, reason='OK', msg={}, will_close=False)
+        response.read.return_value = b'{}'
+        return response
+
+    def close():
+        conn.sock = None
+
+    conn.getresponse.side_effect = getresponse
+    conn.close.side_effect = close
+    return conn
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def get_pool(self, *connections):
+        pool = sonic.ConnectionPool('sonic', 443, idle_timeout=30)
+        patcher = patch.object(pool, '_new_connection', side_effect=list(connections))
+        self.new_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        return pool
+
+    def test_01_idle_connection_reused(self):
+        conn = new_http_connection()
+        pool = self.get_pool(conn)
+        for count in range(3):
+            self.assertEqual(pool.request('GET', '/restconf/data/x', None, {})[0], 200)
+        self.assertEqual(conn.request.call_count, 3)
+        self.assertEqual(pool.stats(), {'hits': 2, 'misses': 1, 'idle': 1})
+
+    def test_02_stale_connection_retried_once(self):
+        for method in ('GET', 'PUT', 'DELETE'):
+            stale = new_http_connection()
+            fresh = new_http_connection()
+            pool = self.get_pool(stale, fresh)
+            pool.request(method, '/restconf/data/x', None, {})
+            stale.getresponse.side_effect = ConnectionResetError('reset by peer')
+
+            # The device closed the idle connection, the request is sent again on a new one
+            self.assertEqual(pool.request(method, '/restconf/data/x', None, {})[0], 200)
+            self.assertEqual(stale.request.call_count, 2)
+            self.assertEqual(fresh.request.call_count, 1)
+            self.assertEqual(pool.stats(), {'hits': 0, 'misses': 2, 'idle': 1})
+
+        # A request failing again on the new connection is not retried twice
+        stale = new_http_connection()
+        fresh = new_http_connection()
+        pool = self.get_pool(stale, fresh)
+        pool.request('GET', '/restconf/data/x', None, {})
+        stale.getresponse.side_effect = ConnectionResetError('reset by peer')
+        fresh.getresponse.side_effect = ConnectionResetError('reset by peer')
+        with self.assertRaises(ConnectionResetError):
+            pool.request('GET', '/restconf/data/x', None, {})
+        self.assertEqual(self.new_connection.call_count, 2)
+
+    def test_03_failed_non_idempotent_request_not_resent(self):
+        for method in ('POST', 'PATCH'):
+            for error in (ConnectionResetError('reset by peer'), socket.timeout('timed out')):
+                conn = new_http_connection()
+                pool = self.get_pool(conn)
+                pool.request('GET', '/restconf/data/x', None, {})
+                conn.getresponse.side_effect = error
+
+                # The request may have been applied by the device
+                with self.assertRaises(type(error)):
+                    pool.request(method, '/restconf/data/x', '{}', {})
+                self.assertEqual(conn.request.call_count, 2)
+                self.assertEqual(self.new_connection.call_count, 1)
+
+        # A GET timing out may still be processed by the device, it is not resent either
+        conn = new_http_connection()
+        pool = self.get_pool(conn)
+        pool.request('GET', '/restconf/data/x', None, {})
+        conn.getresponse.side_effect = socket.timeout('timed out')
+        with self.assertRaises(socket.timeout):
+            pool.request('GET', '/restconf/data/x', None, {})
+        self.assertEqual(self.new_connection.call_count, 1)
+
+    def test_04_unsent_non_idempotent_request_retried(self):
+        stale = new_http_connection()
+        fresh = new_http_connection()
+        pool = self.get_pool(stale, fresh)
+        pool.request('GET', '/restconf/data/x', None, {})
+        stale.request.side_effect = BrokenPipeError('broken pipe')
+
+        # The connection was found closed while writing the request
+        self.assertEqual(pool.request('PATCH', '/restconf/data/x', '{}', {})[0], 200)
+        self.assertEqual(fresh.request.call_count, 1)
+
+    def test_05_idle_timeout(self):
+        first = new_http_connection()
+        second = new_http_connection()
+        pool = self.get_pool(first, second)
+        with patch.object(sonic.time, 'time', return_value=1000.0):
+            pool.request('GET', '/restconf/data/x', None, {})
+        with patch.object(sonic.time, 'time', return_value=1029.0):
+            pool.request('GET', '/restconf/data/x', None, {})
+        self.assertEqual(self.new_connection.call_count, 1)
+
+        # The connection was idle since 1029
+        with patch.object(sonic.time, 'time', return_value=1059.0):
+            pool.request('GET', '/restconf/data/x', None, {})
+        first.close.assert_called_once_with()
+        self.assertEqual(self.new_connection.call_count, 2)
+        self.assertEqual(second.request.call_count, 1)
+        self.assertEqual(pool.stats(), {'hits': 1, 'misses': 2, 'idle': 1})
+
+
+class TestSonicHttpApi(unittest.TestCase):
+
+    def get_httpapi(self, **options):
+        connection = MagicMock()
+        connection.connected = True
+        connection._auth = None
+        connection._url = 'https://sonic'
+        connection_options = {'remote_user': 'admin', 'password': 'admin', 'http_agent': None}
+        connection.get_option.side_effect = connection_options.get
+        httpapi = httpapi_loader.get('dellemc.enterprise_sonic.sonic', connection)
+        httpapi.set_options(direct=options)
+        return httpapi
+
+    def start_send_request(self, httpapi, handlers=None):
+        """Mock send_request, recording the start and end of each request
+
+        A request is identified by its path. The handler of the path, if
+        any, is called before the request ends.
+        """
+        self.events = []
+        lock = threading.Lock()
+        handlers = handlers or {}
+
+        def send_request(data=None, **message_kwargs):
+            path = message_kwargs['path']
+            with lock:
+                self.events.append(('start', path))
+            try:
+                if path in handlers:
+                    handlers[path]()
+            finally:
+                with lock:
+                    self.events.append(('end', path))
+            return 200, path
+
+        patcher = patch.object(httpapi, 'send_request', side_effect=send_request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sent(self):
+        return [path for event, path in self.events if event == 'start']
+
+    def assert_sent_after(self, path, preceding):
+        start = self.events.index(('start', path))
+        for other in preceding:
+            self.assertLess(self.events.index(('end', other)), start)
+
+    def test_01_send_pooled_stale_connection(self):
+        httpapi = self.get_httpapi(connection_pool=True)
+        stale = new_http_connection()
+        fresh = new_http_connection()
+        pool = sonic.ConnectionPool('sonic', 443)
+        with patch.object(httpapi, '_get_pool', return_value=pool), \
+                patch.object(pool, '_new_connection', side_effect=[stale, fresh]):
+            httpapi._send_pooled('/restconf/data/x', None, {})
+            stale.getresponse.side_effect = ConnectionResetError('reset by peer')
+            response, response_data = httpapi._send_pooled('/restconf/data/x', None, {})
+            self.assertEqual(response.getcode(), 200)
+            self.assertEqual(response_data.read(), b'{}')
+            self.assertEqual(fresh.request.call_count, 1)
+            self.assertEqual(fresh.request.call_args[0][0], 'GET')
+
+            stale = fresh
+            stale.getresponse.side_effect = ConnectionResetError('reset by peer')
+            with self.assertRaises(AnsibleConnectionFailure) as exc:
+                httpapi._send_pooled('/restconf/data/x', '{}', {}, method='patch')
+            self.assertIn('reset by peer', str(exc.exception))
+            self.assertEqual([call[0][0] for call in stale.request.call_args_list], ['GET', 'PATCH'])
+
+    def test_02_concurrent_barrier(self):
+        httpapi = self.get_httpapi(max_workers=4)
+        both_started = threading.Event()
+        handlers = {
+            # Both independent requests run together, the first one ends last
+            'a': lambda: self.assertTrue(both_started.wait(WAIT_TIMEOUT)),
+            'b': both_started.set,
+        }
+        self.start_send_request(httpapi, handlers)
+        requests = [
+            {'path': 'a', 'method': 'patch', 'data': {}, 'independent': True},
+            {'path': 'b', 'method': 'patch', 'data': {}, 'independent': True},
+            {'path': 'c', 'method': 'patch', 'data': {}},
+            {'path': 'd', 'method': 'get', 'data': None},
+        ]
+        responses = httpapi.edit_config(requests)
+        self.assertEqual(responses, [(200, 'a'), (200, 'b'), (200, 'c'), (200, 'd')])
+        self.assert_sent_after('c', ['a', 'b'])
+        self.assert_sent_after('d', ['c'])
+
+    def test_03_concurrent_first_failure(self):
+        httpapi = self.get_httpapi(max_workers=4)
+        second_failed = threading.Event()
+
+        def fail_first():
+            self.assertTrue(second_failed.wait(WAIT_TIMEOUT))
+            raise ConnectionError('first failed')
+
+        def fail_second():
+            second_failed.set()
+            raise ConnectionError('second failed')
+
+        self.start_send_request(httpapi, {'a': fail_first, 'b': fail_second})
+        requests = [
+            {'path': 'a', 'method': 'patch', 'data': {}, 'independent': True},
+            {'path': 'b', 'method': 'patch', 'data': {}, 'independent': True},
+            {'path': 'c', 'method': 'patch', 'data': {}},
+        ]
+        # The second request fails first, the failure of the first one is raised
+        with self.assertRaises(ConnectionError) as exc:
+            httpapi.edit_config(requests)
+        self.assertEqual(str(exc.exception), 'first failed')
+        self.assertEqual(sorted(self.sent()), ['a', 'b'])
+
+    def get_plan_requests(self):
+        # Two ACLs, each with rules depending on it; rule a2 also depends on rule a1
+        return [
+            {'path': 'acl-a', 'method': 'post', 'data': {}, 'depends_on': []},
+            {'path': 'rule-a1', 'method': 'post', 'data': {}, 'depends_on': [0]},
+            {'path': 'rule-a2', 'method': 'post', 'data': {}, 'depends_on': [1]},
+            {'path': 'acl-b', 'method': 'post', 'data': {}, 'depends_on': []},
+            {'path': 'rule-b1', 'method': 'post', 'data': {}, 'depends_on': [3]},
+            {'path': 'rule-b2', 'method': 'post', 'data': {}, 'depends_on': [3]},
+        ]
+
+    def test_04_plan(self):
+        httpapi = self.get_httpapi(max_workers=2)
+        self.start_send_request(httpapi)
+        responses = httpapi.edit_config(self.get_plan_requests())
+        self.assertEqual([response[1] for response in responses], ['acl-a', 'rule-a1', 'rule-a2', 'acl-b', 'rule-b1', 'rule-b2'])
+        self.assert_sent_after('rule-a1', ['acl-a'])
+        self.assert_sent_after('rule-a2', ['rule-a1'])
+        self.assert_sent_after('rule-b1', ['acl-b'])
+        self.assert_sent_after('rule-b2', ['acl-b'])
+
+    def test_05_plan_failure(self):
+        httpapi = self.get_httpapi(max_workers=2)
+        later_failed = threading.Event()
+
+        def fail_acl():
+            # The ACL fails after a request following it
+            self.assertTrue(later_failed.wait(WAIT_TIMEOUT))
+            raise ConnectionError('acl-a failed')
+
+        def fail_rule():
+            later_failed.set()
+            raise ConnectionError('rule-b1 failed')
+
+        self.start_send_request(httpapi, {'acl-a': fail_acl, 'rule-b1': fail_rule})
+        with self.assertRaises(ConnectionError) as exc:
+            httpapi.edit_config(self.get_plan_requests())
+        self.assertEqual(str(exc.exception), 'acl-a failed')
+        # The rules of the failed ACL are not sent, the other ACL is completed
+        self.assertEqual(sorted(self.sent()), ['acl-a', 'acl-b', 'rule-b1', 'rule-b2'])
+
+    def test_06_plan_single_worker(self):
+        httpapi = self.get_httpapi(max_workers=1)
+
+        def fail_rule():
+            raise ConnectionError('rule-a1 failed')
+
+        self.start_send_request(httpapi, {'rule-a1': fail_rule})
+        requests = self.get_plan_requests()
+        with self.assertRaises(ConnectionError) as exc:
+            httpapi.edit_config(requests)
+        self.assertEqual(str(exc.exception), 'rule-a1 failed')
+        self.assertEqual(self.sent(), ['acl-a', 'rule-a1'])
+
+        self.start_send_request(httpapi)
+        httpapi.edit_config(requests)
+        self.assertEqual(self.sent(), [req['path'] for req in requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
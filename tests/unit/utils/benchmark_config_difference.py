@@ -0,0 +1,65 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+"""
+Micro-benchmark of the line match of sonic_config against the running config.
+
+Run it directly, e.g. "python benchmark_config_difference.py [size ...]".
+For each number of candidate lines, the candidate is compared with a running
+config of 50000 lines as a whole, and with its sections indexed by
+RunningConfigIndex through an IndexedNetworkConfig, and the time of both
+methods is printed. 1000 candidate lines take about 30 s as a whole.
+"""
+
+import sys
+import time
+
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, dumps
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    IndexedNetworkConfig,
+    RunningConfigIndex,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config import get_section_keys
+
+PORTS = 10000
+
+
+def get_running_config():
+    return '\n'.join('interface Eth1/%d\n mtu 9100\n description port %d\n speed 100000\n!' % (port, port)
+                     for port in range(PORTS))
+
+
+def get_candidate(size):
+    lines = []
+    for port in range(0, PORTS, max(PORTS * 3 // size, 1))[:size // 3]:
+        lines.extend(['interface Eth1/%d' % port, ' mtu 9000', ' description port %d' % port])
+    candidate = NetworkConfig(indent=1)
+    candidate.load('\n'.join(lines))
+    return candidate
+
+
+def benchmark(running_config, size):
+    candidate = get_candidate(size)
+
+    start = time.time()
+    full_commands = dumps(candidate.difference(NetworkConfig(contents=running_config, indent=1)), 'commands')
+    full_time = time.time() - start
+
+    index = RunningConfigIndex(running_config)
+    start = time.time()
+    sections = index.get_text(get_section_keys(candidate, [], 'line'))
+    indexed_commands = dumps(candidate.difference(IndexedNetworkConfig(contents=sections, indent=1)), 'commands')
+    indexed_time = time.time() - start
+
+    if full_commands != indexed_commands:
+        raise AssertionError('The full and indexed commands differ for %d lines' % size)
+
+    print('%6d lines: full %8.3f s, indexed %7.3f s, %8.1fx' % (size, full_time, indexed_time, full_time / indexed_time))
+
+
+if __name__ == '__main__':
+    config = get_running_config()
+    for candidate_size in [int(arg) for arg in sys.argv[1:]] or [100, 1000]:
+        benchmark(config, candidate_size)
@@ -0,0 +1,51 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+"""
+Micro-benchmark of the validation of the facts in validate_facts.
+
+Run it directly, e.g. "python benchmark_facts_validation.py [size ...]".
+For each number of rules, the facts of an L3 ACL holding the rules are
+validated through AnsibleModule (strict) and by converting their types only,
+and the time of both methods is printed.
+"""
+
+import sys
+import time
+
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import validate_facts
+
+
+def get_facts(size):
+    rules = [{'sequence_num': seq_num, 'action': 'permit', 'remark': 'rule %d' % seq_num,
+              'protocol': {'name': 'tcp'},
+              'source': {'prefix': '10.%d.%d.0/24' % (seq_num // 256 % 256, seq_num % 256)},
+              'destination': {'any': True, 'port_number': {'eq': 1024 + seq_num % 1000}},
+              'protocol_options': {'tcp': {'established': True}}}
+             for seq_num in range(1, size + 1)]
+    return {'config': [{'address_family': 'ipv4', 'acls': [{'name': 'acl', 'rules': rules}]}]}
+
+
+def benchmark(size):
+    facts = get_facts(size)
+
+    start = time.time()
+    strict_params = validate_facts(L3_aclsArgs.argument_spec, facts, strict=True)
+    strict_time = time.time() - start
+
+    start = time.time()
+    params = validate_facts(L3_aclsArgs.argument_spec, facts)
+    fast_time = time.time() - start
+
+    if strict_params != params:
+        raise AssertionError('The strict and fast results differ for %d rules' % size)
+
+    print('%6d rules: strict %7.3f s, fast %7.3f s, %6.1fx' % (size, strict_time, fast_time, strict_time / fast_time))
+
+
+if __name__ == '__main__':
+    for rules_count in [int(arg) for arg in sys.argv[1:]] or [1000, 10000]:
+        benchmark(rules_count)
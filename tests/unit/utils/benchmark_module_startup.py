@@ -0,0 +1,64 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+"""
+Startup benchmark of the collection modules.
+
+Run it directly, e.g. "python benchmark_module_startup.py [module ...]".
+For each module (all the sonic_* modules by default), the number and size of
+the collection files that AnsiballZ ships with the module are printed, with
+the time the module takes to be imported by a new Python interpreter, the
+best of 5 runs.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import time
+import zipfile
+
+sys.path.append('/root/.ansible/collections')
+
+from ansible.executor.module_common import recursive_finder
+from ansible.utils.collection_loader._collection_finder import _AnsibleCollectionFinder
+
+COLLECTION = 'ansible_collections.dellemc.enterprise_sonic'
+MODULES_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'plugins', 'modules')
+RUNS = 5
+
+
+def get_payload(module_name):
+    with open(os.path.join(MODULES_PATH, module_name + '.py'), 'rb') as module_file:
+        module_data = module_file.read()
+
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, 'w', zipfile.ZIP_DEFLATED) as zf:
+        recursive_finder(module_name, '%s.plugins.modules.%s' % (COLLECTION, module_name), module_data, zf)
+        infos = [info for info in zf.infolist() if info.filename.startswith(COLLECTION.replace('.', '/'))]
+
+    return len(infos), sum(info.compress_size for info in infos)
+
+
+def get_import_time(module_name):
+    command = [sys.executable, '-c', 'import %s.plugins.modules.%s' % (COLLECTION, module_name)]
+    best = None
+    for run in range(RUNS):
+        start = time.time()
+        subprocess.check_call(command)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(module_name):
+    files, size = get_payload(module_name)
+    import_time = get_import_time(module_name)
+    print('%-28s %4d files %8d bytes, import %6.3f s' % (module_name, files, size, import_time))
+
+
+if __name__ == '__main__':
+    _AnsibleCollectionFinder(paths=sys.path)._install()
+    module_names = sys.argv[1:] or sorted(name[:-3] for name in os.listdir(MODULES_PATH) if name.startswith('sonic_'))
+    for name in module_names:
+        benchmark(name)
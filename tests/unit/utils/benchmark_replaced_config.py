@@ -0,0 +1,53 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+"""
+Micro-benchmark of the list item matching in get_replaced_config.
+
+Run it directly, e.g. "python benchmark_replaced_config.py [size ...]".
+For each list size, the existing items are matched against the same number
+of new items by scanning and through the test key index, and the time of
+both methods is printed. Scanning 10000 items takes a few minutes.
+"""
+
+import sys
+import time
+
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_replaced_list_items_by_index,
+    get_replaced_list_items_by_scan,
+)
+
+TEST_KEYS = [{'members': {'member': ''}}]
+T_KEY_SET = {'vlan_id'}
+
+
+def get_vlans(size, description):
+    return [{'vlan_id': vlan_id, 'description': description,
+             'members': [{'member': 'Eth1/%d' % (vlan_id % 64)}]}
+            for vlan_id in range(1, size + 1)]
+
+
+def benchmark(size):
+    e_list = get_vlans(size, 'existing')
+    n_list = list(reversed(get_vlans(size, 'new')))
+
+    start = time.time()
+    scan_list = get_replaced_list_items_by_scan(n_list, e_list, TEST_KEYS, T_KEY_SET)[0]
+    scan_time = time.time() - start
+
+    start = time.time()
+    index_list = get_replaced_list_items_by_index(n_list, e_list, TEST_KEYS, T_KEY_SET)
+    index_time = time.time() - start
+
+    if scan_list != index_list:
+        raise AssertionError('The scan and index results differ for %d items' % size)
+
+    print('%6d items: scan %9.3f s, index %7.3f s, %8.1fx' % (size, scan_time, index_time, scan_time / index_time))
+
+
+if __name__ == '__main__':
+    for list_size in [int(arg) for arg in sys.argv[1:]] or [1000, 10000]:
+        benchmark(list_size)
@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    coalesce_requests,
+)
+
+VLAN_PATH = 'data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST'
+MAP_PATH = 'data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP'
+INTF_PATH = 'data/openconfig-interfaces:interfaces'
+
+
+def patch_request(path, data):
+    return {'path': path, 'method': 'patch', 'data': data}
+
+
+def vlan_request(vlan):
+    return patch_request(VLAN_PATH, {'sonic-vlan:VLAN_LIST': [vlan]})
+
+
+def map_request(vlan_map):
+    return patch_request(MAP_PATH, {'sonic-vxlan:VXLAN_TUNNEL_MAP': {'VXLAN_TUNNEL_MAP_LIST': [vlan_map]}})
+
+
+def intf_request(interface):
+    return patch_request(INTF_PATH, {'openconfig-interfaces:interfaces': {'interface': [interface]}})
+
+
+class TestCoalesceRequests(unittest.TestCase):
+
+    def test_01_flat_entries_merged_by_name(self):
+        requests = [vlan_request({'name': 'Vlan10', 'vlanid': 10}),
+                    vlan_request({'name': 'Vlan20', 'vlanid': 20}),
+                    vlan_request({'name': 'Vlan10', 'mtu': 9100})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(positions, [0, 0, 0])
+        self.assertEqual(coalesced[0]['data'], {'sonic-vlan:VLAN_LIST': [{'name': 'Vlan10', 'vlanid': 10, 'mtu': 9100},
+                                                                         {'name': 'Vlan20', 'vlanid': 20}]})
+
+    def test_02_flat_entries_conflict(self):
+        requests = [vlan_request({'name': 'Vlan10', 'mtu': 9100}),
+                    vlan_request({'name': 'Vlan10', 'mtu': 1500})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+        self.assertEqual(positions, [0, 1])
+
+    def test_03_flat_entries_keyed_by_list_keys(self):
+        requests = [map_request({'name': 'vtep1', 'mapname': 'map_10_Vlan10', 'vlan': 'Vlan10', 'vni': 10}),
+                    map_request({'name': 'vtep1', 'mapname': 'map_20_Vlan20', 'vlan': 'Vlan20', 'vni': 20})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(positions, [0, 0])
+        self.assertEqual(coalesced[0]['data'], {'sonic-vxlan:VXLAN_TUNNEL_MAP': {'VXLAN_TUNNEL_MAP_LIST': [
+            {'name': 'vtep1', 'mapname': 'map_10_Vlan10', 'vlan': 'Vlan10', 'vni': 10},
+            {'name': 'vtep1', 'mapname': 'map_20_Vlan20', 'vlan': 'Vlan20', 'vni': 20}]}})
+
+        requests = [map_request({'name': 'vtep1', 'mapname': 'map_10_Vlan10', 'vlan': 'Vlan10', 'vni': 10}),
+                    map_request({'name': 'vtep1', 'mapname': 'map_10_Vlan10', 'vlan': 'Vlan10', 'vni': 11})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+
+    def test_04_entries_without_key_not_merged(self):
+        requests = [vlan_request({'vlanid': 10}), vlan_request({'vlanid': 20})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+
+        requests = [intf_request({'config': {'mtu': 9100}}), intf_request({'config': {'mtu': 1500}})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+
+    def test_05_openconfig_entries_merged_by_top_level_leaves(self):
+        requests = [intf_request({'name': 'Eth1/1', 'config': {'name': 'Eth1/1', 'mtu': 9100}}),
+                    intf_request({'name': 'Eth1/1', 'config': {'description': 'uplink'}}),
+                    intf_request({'name': 'Eth1/2', 'config': {'name': 'Eth1/2'}})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(positions, [0, 0, 0])
+        self.assertEqual(coalesced[0]['data']['openconfig-interfaces:interfaces']['interface'],
+                         [{'name': 'Eth1/1', 'config': {'name': 'Eth1/1', 'mtu': 9100, 'description': 'uplink'}},
+                          {'name': 'Eth1/2', 'config': {'name': 'Eth1/2'}}])
+
+        requests = [intf_request({'name': 'Eth1/1', 'config': {'mtu': 9100}}),
+                    intf_request({'name': 'Eth1/1', 'config': {'mtu': 1500}})]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+
+    def test_06_labelled_requests_not_merged(self):
+        requests = [dict(vlan_request({'name': 'Vlan10', 'vlanid': 10}), label='vlans 10-10'),
+                    dict(vlan_request({'name': 'Vlan20', 'vlanid': 20}), label='vlans 20-20')]
+        coalesced, positions = coalesce_requests(requests)
+        self.assertEqual(coalesced, requests)
+        self.assertEqual(positions, [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -85,3 +85,9 @@ class TestDiffUtils(unittest.TestCase):
 
     def test_16_complex_list_with_dict_diff(self):
         self.read_and_compare("test_16_complex_list_with_dict_diff.yaml")
+
+    def test_17_list_diff_with_partial_keys(self):
+        self.read_and_compare("test_17_list_diff_with_partial_keys.yaml")
+
+    def test_18_list_diff_with_unchanged_items(self):
+        self.read_and_compare("test_18_list_diff_with_unchanged_items.yaml")